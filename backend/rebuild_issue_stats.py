@@ -0,0 +1,76 @@
+"""
+Issue Rollup Rebuild Script for SprintDesk
+
+Recomputes the per-project issue rollup (project_issue_stats) from the issues table.
+The rollup is updated with every issue write, run this script MANUALLY to repair drift,
+e.g. after issues were changed directly in the database.
+
+This is a STANDALONE script - it does NOT run automatically with main.py
+
+Usage: python rebuild_issue_stats.py [project_id ...]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path so we can import modules
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.database import get_database
+from src.repositories import ProjectIssueStatsRepository
+
+def rebuild_issue_stats(project_ids: list[int] | None = None):
+    """Recompute the rollup of the given projects, or of every project"""
+
+    print("Rebuilding issue rollup for SprintDesk...")
+
+    try:
+        # Get database session
+        db = get_database()
+        session = db.get_session()
+
+        repaired = ProjectIssueStatsRepository(session).rebuild(project_ids)
+
+        session.commit()
+        session.close()
+
+        # Print results
+        print("\nIssue rollup rebuild completed!")
+        print(f"   Repaired: {repaired} projects (missing or drifted)")
+
+    except Exception as e:
+        print(f"Error rebuilding issue rollup: {e}")
+        print("Make sure:")
+        print("  1. Database is running and accessible")
+        print("  2. Environment variables are set correctly")
+        print("  3. Backend dependencies are installed")
+        print("  4. Backend server was started at least once (to initialize DB)")
+        return False
+
+    return True
+
+if __name__ == "__main__":
+    print("SprintDesk Issue Rollup Rebuild")
+    print("=" * 40)
+    print("WARNING: This is a STANDALONE script - run it manually when needed")
+    print()
+
+    # Check if we're in the right directory
+    if not Path("src/main.py").exists():
+        print("Error: Please run this script from the backend directory")
+        print("   Usage: cd backend && python rebuild_issue_stats.py [project_id ...]")
+        sys.exit(1)
+
+    try:
+        project_ids = [int(project_id) for project_id in sys.argv[1:]] or None
+    except ValueError:
+        print("Error: Project IDs must be integers")
+        sys.exit(1)
+
+    # Run the function
+    success = rebuild_issue_stats(project_ids)
+
+    if success:
+        sys.exit(0)
+    else:
+        sys.exit(1)
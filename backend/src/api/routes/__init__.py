@@ -1,13 +1,31 @@
-from fastapi import APIRouter
-from src.api.routes import auth, users, projects, issues, comments, labels
+from fastapi import APIRouter, Depends
+from src.config import settings
+from src.api.routes import auth, users, api_keys, projects, project_flow, issues, comments, labels, dashboard
+from src.api.routes import async_projects, async_issues, async_comments
+from src.security.auth_dependencies import rate_limit
 
 # Create main API router
 api_router = APIRouter(prefix="/api/v1")
 
+# Login, registration and refresh get a tight budget, everything else is limited per reads and writes
+auth_rate_limit = [Depends(rate_limit("auth"))]
+default_rate_limit = [Depends(rate_limit())]
+
 # Include all route modules
-api_router.include_router(auth.router)
-api_router.include_router(users.router)
-api_router.include_router(projects.router)
-api_router.include_router(issues.router)
-api_router.include_router(comments.router)
-api_router.include_router(labels.router)
\ No newline at end of file
+api_router.include_router(auth.router, dependencies=auth_rate_limit)
+api_router.include_router(users.router, dependencies=default_rate_limit)
+api_router.include_router(api_keys.router, dependencies=default_rate_limit)
+
+# Issues, projects and comments can be served from the asyncio database stack instead
+if settings.async_routes_enabled:
+    api_router.include_router(async_projects.router, dependencies=default_rate_limit)
+    api_router.include_router(async_issues.router, dependencies=default_rate_limit)
+    api_router.include_router(async_comments.router, dependencies=default_rate_limit)
+else:
+    api_router.include_router(projects.router, dependencies=default_rate_limit)
+    api_router.include_router(issues.router, dependencies=default_rate_limit)
+    api_router.include_router(comments.router, dependencies=default_rate_limit)
+
+api_router.include_router(labels.router, dependencies=default_rate_limit)
+api_router.include_router(dashboard.router, dependencies=default_rate_limit)
+api_router.include_router(project_flow.router, dependencies=default_rate_limit)
\ No newline at end of file
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.services.api_key_service import ApiKeyService
+from src.dto.api_key import ApiKeyCreate, ApiKeyPublic, ApiKeyCreated
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_api_key_service
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.user_exceptions import UserNotFoundError
+from src.exceptions.api_key_exceptions import ApiKeyNotFoundError
+
+router = APIRouter(prefix="/api-keys", tags=["API Keys"])
+
+@router.post("/", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+def create_api_key(
+    api_key_create: ApiKeyCreate,
+    current_user: Principal = Depends(get_current_principal),
+    api_key_service: ApiKeyService = Depends(get_api_key_service)
+):
+    """Create an API key, the key is only returned here"""
+    try:
+        api_key, plain_key = api_key_service.create_api_key(api_key_create, current_user.id, current_user.role)
+        return ApiKeyCreated.model_validate(api_key, update={"api_key": plain_key})
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+@router.get("/", response_model=list[ApiKeyPublic], status_code=status.HTTP_200_OK)
+def get_api_keys(
+    current_user: Principal = Depends(get_current_principal),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
+    user_id: int | None = Query(None, description="Owner of the keys (Admin only for other users)")
+):
+    """Get API keys of the current user, or of another user for admins"""
+    try:
+        return api_key_service.get_api_keys(user_id or current_user.id, current_user.id, current_user.role)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.delete("/{api_key_id}", status_code=status.HTTP_204_NO_CONTENT)
+def revoke_api_key(
+    api_key_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    api_key_service: ApiKeyService = Depends(get_api_key_service)
+):
+    """Revoke an API key"""
+    try:
+        api_key_service.revoke_api_key(api_key_id, current_user.id, current_user.role)
+    except ApiKeyNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
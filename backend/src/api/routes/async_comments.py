@@ -0,0 +1,120 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import cast
+from src.services.async_comment_service import AsyncCommentService
+from src.dto.comment import CommentCreate, CommentUpdate, CommentPublic
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal_async, get_async_comment_service
+from src.pagination import PageParams, get_page_params, page_items
+from src.exceptions.issue_exceptions import IssueNotFoundError
+from src.exceptions.project_exceptions import ProjectNotFoundError
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.pagination_exceptions import InvalidCursorError
+from src.exceptions.comment_exceptions import CommentNotFoundError
+
+router = APIRouter(prefix="/comments", tags=["Comments"])
+
+@router.post("/", response_model=CommentPublic, status_code=status.HTTP_201_CREATED)
+async def create_comment(
+    comment_create: CommentCreate,
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Create a new comment"""
+    # At runtime this is never None, but type checker complains without this line
+    current_user_id = cast(int, current_user.id)
+
+    try:
+        return await comment_service.create_comment(comment_create, current_user_id, current_user.role)
+    except (IssueNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.get("/{comment_id}", response_model=CommentPublic, status_code=status.HTTP_200_OK)
+async def get_comment_by_id(
+    comment_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Get comment by ID"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await comment_service.get_comment_by_id(comment_id, current_user_id, current_user.role)
+    except (CommentNotFoundError, IssueNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+
+@router.patch("/{comment_id}", response_model=CommentPublic, status_code=status.HTTP_200_OK)
+async def update_comment(
+    comment_id: int,
+    comment_update: CommentUpdate,
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Update comment"""
+    current_user_id = cast(int, current_user.id)
+
+    try:
+        return await comment_service.update_comment(comment_id, comment_update, current_user_id, current_user.role)
+    except (CommentNotFoundError, IssueNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    comment_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Delete comment"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        await comment_service.delete_comment(comment_id, current_user_id, current_user.role)
+    except (CommentNotFoundError, IssueNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.get("/issue/{issue_id}", response_model=list[CommentPublic], status_code=status.HTTP_200_OK)
+async def get_comments_by_issue(
+    issue_id: int,
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Get all comments for an issue"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return page_items(response, await comment_service.get_comments_by_issue(issue_id, current_user_id, current_user.role, page_params))
+    except (IssueNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@router.get("/author/{author_id}", response_model=list[CommentPublic], status_code=status.HTTP_200_OK)
+async def get_comments_by_author(
+    author_id: int,
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal_async),
+    comment_service: AsyncCommentService = Depends(get_async_comment_service)
+):
+    """Get all comments by a specific author"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return page_items(response, await comment_service.get_comments_by_author(author_id, current_user_id, current_user.role, page_params))
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
\ No newline at end of file
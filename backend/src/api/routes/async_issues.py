@@ -0,0 +1,280 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from typing import Annotated, cast
+from src.config import settings
+from src.services.async_issue_service import AsyncIssueService
+from src.dto.issue import IssueCreate, IssueUpdate, IssuePublic, IssueBulkResult, IssueSearchFilters
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal_async, get_async_issue_service, rate_limit
+from src.pagination import PageParams, get_page_params, page_items
+from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
+from src.exceptions.project_exceptions import ProjectNotFoundError
+from src.exceptions.issue_exceptions import IssueAssigneeError, IssueNotFoundError
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.pagination_exceptions import InvalidCursorError
+from src.exceptions.label_exceptions import LabelAlreadyAddedError, LabelNotFoundError
+from src.api.routes.issues import bulk_issue_result
+
+router = APIRouter(prefix="/issues", tags=["Issues"])
+
+@router.post("/", response_model=IssuePublic, status_code=status.HTTP_201_CREATED)
+async def create_issue(
+    issue_create: IssueCreate,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Create a new issue"""
+    # At runtime this is never None, but type checker complains without this line
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await issue_service.create_issue(issue_create, current_user_id, current_user.role)
+    except (UserNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except IssueAssigneeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except InactiveUserAccountError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.post("/bulk", response_model=IssueBulkResult, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit("bulk"))])
+async def create_issues_bulk(
+    issues_create: Annotated[list[IssueCreate], Body(min_length=1, max_length=settings.bulk_issue_max_items)],
+    response: Response,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Create many issues at once, 207 with per-row errors when some rows fail"""
+    current_user_id = cast(int, current_user.id)
+
+    bulk_result = bulk_issue_result(await issue_service.create_issues_bulk(issues_create, current_user_id, current_user.role))
+    if bulk_result.failed:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return bulk_result
+
+@router.get("/", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+async def get_all_issues(
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Get all issues based on user permissions"""
+    current_user_id = cast(int, current_user.id)
+    try:
+        return page_items(response, await issue_service.get_all_issues(current_user_id, current_user.role, page_params))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+# Declared before /{issue_id} so "search" is not parsed as an issue id
+@router.get("/search", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+async def search_issues(
+    filters: Annotated[IssueSearchFilters, Query()],
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Search the issues visible to the current user by filters, text and sort order"""
+    current_user_id = cast(int, current_user.id)
+    try:
+        return page_items(response, await issue_service.search_issues(filters, current_user_id, current_user.role, page_params))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+@router.get("/{issue_id}", response_model=IssuePublic, status_code=status.HTTP_200_OK)
+async def get_issue_by_id(
+    issue_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Get issue by ID"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await issue_service.get_issue_by_id(issue_id, current_user_id, current_user.role)
+    except IssueNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.patch("/{issue_id}", response_model=IssuePublic, status_code=status.HTTP_200_OK)
+async def update_issue(
+    issue_id: int,
+    issue_update: IssueUpdate,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Update issue"""
+    current_user_id = cast(int, current_user.id)
+    try:
+        return await issue_service.update_issue(issue_id, issue_update, current_user_id, current_user.role)
+    except (IssueNotFoundError, ProjectNotFoundError, UserNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InactiveUserAccountError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+    except IssueAssigneeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+@router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_issue(
+    issue_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Delete issue"""
+    current_user_id = cast(int, current_user.id)
+
+    try:
+        await issue_service.delete_issue(issue_id, current_user_id, current_user.role)
+    except IssueNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.get("/project/{project_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+async def get_issues_by_project(
+    project_id: int,
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Get issues by project"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return page_items(response, await issue_service.get_issues_by_project(project_id, current_user_id, current_user.role, page_params))
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+@router.get("/assignee/{assignee_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+async def get_issues_by_assignee(
+    assignee_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Get issues by assignee"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await issue_service.get_issues_by_assignee(assignee_id, current_user_id, current_user.role)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+@router.get("/author/{author_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+async def get_issues_by_author(
+    author_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Get issues by author"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await issue_service.get_issues_by_author(author_id, current_user_id, current_user.role)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+@router.patch("/{issue_id}/assign/{assignee_id}", response_model=IssuePublic, status_code=status.HTTP_200_OK)
+async def assign_issue(
+    issue_id: int,
+    assignee_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Assign or unassign issue"""
+    current_user_id = cast(int, current_user.id)
+    try:
+        # If assignee_id == 0 -> unassign
+        actual_assignee_id = None if assignee_id == 0 else assignee_id
+        
+        return await issue_service.assign_issue(issue_id, actual_assignee_id, current_user_id, current_user.role)
+    except (ProjectNotFoundError, UserNotFoundError, IssueNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except IssueAssigneeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    except InactiveUserAccountError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.patch("/{issue_id}/close", response_model=IssuePublic, status_code=status.HTTP_200_OK)
+async def close_issue(
+    issue_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Close issue"""
+    current_user_id = cast(int, current_user.id)
+
+    try:
+        return await issue_service.close_issue(issue_id, current_user_id, current_user.role)
+    except IssueNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.patch("/{issue_id}/reopen", response_model=IssuePublic, status_code=status.HTTP_200_OK)
+async def reopen_issue(
+    issue_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Reopen issue"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        return await issue_service.reopen_issue(issue_id, current_user_id, current_user.role)
+    except IssueNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.post("/{issue_id}/labels/{label_id}", status_code=status.HTTP_201_CREATED)
+async def add_label_to_issue(
+    issue_id: int,
+    label_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Add label to issue"""
+    current_user_id = cast(int, current_user.id)
+    
+    try:
+        await issue_service.add_label_to_issue(issue_id, label_id, current_user_id, current_user.role)
+        return {"message": "Label added successfully."}
+    except (IssueNotFoundError, LabelNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except LabelAlreadyAddedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+
+@router.delete("/{issue_id}/labels/{label_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_label_from_issue(
+    issue_id: int,
+    label_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    issue_service: AsyncIssueService = Depends(get_async_issue_service)
+):
+    """Remove label from issue"""
+    current_user_id = cast(int, current_user.id)
+
+    try:
+        await issue_service.remove_label_from_issue(issue_id, label_id, current_user_id, current_user.role)
+    except (IssueNotFoundError, LabelNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    
\ No newline at end of file
@@ -1,43 +1,89 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from sqlmodel import Session
 from src.database import get_db_session
-from src.repositories import UserRepository
+from src.repositories import UserRepository, RefreshTokenRepository
 from src.services.auth_service import AuthService
-from src.dto.auth import LoginRequest, TokenResponse
+from src.dto.auth import LoginRequest, RefreshRequest, TokenResponse
 from src.dto.user import UserCreate, UserPublic
 from src.exceptions.user_exceptions import UsernameAlreadyExistsError, EmailAlreadyExistsError, InvalidUsernameError, InactiveUserAccountError, IncorrectPasswordError
-from src.exceptions.auth_exceptions import InvalidTokenError
+from src.exceptions.auth_exceptions import InvalidTokenError, InvalidRefreshTokenError, RefreshTokenReuseError, PasswordHasherBusyError
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     user_create: UserCreate,
     session: Session = Depends(get_db_session)
 ):
     """Register a new user"""
     user_repository = UserRepository(session)
-    auth_service = AuthService(user_repository)
+    refresh_token_repository = RefreshTokenRepository(session)
+    auth_service = AuthService(user_repository, refresh_token_repository)
 
     try:
-        return auth_service.register_user(user_create)
+        return await auth_service.register_user(user_create)
     
     except (UsernameAlreadyExistsError, EmailAlreadyExistsError) as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 @router.post("/login", response_model=TokenResponse, status_code=status.HTTP_200_OK)
-def login(
+async def login(
     login_request: LoginRequest,
     session: Session = Depends(get_db_session)
 ):
-    """Login and get access token"""
+    """Login and get access and refresh tokens"""
     user_repository = UserRepository(session)
-    auth_service = AuthService(user_repository)
+    refresh_token_repository = RefreshTokenRepository(session)
+    auth_service = AuthService(user_repository, refresh_token_repository)
 
     try:
-        return auth_service.authenticate_user(login_request)
+        return await auth_service.authenticate_user(login_request)
     
     except (InvalidUsernameError, IncorrectPasswordError, InactiveUserAccountError) as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
     except InvalidTokenError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+@router.post("/refresh", response_model=TokenResponse, status_code=status.HTTP_200_OK)
+def refresh(
+    refresh_request: RefreshRequest,
+    session: Session = Depends(get_db_session)
+):
+    """Exchange a refresh token for new access and refresh tokens"""
+    user_repository = UserRepository(session)
+    refresh_token_repository = RefreshTokenRepository(session)
+    auth_service = AuthService(user_repository, refresh_token_repository)
+
+    try:
+        return auth_service.refresh_tokens(refresh_request.refresh_token)
+    
+    except RefreshTokenReuseError as e:
+        # Keep the revocation of the user's other tokens, the failed request would roll it back
+        session.commit()
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+    except InvalidRefreshTokenError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    refresh_request: RefreshRequest,
+    session: Session = Depends(get_db_session)
+):
+    """Revoke a refresh token"""
+    user_repository = UserRepository(session)
+    refresh_token_repository = RefreshTokenRepository(session)
+    auth_service = AuthService(user_repository, refresh_token_repository)
+
+    auth_service.revoke_refresh_token(refresh_request.refresh_token)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import cast
 from src.services.comment_service import CommentService
 from src.dto.comment import CommentCreate, CommentUpdate, CommentPublic
-from src.models.user import User
-from src.security.auth_dependencies import get_current_active_user, get_comment_service
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_comment_service
+from src.pagination import PageParams, get_page_params, page_items
 from src.exceptions.issue_exceptions import IssueNotFoundError
 from src.exceptions.project_exceptions import ProjectNotFoundError
 from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.pagination_exceptions import InvalidCursorError
 from src.exceptions.comment_exceptions import CommentNotFoundError
 
 router = APIRouter(prefix="/comments", tags=["Comments"])
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
 @router.post("/", response_model=CommentPublic, status_code=status.HTTP_201_CREATED)
 def create_comment(
     comment_create: CommentCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Create a new comment"""
@@ -31,7 +33,7 @@ def create_comment(
 @router.get("/{comment_id}", response_model=CommentPublic, status_code=status.HTTP_200_OK)
 def get_comment_by_id(
     comment_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Get comment by ID"""
@@ -49,7 +51,7 @@ def get_comment_by_id(
 def update_comment(
     comment_id: int,
     comment_update: CommentUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Update comment"""
@@ -65,7 +67,7 @@ def update_comment(
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Delete comment"""
@@ -81,30 +83,38 @@ def delete_comment(
 @router.get("/issue/{issue_id}", response_model=list[CommentPublic], status_code=status.HTTP_200_OK)
 def get_comments_by_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Get all comments for an issue"""
     current_user_id = cast(int, current_user.id)
     
     try:
-        return comment_service.get_comments_by_issue(issue_id, current_user_id, current_user.role)
+        return page_items(response, comment_service.get_comments_by_issue(issue_id, current_user_id, current_user.role, page_params))
     except (IssueNotFoundError, ProjectNotFoundError) as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except NotAuthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 
 @router.get("/author/{author_id}", response_model=list[CommentPublic], status_code=status.HTTP_200_OK)
 def get_comments_by_author(
     author_id: int,
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     comment_service: CommentService = Depends(get_comment_service)
 ):
     """Get all comments by a specific author"""
     current_user_id = cast(int, current_user.id)
     
     try:
-        return comment_service.get_comments_by_author(author_id, current_user_id, current_user.role)
+        return page_items(response, comment_service.get_comments_by_author(author_id, current_user_id, current_user.role, page_params))
     except NotAuthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
\ No newline at end of file
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.services.dashboard_service import DashboardService
+from src.dto.dashboard import AdminDashboard, ManagerDashboard, ContributorDashboard
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_dashboard_service
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.project_exceptions import ProjectNotFoundError
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+@router.get("/me", response_model=ContributorDashboard, status_code=status.HTTP_200_OK)
+def get_my_dashboard(
+    current_user: Principal = Depends(get_current_principal),
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """Get counts of your active assigned issues in the projects you are a member of"""
+    return dashboard_service.get_contributor_dashboard(current_user.id)
+
+@router.get("/admin", response_model=AdminDashboard, status_code=status.HTTP_200_OK)
+def get_admin_dashboard(
+    current_user: Principal = Depends(get_current_principal),
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """Get counts for the admin dashboard charts (Admin only)"""
+    try:
+        return dashboard_service.get_admin_dashboard(current_user.role)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+@router.get("/manager", response_model=ManagerDashboard, status_code=status.HTTP_200_OK)
+def get_manager_dashboard(
+    current_user: Principal = Depends(get_current_principal),
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+    project_id: int | None = Query(None, description="Limit the counts to one of your projects")
+):
+    """Get active issue counts and team workload for the projects you created (Admin and Project Manager)"""
+    try:
+        return dashboard_service.get_manager_dashboard(current_user.id, current_user.role, project_id)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
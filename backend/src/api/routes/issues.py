@@ -1,21 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import cast
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from typing import Annotated, cast
+from src.config import settings
 from src.services.issue_service import IssueService
-from src.dto.issue import IssueCreate, IssueUpdate, IssuePublic
-from src.models.user import User
-from src.security.auth_dependencies import get_current_active_user, get_issue_service
+from src.dto.issue import IssueCreate, IssueUpdate, IssuePublic, IssueSummary, IssueBulkItemResult, IssueBulkResult, IssueSearchFilters
+from src.models import Issue
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_issue_service, rate_limit
+from src.pagination import PageParams, get_page_params, page_items
 from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
 from src.exceptions.project_exceptions import ProjectNotFoundError
 from src.exceptions.issue_exceptions import IssueAssigneeError, IssueNotFoundError
 from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.pagination_exceptions import InvalidCursorError
 from src.exceptions.label_exceptions import LabelAlreadyAddedError, LabelNotFoundError
+from src.exceptions.base_exception import AppException
 
 router = APIRouter(prefix="/issues", tags=["Issues"])
 
 @router.post("/", response_model=IssuePublic, status_code=status.HTTP_201_CREATED)
 def create_issue(
     issue_create: IssueCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Create a new issue"""
@@ -33,19 +38,55 @@ def create_issue(
     except NotAuthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
 
+@router.post("/bulk", response_model=IssueBulkResult, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit("bulk"))])
+def create_issues_bulk(
+    issues_create: Annotated[list[IssueCreate], Body(min_length=1, max_length=settings.bulk_issue_max_items)],
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
+    issue_service: IssueService = Depends(get_issue_service)
+):
+    """Create many issues at once, 207 with per-row errors when some rows fail"""
+    current_user_id = cast(int, current_user.id)
+
+    bulk_result = bulk_issue_result(issue_service.create_issues_bulk(issues_create, current_user_id, current_user.role))
+    if bulk_result.failed:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return bulk_result
+
 @router.get("/", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
 def get_all_issues(
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Get all issues based on user permissions"""
     current_user_id = cast(int, current_user.id)
-    return issue_service.get_all_issues(current_user_id, current_user.role)
+    try:
+        return page_items(response, issue_service.get_all_issues(current_user_id, current_user.role, page_params))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+# Declared before /{issue_id} so "search" is not parsed as an issue id
+@router.get("/search", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
+def search_issues(
+    filters: Annotated[IssueSearchFilters, Query()],
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
+    issue_service: IssueService = Depends(get_issue_service)
+):
+    """Search the issues visible to the current user by filters, text and sort order"""
+    current_user_id = cast(int, current_user.id)
+    try:
+        return page_items(response, issue_service.search_issues(filters, current_user_id, current_user.role, page_params))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 @router.get("/{issue_id}", response_model=IssuePublic, status_code=status.HTTP_200_OK)
 def get_issue_by_id(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Get issue by ID"""
@@ -62,7 +103,7 @@ def get_issue_by_id(
 def update_issue(
     issue_id: int,
     issue_update: IssueUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Update issue"""
@@ -81,7 +122,7 @@ def update_issue(
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Delete issue"""
@@ -97,23 +138,27 @@ def delete_issue(
 @router.get("/project/{project_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
 def get_issues_by_project(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Get issues by project"""
     current_user_id = cast(int, current_user.id)
     
     try:
-        return issue_service.get_issues_by_project(project_id, current_user_id, current_user.role)
+        return page_items(response, issue_service.get_issues_by_project(project_id, current_user_id, current_user.role, page_params))
     except NotAuthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 @router.get("/assignee/{assignee_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
 def get_issues_by_assignee(
     assignee_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Get issues by assignee"""
@@ -129,7 +174,7 @@ def get_issues_by_assignee(
 @router.get("/author/{author_id}", response_model=list[IssuePublic], status_code=status.HTTP_200_OK)
 def get_issues_by_author(
     author_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Get issues by author"""
@@ -146,7 +191,7 @@ def get_issues_by_author(
 def assign_issue(
     issue_id: int,
     assignee_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Assign or unassign issue"""
@@ -168,7 +213,7 @@ def assign_issue(
 @router.patch("/{issue_id}/close", response_model=IssuePublic, status_code=status.HTTP_200_OK)
 def close_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Close issue"""
@@ -184,7 +229,7 @@ def close_issue(
 @router.patch("/{issue_id}/reopen", response_model=IssuePublic, status_code=status.HTTP_200_OK)
 def reopen_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Reopen issue"""
@@ -201,7 +246,7 @@ def reopen_issue(
 def add_label_to_issue(
     issue_id: int,
     label_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Add label to issue"""
@@ -221,7 +266,7 @@ def add_label_to_issue(
 def remove_label_from_issue(
     issue_id: int,
     label_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     issue_service: IssueService = Depends(get_issue_service)
 ):
     """Remove label from issue"""
@@ -233,4 +278,30 @@ def remove_label_from_issue(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except NotAuthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    
\ No newline at end of file
+
+def bulk_issue_result(outcomes: list[Issue | AppException]) -> IssueBulkResult:
+    """Map bulk creation outcomes to per-row results with the status the single-issue endpoint would return"""
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Issue):
+            results.append(IssueBulkItemResult(
+                index=index,
+                status_code=status.HTTP_201_CREATED,
+                issue=IssueSummary.model_validate(outcome)
+            ))
+        else:
+            results.append(IssueBulkItemResult(index=index, status_code=_bulk_error_status(outcome), error=outcome.message))
+
+    created = sum(1 for result in results if result.issue is not None)
+    return IssueBulkResult(created=created, failed=len(results) - created, results=results)
+
+def _bulk_error_status(error: AppException) -> int:
+    if isinstance(error, (UserNotFoundError, ProjectNotFoundError)):
+        return status.HTTP_404_NOT_FOUND
+    if isinstance(error, IssueAssigneeError):
+        return status.HTTP_400_BAD_REQUEST
+    if isinstance(error, InactiveUserAccountError):
+        return status.HTTP_401_UNAUTHORIZED
+    if isinstance(error, NotAuthorizedError):
+        return status.HTTP_403_FORBIDDEN
+    return status.HTTP_400_BAD_REQUEST
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from src.services.label_service import LabelService
 from src.dto.label import LabelCreate, LabelUpdate, LabelPublic
-from src.models.user import User
-from src.security.auth_dependencies import get_current_active_user, get_label_service
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_label_service
 from src.exceptions.auth_exceptions import NotAuthorizedError
 from src.exceptions.label_exceptions import LabelNotFoundError, LabelAlreadyExistsError
 
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/labels", tags=["Labels"])
 @router.post("/", response_model=LabelPublic, status_code=status.HTTP_201_CREATED)
 def create_label(
     label_create: LabelCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service)
 ):
     """Create a new label"""
@@ -22,7 +22,7 @@ def create_label(
 
 @router.get("/", response_model=list[LabelPublic], status_code=status.HTTP_200_OK)
 def get_labels(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service),
     active: bool | None = Query(None, description="Filter by active status"),
     name: str | None = Query(None, description="Search by name")
@@ -41,7 +41,7 @@ def get_labels(
 @router.get("/{label_id}", response_model=LabelPublic, status_code=status.HTTP_200_OK)
 def get_label_by_id(
     label_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service)
 ):
     """Get label by ID"""
@@ -53,7 +53,7 @@ def get_label_by_id(
 @router.get("/issue/{issue_id}", response_model=list[LabelPublic], status_code=status.HTTP_200_OK)
 def get_labels_by_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service)
 ):
     """Get all labels for a specific issue"""
@@ -63,7 +63,7 @@ def get_labels_by_issue(
 def update_label(
     label_id: int,
     label_update: LabelUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service)
 ):
     """Update label"""
@@ -77,7 +77,7 @@ def update_label(
 @router.delete("/{label_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_label(
     label_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     label_service: LabelService = Depends(get_label_service)
 ):
     """Delete label"""
@@ -0,0 +1,42 @@
+from datetime import date, datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.services.flow_service import FlowService
+from src.dto.flow import ProjectFlowDay, FlowSnapshotResult
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_flow_service
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.project_exceptions import ProjectNotFoundError, InvalidFlowRangeError, FlowSnapshotsInProgressError
+
+# Served by the sync stack whichever stack serves the other project routes
+router = APIRouter(prefix="/projects", tags=["Projects"])
+
+@router.post("/flow/snapshots", response_model=FlowSnapshotResult, status_code=status.HTTP_200_OK)
+def take_flow_snapshots(
+    current_user: Principal = Depends(get_current_principal),
+    flow_service: FlowService = Depends(get_flow_service)
+):
+    """Snapshot the next batch of days up to yesterday that have no snapshot yet, without waiting for the nightly run (Admin only)"""
+    try:
+        return flow_service.take_snapshots(datetime.now(timezone.utc).date(), current_user.role)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except FlowSnapshotsInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+
+@router.get("/{project_id}/flow", response_model=list[ProjectFlowDay], status_code=status.HTTP_200_OK)
+def get_project_flow(
+    project_id: int,
+    from_day: date | None = Query(None, alias="from", description="First day, defaults to 30 days before 'to'"),
+    to_day: date | None = Query(None, alias="to", description="Last day, defaults to yesterday (UTC)"),
+    current_user: Principal = Depends(get_current_principal),
+    flow_service: FlowService = Depends(get_flow_service)
+):
+    """Get a project's daily issue counts per status plus created and resolved issues, for flow and throughput charts"""
+    try:
+        return flow_service.get_project_flow(project_id, from_day, to_day, datetime.now(timezone.utc).date())
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except NotAuthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidFlowRangeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import cast
 from src.services.project_service import ProjectService
 from src.dto.project import ProjectCreate, ProjectUpdate, ProjectPublic
 from src.dto.user import UserPublic
-from src.models.user import User
-from src.security.auth_dependencies import get_current_active_user, get_project_service
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_principal, get_project_service
+from src.pagination import PageParams, get_page_params, page_items
 from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.pagination_exceptions import InvalidCursorError
 from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
 from src.exceptions.project_exceptions import ProjectNotFoundError, AlreadyProjectMemberError, ProjectCreatorRemoveError, NotProjectMemberError, InvalidProjectStatusError
 
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 @router.post("/", response_model=ProjectPublic, status_code=status.HTTP_201_CREATED)
 def create_project(
     project_create: ProjectCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Create a new project"""
@@ -28,18 +30,23 @@ def create_project(
 
 @router.get("/", response_model=list[ProjectPublic], status_code=status.HTTP_200_OK)
 def get_all_projects(
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Get all projects based on user role"""
     user_id = cast(int, current_user.id)
     
-    return project_service.get_all_projects(user_id, current_user.role)
+    try:
+        return page_items(response, project_service.get_all_projects(user_id, current_user.role, page_params))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 @router.get("/{project_id}", response_model=ProjectPublic, status_code=status.HTTP_200_OK)
 def get_project_by_id(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Get project by ID"""
@@ -56,7 +63,7 @@ def get_project_by_id(
 def update_project(
     project_id: int,
     project_update: ProjectUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Update project"""
@@ -72,7 +79,7 @@ def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Delete project"""
@@ -89,7 +96,7 @@ def delete_project(
 def add_project_member(
     project_id: int,
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service),
 ):
     """Add member to project"""
@@ -110,7 +117,7 @@ def add_project_member(
 def remove_project_member(
     project_id: int,
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Remove member from project"""
@@ -128,7 +135,7 @@ def remove_project_member(
 @router.get("/{project_id}/members", response_model=list[UserPublic], status_code=status.HTTP_200_OK)
 def get_project_members(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Get project members"""
@@ -144,7 +151,7 @@ def get_project_members(
 @router.get("/status/{status_name}", response_model=list[ProjectPublic], status_code=status.HTTP_200_OK)
 def get_projects_by_status(
     status_name: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """Get projects by status"""
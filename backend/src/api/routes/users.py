@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import cast
 from src.services.user_service import UserService
 from src.dto.user import UserCreate, UserUpdate, UserPublic
 from src.models.user import User
-from src.security.auth_dependencies import get_current_active_user, get_user_service
-from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.security.principal_cache import Principal
+from src.security.auth_dependencies import get_current_active_user, get_current_principal, get_user_service
+from src.pagination import PageParams, get_page_params, page_items
+from src.exceptions.auth_exceptions import NotAuthorizedError, PasswordHasherBusyError
+from src.exceptions.pagination_exceptions import InvalidCursorError
 from src.exceptions.user_exceptions import UsernameAlreadyExistsError, EmailAlreadyExistsError, UserNotFoundError
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -12,7 +15,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 @router.post("/", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
 def create_user(
     user_create: UserCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Create a new user (Admin only)"""
@@ -22,6 +25,12 @@ def create_user(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except (UsernameAlreadyExistsError, EmailAlreadyExistsError) as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 @router.get("/me", response_model=UserPublic, status_code=status.HTTP_200_OK)
 def get_current_user_profile(
@@ -35,18 +44,22 @@ def get_current_user_profile(
 
 @router.get("/", response_model=list[UserPublic], status_code=status.HTTP_200_OK)
 def get_all_users(
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    page_params: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get all users (Admin only)"""
     try:
-        return user_service.get_all_users(current_user.role)
+        return page_items(response, user_service.get_all_users(current_user.role, page_params))
     except NotAuthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 @router.get("/active", response_model=list[UserPublic], status_code=status.HTTP_200_OK)
 def get_active_users(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get all active users (Admin only)"""
@@ -58,7 +71,7 @@ def get_active_users(
 @router.get("/{user_id}", response_model=UserPublic, status_code=status.HTTP_200_OK)
 def get_user_by_id(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get user by ID"""
@@ -77,7 +90,7 @@ def get_user_by_id(
 def update_user(
     user_id: int,
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Update user"""
@@ -91,11 +104,17 @@ def update_user(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except (UsernameAlreadyExistsError, EmailAlreadyExistsError) as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Delete user (Admin only)"""
@@ -109,7 +128,7 @@ def delete_user(
 @router.patch("/{user_id}/deactivate", response_model=UserPublic, status_code=status.HTTP_200_OK)
 def deactivate_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Deactivate user (Admin only)"""
@@ -123,7 +142,7 @@ def deactivate_user(
 @router.patch("/{user_id}/activate", response_model=UserPublic, status_code=status.HTTP_200_OK)
 def activate_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Activate user (Admin only)"""
@@ -137,7 +156,7 @@ def activate_user(
 @router.get("/role/{role}", response_model=list[UserPublic], status_code=status.HTTP_200_OK)
 def get_users_by_role(
     role: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     user_service: UserService = Depends(get_user_service)
 ):
     """Get users by role (Admin only)"""
@@ -17,10 +17,65 @@ class Settings(BaseSettings):
     db_port: str = os.getenv("DB_PORT", "5432")
     db_name: str = os.getenv("DB_NAME", "sprintdesk_db")
 
+    # DB connection pool settings
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30")) # seconds to wait for a free connection
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "300")) # seconds before a connection is recycled
+    db_echo: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+
+    # Read replicas (comma separated DSNs), GET requests are routed to them
+    db_replica_urls: str = os.getenv("DB_REPLICA_URLS", "")
+    db_replica_sticky_seconds: int = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "10")) # reads stay on the primary this long after a write
+
+    # SQL instrumentation (Server-Timing headers and slow query log)
+    sql_instrumentation_enabled: bool = os.getenv("SQL_INSTRUMENTATION_ENABLED", "true").lower() == "true"
+    slow_query_threshold_ms: int = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+
+    # Keyset pagination of list endpoints
+    page_size_default: int = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+    page_size_max: int = int(os.getenv("PAGE_SIZE_MAX", "500"))
+
+    # Largest batch accepted by POST /issues/bulk
+    bulk_issue_max_items: int = int(os.getenv("BULK_ISSUE_MAX_ITEMS", "500"))
+
+    # Daily issue flow snapshots, taken each night for every day not snapshotted yet
+    flow_snapshots_enabled: bool = os.getenv("FLOW_SNAPSHOTS_ENABLED", "false").lower() == "true" # an advisory lock keeps workers from overlapping
+    flow_snapshot_batch_days: int = int(os.getenv("FLOW_SNAPSHOT_BATCH_DAYS", "31")) # days per transaction when catching up
+    flow_snapshot_hour: int = int(os.getenv("FLOW_SNAPSHOT_HOUR", "1")) # UTC hour the nightly job runs at
+    flow_max_days: int = int(os.getenv("FLOW_MAX_DAYS", "366")) # longest range one flow request can ask for
+
+    # Serve issue/project/comment routes from the asyncio database stack
+    async_routes_enabled: bool = os.getenv("ASYNC_ROUTES_ENABLED", "false").lower() == "true"
+
     # Security settings
     secret_key: str = os.getenv("SECRET_KEY", "my-super-secret-key-change-this-in-production")
     algorithm: str = "HS256"
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+    # Stateless auth: access tokens carry role and token version, reads trust them without loading the user
+    stateless_auth_enabled: bool = os.getenv("STATELESS_AUTH_ENABLED", "false").lower() == "true"
+    token_version_refresh_seconds: int = int(os.getenv("TOKEN_VERSION_REFRESH_SECONDS", "5")) # how often bumped versions are reloaded
+    api_key_usage_flush_seconds: int = int(os.getenv("API_KEY_USAGE_FLUSH_SECONDS", "60")) # last-used times are written in batches
+    principal_cache_ttl_seconds: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "5")) # 0 disables the cache
+    token_cache_max_entries: int = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000")) # verified JWTs kept in memory, 0 disables the cache
+
+    # Password hashing (bcrypt runs in its own bounded worker pool)
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12")) # hashes with another cost are rehashed on login
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    password_hash_queue_limit: int = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32")) # waiting requests beyond this get 503
+    password_hash_retry_after_seconds: int = int(os.getenv("PASSWORD_HASH_RETRY_AFTER_SECONDS", "2"))
+
+    # Token bucket rate limits per route group, "<requests>/<seconds>"
+    rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    rate_limit_auth: str = os.getenv("RATE_LIMIT_AUTH", "10/60") # per client address and username (or refresh token)
+    rate_limit_auth_per_address: str = os.getenv("RATE_LIMIT_AUTH_PER_ADDRESS", "300/60") # all sign-in attempts of one address
+    rate_limit_reads: str = os.getenv("RATE_LIMIT_READS", "300/60") # per user, or client address when anonymous
+    rate_limit_writes: str = os.getenv("RATE_LIMIT_WRITES", "120/60")
+    rate_limit_bulk: str = os.getenv("RATE_LIMIT_BULK", "5/60")
+    rate_limit_max_buckets: int = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "10000"))
+    # Reverse proxies whose X-Forwarded-For names the client, comma separated addresses
+    trusted_proxies: list[str] = [proxy.strip() for proxy in os.getenv("TRUSTED_PROXIES", "").split(",") if proxy.strip()]
 
     # CORS settings
     allowed_origins: list[str] = [
@@ -34,6 +89,10 @@ class Settings(BaseSettings):
     @property
     def database_url(self) -> str:
         return f"postgresql+psycopg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+
+    @property
+    def replica_database_urls(self) -> list[str]:
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
     
     class Config:
         env_file = ".env"
@@ -1,42 +1,253 @@
+import hashlib
+import random
+import time
+from contextlib import contextmanager, asynccontextmanager
+from threading import Lock
+from typing import AsyncIterator, Iterator
+from fastapi import Request
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.config import settings
+from src.repositories.project_issue_stats_repository import ProjectIssueStatsRepository
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+# Tables whose (created_at, id) index keyset pagination walks
+KEYSET_INDEXED_TABLES = ("issues", "projects", "comments", "users")
+
+class RoutingSession(Session):
+    """Session that sends reads to a replica (when one was assigned) and writes to the primary"""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica_bind")
+        if replica is not None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                # Once this session writes, its later reads must see that write too
+                self.info.pop("replica_bind")
+            else:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+class ReadYourWritesTracker:
+    """Remembers which clients wrote recently so their reads stay on the primary"""
+
+    def __init__(self, sticky_seconds: int, max_entries: int = 10000) -> None:
+        self.sticky_seconds = sticky_seconds
+        self.max_entries = max_entries
+        self._last_writes: dict[str, float] = {}
+        self._lock = Lock()
+
+    def mark_write(self, client_key: str) -> None:
+        """Record a write by this client"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._last_writes) >= self.max_entries:
+                self._prune(now)
+            self._last_writes[client_key] = now
+
+    def recently_wrote(self, client_key: str) -> bool:
+        """Check if this client wrote within the sticky window"""
+        with self._lock:
+            last_write = self._last_writes.get(client_key)
+        return last_write is not None and time.monotonic() - last_write < self.sticky_seconds
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, and the oldest ones if still full"""
+        self._last_writes = {
+            key: written_at for key, written_at in self._last_writes.items()
+            if now - written_at < self.sticky_seconds
+        }
+        while len(self._last_writes) >= self.max_entries:
+            self._last_writes.pop(next(iter(self._last_writes)))
+
+write_tracker = ReadYourWritesTracker(settings.db_replica_sticky_seconds)
+
+def _engine_options() -> dict:
+    """Pool settings shared by every engine"""
+    return {
+        "echo": settings.db_echo,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True # check if db connection is alive before using it
+    }
 
 class DatabaseConfig:
     def __init__(self) -> None:
         self.database_url = settings.database_url
-        self.engine = self._create_engine()
-
-    def _create_engine(self):
-        """Create SQLModel engine"""
-        return create_engine(
-            self.database_url,
-            echo=True,
-            pool_pre_ping=True, # check if db connection is alive before using it
-            pool_recycle=300 # recycle connection every 5 minutes
-        )
-    
+        self.engine = self._create_engine(self.database_url)
+        self.replica_engines = [self._create_engine(url) for url in settings.replica_database_urls]
+
+    def _create_engine(self, database_url: str):
+        """Create SQLModel engine with a connection pool shared by the whole process"""
+        return create_engine(database_url, **_engine_options())
+
     def create_db_and_tables(self):
-        """Create all database tables"""
+        """Create all database tables, plus the keyset pagination indexes on tables that predate them"""
         SQLModel.metadata.create_all(self.engine)
+        # create_all skips existing tables, and with them any index added to their model later
+        with self.engine.begin() as connection:
+            for table_name in KEYSET_INDEXED_TABLES:
+                for index in SQLModel.metadata.tables[table_name].indexes:
+                    if index.name == f"ix_{table_name}_created_at_id":
+                        index.create(connection, checkfirst=True)
+
+    def get_session(self, use_replica: bool = False) -> Session:
+        """Get database session, reading from a replica if allowed and configured"""
+        session = RoutingSession(self.engine)
+        if use_replica and self.replica_engines:
+            session.info["replica_bind"] = random.choice(self.replica_engines)
+        return session
+
+    def dispose(self):
+        """Close all pooled connections"""
+        self.engine.dispose()
+        for replica_engine in self.replica_engines:
+            replica_engine.dispose()
+
+class AsyncDatabaseConfig:
+    def __init__(self) -> None:
+        # postgresql+psycopg resolves to psycopg's async driver under create_async_engine
+        self.database_url = settings.database_url
+        self.engine = self._create_engine(self.database_url)
+        self.replica_engines = [self._create_engine(url) for url in settings.replica_database_urls]
+        # Keep attributes loaded after commit, lazy refreshes are not possible outside a greenlet
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            expire_on_commit=False
+        )
+
+    def _create_engine(self, database_url: str):
+        """Create async engine with the same pool settings as the sync engine"""
+        return create_async_engine(database_url, **_engine_options())
+
+    def get_session(self, use_replica: bool = False) -> AsyncSession:
+        """Get async database session, reading from a replica if allowed and configured"""
+        session = self.session_factory()
+        if use_replica and self.replica_engines:
+            session.sync_session.info["replica_bind"] = random.choice(self.replica_engines).sync_engine
+        return session
+
+    async def dispose(self):
+        """Close all pooled connections"""
+        await self.engine.dispose()
+        for replica_engine in self.replica_engines:
+            await replica_engine.dispose()
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """Commit once when the block succeeds, roll back everything when it raises"""
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+@asynccontextmanager
+async def async_unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Async variant of unit_of_work"""
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+# One DatabaseConfig (and therefore one engine/pool) per process
+_database: DatabaseConfig | None = None
 
-    def get_session(self) -> Session:
-        """Get database session"""
-        return Session(self.engine)
-    
 def get_database() -> DatabaseConfig:
-    return DatabaseConfig()
+    """Get the process-wide database, creating it on first use"""
+    global _database
+    if _database is None:
+        _database = DatabaseConfig()
+    return _database
+
+def _client_key(request: Request) -> str:
+    """Identify the caller for read-your-writes, by bearer token or client address"""
+    identity = request.headers.get("authorization") or (request.client.host if request.client else "")
+    return hashlib.sha256(identity.encode()).hexdigest()
 
-def get_db_session():
-    """FastAPI dependency to get database session"""
+def _can_use_replica(request: Request, client_key: str) -> bool:
+    """Reads go to a replica unless this client wrote within the sticky window"""
+    return request.method in READ_METHODS and not write_tracker.recently_wrote(client_key)
+
+def get_db_session(request: Request):
+    """FastAPI dependency to get database session, repositories flush and the request commits once"""
     db = get_database()
-    with db.get_session() as session:
-        yield session
+    client_key = _client_key(request)
+    is_write = request.method not in READ_METHODS
+
+    if is_write:
+        write_tracker.mark_write(client_key)
+
+    with db.get_session(use_replica=_can_use_replica(request, client_key)) as session:
+        with unit_of_work(session):
+            yield session
+
+    # Sticky window starts again once the write is done
+    if is_write:
+        write_tracker.mark_write(client_key)
+
+_async_database: AsyncDatabaseConfig | None = None
+
+def get_async_database() -> AsyncDatabaseConfig:
+    """Get the process-wide async database, creating it on first use"""
+    global _async_database
+    if _async_database is None:
+        _async_database = AsyncDatabaseConfig()
+    return _async_database
+
+async def get_async_db_session(request: Request):
+    """FastAPI dependency to get async database session, committed once per request"""
+    db = get_async_database()
+    client_key = _client_key(request)
+    is_write = request.method not in READ_METHODS
+
+    if is_write:
+        write_tracker.mark_write(client_key)
+
+    async with db.get_session(use_replica=_can_use_replica(request, client_key)) as session:
+        async with async_unit_of_work(session):
+            yield session
+
+    if is_write:
+        write_tracker.mark_write(client_key)
 
 def init_db():
-    """Initialize database - create tables"""
+    """Initialize database - create engine and tables"""
     db = get_database()
     db.create_db_and_tables()
     print("Database tables created successfully.")
 
+    # Projects from before the issue rollup existed get their row computed once
+    with db.get_session() as session:
+        backfilled = ProjectIssueStatsRepository(session).rebuild(missing_only=True)
+        session.commit()
+    if backfilled:
+        print(f"Issue rollup computed for {backfilled} projects.")
+
+def close_db():
+    """Dispose the process-wide engine on shutdown"""
+    global _database
+    if _database is not None:
+        _database.dispose()
+        _database = None
+        print("Database connections closed.")
+
+async def close_async_db():
+    """Dispose the process-wide async engine on shutdown"""
+    global _async_database
+    if _async_database is not None:
+        await _async_database.dispose()
+        _async_database = None
+        print("Async database connections closed.")
+
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
+    close_db()
@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from src.models.enums import ApiKeyScope
+
+class ApiKeyCreate(SQLModel):
+    """DTO for API key creation"""
+    name: str = Field(min_length=1, max_length=100)
+    scopes: list[ApiKeyScope] = Field(default=[ApiKeyScope.READ], min_length=1)
+    # Admins can issue keys for service accounts, everyone else only for themselves
+    user_id: int | None = None
+
+class ApiKeyPublic(SQLModel):
+    """DTO for API key responses, without the key"""
+    id: int
+    user_id: int
+    name: str
+    key_prefix: str
+    scopes: list[ApiKeyScope]
+    created_at: datetime
+    last_used_at: datetime | None
+    revoked_at: datetime | None
+
+class ApiKeyCreated(ApiKeyPublic):
+    """DTO for a newly created API key, the only response that includes the key"""
+    api_key: str
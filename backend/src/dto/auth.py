@@ -10,9 +10,15 @@ class TokenResponse(SQLModel):
     access_token: str
     token_type: str = "bearer"
     expires_in: int
+    refresh_token: str
+    refresh_expires_in: int
+
+class RefreshRequest(SQLModel):
+    """DTO for refresh and logout requests"""
+    refresh_token: str
 
 class TokenData(SQLModel):
     """DTO for token data"""
-    user_id: int | None = None
-    username: str | None = None
-    role: str | None = None
\ No newline at end of file
+    user_id: int
+    role: str | None = None
+    token_version: int | None = None
\ No newline at end of file
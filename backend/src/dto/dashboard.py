@@ -0,0 +1,53 @@
+from sqlmodel import SQLModel
+from src.models.enums import UserRole, ProjectStatus, IssueStatus, IssuePriority
+
+class ProjectIssueCount(SQLModel):
+    """DTO for the number of open issues in one project"""
+    project_id: int
+    project_name: str
+    open_issues: int
+
+class AdminDashboard(SQLModel):
+    """DTO for the admin dashboard charts and totals"""
+    users_by_role: dict[UserRole, int]
+    projects_by_status: dict[ProjectStatus, int]
+    # Every active project, including those without open issues
+    open_issues_by_project: list[ProjectIssueCount]
+    total_users: int
+    total_projects: int
+    active_projects: int
+    open_issues: int
+
+class ProjectIssueBreakdown(SQLModel):
+    """DTO for the active issues of one project by status and priority"""
+    project_id: int
+    project_name: str
+    issues_by_status: dict[IssueStatus, int]
+    issues_by_priority: dict[IssuePriority, int]
+
+class AssigneeWorkload(SQLModel):
+    """DTO for the active issues assigned to one team member, or to nobody"""
+    assignee_id: int | None
+    username: str | None
+    active_issues: int
+    # Summed estimates in hours, issues without an estimate count as 0
+    time_estimate: int
+
+class ManagerDashboard(SQLModel):
+    """DTO for the project manager dashboard, over the projects the caller created"""
+    projects: list[ProjectIssueBreakdown]
+    issues_by_status: dict[IssueStatus, int]
+    issues_by_priority: dict[IssuePriority, int]
+    # Members of the projects (with 0 when idle), other assignees, then unassigned issues last
+    workload: list[AssigneeWorkload]
+    total_projects: int
+    active_issues: int
+
+class ContributorDashboard(SQLModel):
+    """DTO for the caller's own active assigned issues, in the projects they are a member of"""
+    issues_by_status: dict[IssueStatus, int]
+    issues_by_priority: dict[IssuePriority, int]
+    # Every active project the caller is a member of, including those without assigned issues
+    issues_by_project: list[ProjectIssueCount]
+    total_projects: int
+    active_issues: int
@@ -0,0 +1,20 @@
+from datetime import date
+from sqlmodel import SQLModel
+
+class ProjectFlowDay(SQLModel):
+    """DTO for a project's issue counts at the end of one UTC day"""
+    day: date
+    open_count: int
+    in_progress_count: int
+    review_ready_count: int
+    blocked_count: int
+    closed_count: int
+    # Issues created and closed during the day, the throughput chart
+    created_count: int
+    resolved_count: int
+
+class FlowSnapshotResult(SQLModel):
+    """DTO for one batch of a snapshot run"""
+    snapshots: int
+    # Days still to process after this batch, run again until it is 0
+    remaining_days: int
@@ -1,7 +1,8 @@
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, Field
 from src.models.base import IssueBase
 from src.models import IssueStatus, IssuePriority
 from datetime import datetime
+from enum import Enum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -43,6 +44,41 @@ class IssueSummary(IssueBase):
     id: int
     assignee_id: int | None
 
+class IssueBulkItemResult(SQLModel):
+    """DTO for the outcome of one row of a bulk issue creation"""
+    index: int
+    status_code: int
+    issue: IssueSummary | None = None
+    error: str | None = None
+
+class IssueBulkResult(SQLModel):
+    """DTO for bulk issue creation responses"""
+    created: int
+    failed: int
+    results: list[IssueBulkItemResult]
+
+class IssueSort(str, Enum):
+    """Sort orders for issue search, a leading "-" sorts descending"""
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    UPDATED_AT = "updated_at"
+    UPDATED_AT_DESC = "-updated_at"
+    PRIORITY = "priority"
+    PRIORITY_DESC = "-priority"
+
+class IssueSearchFilters(SQLModel):
+    """DTO for issue search query parameters, every filter given must match"""
+    project_id: list[int] = Field(default_factory=list)
+    status: list[IssueStatus] = Field(default_factory=list)
+    priority: list[IssuePriority] = Field(default_factory=list)
+    assignee_id: list[int] = Field(default_factory=list)
+    unassigned: bool = Field(default=False, description="Also match issues without an assignee")
+    author_id: list[int] = Field(default_factory=list)
+    label_id: list[int] = Field(default_factory=list)
+    q: str | None = Field(default=None, min_length=1, max_length=100, description="Text in the title or description")
+    updated_since: datetime | None = None
+    sort: IssueSort = IssueSort.UPDATED_AT_DESC
+
 
 from src.dto.user import UserSummary
 from src.dto.project import ProjectSummary
@@ -18,6 +18,21 @@ class ProjectUpdate(SQLModel):
     description: str | None = None
     status: ProjectStatus | None = None
 
+class ProjectIssueStatsPublic(SQLModel):
+    """DTO for a project's issue rollup"""
+    open_count: int
+    in_progress_count: int
+    review_ready_count: int
+    blocked_count: int
+    closed_count: int
+    # Priorities count the issues that are not closed
+    low_count: int
+    medium_count: int
+    high_count: int
+    critical_count: int
+    open_estimate_hours: int
+    last_activity_at: datetime | None
+
 class ProjectPublic(ProjectBase):
     """DTO for project responses"""
     id: int
@@ -26,6 +41,8 @@ class ProjectPublic(ProjectBase):
     creator: "UserSummary"
     members: list["UserSummary"] = []
     issues: list["IssueSummary"] = []
+    # Missing until the project's first issue write or a rollup rebuild
+    issue_stats: ProjectIssueStatsPublic | None = None
 
 class ProjectSummary(SQLModel):
     """DTO for minimal project info"""
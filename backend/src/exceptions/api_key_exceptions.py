@@ -0,0 +1,16 @@
+from src.exceptions.base_exception import AppException
+
+class ApiKeyNotFoundError(AppException):
+    """Raised when trying to find an API key that doesn't exist in the database."""
+    def __init__(self, message: str = "API key not found."):
+        super().__init__(message)
+
+class InvalidApiKeyError(AppException):
+    """Raised when an API key is unknown or revoked."""
+    def __init__(self, message: str = "Invalid or revoked API key."):
+        super().__init__(message)
+
+class ApiKeyScopeError(AppException):
+    """Raised when an API key lacks the scope a request needs."""
+    def __init__(self, message: str = "API key does not have the required scope."):
+        super().__init__(message)
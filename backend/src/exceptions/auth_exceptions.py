@@ -10,7 +10,27 @@ class InvalidTokenPayloadError(AppException):
     def __init__(self, message: str = "Invalid token payload."):
         super().__init__(message)
 
+class InvalidRefreshTokenError(AppException):
+    """Raised when a refresh token is unknown, expired or revoked"""
+    def __init__(self, message: str = "Invalid or expired refresh token."):
+        super().__init__(message)
+
+class RefreshTokenReuseError(InvalidRefreshTokenError):
+    """Raised when a rotated refresh token is presented again, which revokes all of the user's refresh tokens"""
+
 class NotAuthorizedError(AppException):
     """Raised when a user tries to perform an action they are not allowed to."""
     def __init__(self, message: str = "Not authorized to perform this action."):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class PasswordHasherBusyError(AppException):
+    """Raised when the password hashing queue is full"""
+    def __init__(self, retry_after: int, message: str = "Too many sign-in requests, please retry shortly."):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class RateLimitExceededError(AppException):
+    """Raised when a client used up its request budget"""
+    def __init__(self, retry_after: int, message: str = "Too many requests, please retry later."):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,6 @@
+from src.exceptions.base_exception import AppException
+
+class InvalidCursorError(AppException):
+    """Raised when a pagination cursor cannot be decoded."""
+    def __init__(self, message: str = "Invalid pagination cursor."):
+        super().__init__(message)
\ No newline at end of file
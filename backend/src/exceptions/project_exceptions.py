@@ -23,4 +23,14 @@ class NotProjectMemberError(AppException):
 class InvalidProjectStatusError(AppException):
     """Raised when trying to filter projects by an invalid status name."""
     def __init__(self, message: str = "Invalid status name."):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class InvalidFlowRangeError(AppException):
+    """Raised when a flow request's day range is reversed or too long."""
+    def __init__(self, message: str = "Invalid day range."):
+        super().__init__(message)
+
+class FlowSnapshotsInProgressError(AppException):
+    """Raised when another worker is already taking flow snapshots."""
+    def __init__(self, message: str = "Flow snapshots are already being taken, try again later."):
+        super().__init__(message)
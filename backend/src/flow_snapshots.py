@@ -0,0 +1,43 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from starlette.concurrency import run_in_threadpool
+from src.config import settings
+from src.database import get_database
+from src.repositories import FlowSnapshotRepository, ProjectRepository
+from src.services.flow_service import FlowService
+from src.exceptions.project_exceptions import FlowSnapshotsInProgressError
+
+logger = logging.getLogger("sprintdesk.flow")
+
+def take_flow_snapshots() -> None:
+    """Snapshot every day up to yesterday that has no snapshot yet on the primary database, one transaction per batch"""
+    snapshots = 0
+    try:
+        while True:
+            with get_database().get_session() as session:
+                flow_service = FlowService(FlowSnapshotRepository(session), ProjectRepository(session))
+                result = flow_service.take_snapshots(datetime.now(timezone.utc).date())
+                session.commit()
+            snapshots += result.snapshots
+            if result.remaining_days == 0:
+                break
+        logger.info(json.dumps({"event": "flow_snapshots", "snapshots": snapshots}))
+    except FlowSnapshotsInProgressError:
+        logger.info(json.dumps({"event": "flow_snapshots_skipped", "snapshots": snapshots, "reason": "another worker holds the lock"}))
+    except Exception:
+        logger.exception("Failed to take flow snapshots")
+
+def seconds_until_next_run(now: datetime) -> float:
+    """Seconds from now until the next FLOW_SNAPSHOT_HOUR (UTC)"""
+    next_run = now.replace(hour=settings.flow_snapshot_hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+async def take_flow_snapshots_nightly() -> None:
+    """Background loop taking flow snapshots once a night, days missed while down are caught up on the next run"""
+    while True:
+        await asyncio.sleep(seconds_until_next_run(datetime.now(timezone.utc)))
+        await run_in_threadpool(take_flow_snapshots)
@@ -0,0 +1,113 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.config import settings
+
+logger = logging.getLogger("sprintdesk.sql")
+
+MAX_SLOWEST_STATEMENTS = 5
+MAX_STATEMENT_LENGTH = 500
+
+@dataclass
+class QueryStats:
+    """SQL statements executed while handling one request"""
+    method: str = ""
+    path: str = ""
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, duration_ms: float, statement: str) -> None:
+        """Record one executed statement"""
+        self.count += 1
+        self.total_ms += duration_ms
+
+        if len(self.slowest) < MAX_SLOWEST_STATEMENTS or duration_ms > self.slowest[-1][0]:
+            self.slowest.append((duration_ms, statement[:MAX_STATEMENT_LENGTH]))
+            self.slowest.sort(key=lambda entry: entry[0], reverse=True)
+            del self.slowest[MAX_SLOWEST_STATEMENTS:]
+
+    def server_timing(self) -> str:
+        """Server-Timing header value"""
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+
+    def slow_statements(self) -> list[tuple[float, str]]:
+        """Statements above the slow query threshold"""
+        return [entry for entry in self.slowest if entry[0] >= settings.slow_query_threshold_ms]
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+
+def get_current_query_stats() -> QueryStats | None:
+    """Stats of the request being handled, if any"""
+    return _current_stats.get()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(duration_ms, statement)
+    elif duration_ms >= settings.slow_query_threshold_ms:
+        # Statements outside a request (startup, scripts) are logged right away
+        _log_slow_queries("", "", 1, duration_ms, [(duration_ms, statement[:MAX_STATEMENT_LENGTH])])
+
+def register_sql_instrumentation() -> None:
+    """Attach timing hooks to every engine (sync, async and replicas)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+def _log_slow_queries(method: str, path: str, query_count: int, db_time_ms: float, slow_statements: list[tuple[float, str]]) -> None:
+    """Write one structured slow query record"""
+    logger.warning(json.dumps({
+        "event": "slow_query",
+        "method": method,
+        "path": path,
+        "query_count": query_count,
+        "db_time_ms": round(db_time_ms, 2),
+        "statements": [
+            {"duration_ms": round(duration_ms, 2), "statement": statement}
+            for duration_ms, statement in slow_statements
+        ]
+    }))
+
+class SQLInstrumentationMiddleware:
+    """Collects per-request SQL stats and exposes them as response headers"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(method=scope["method"], path=scope["path"])
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+                headers.append("X-DB-Query-Count", str(stats.count))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            slow_statements = stats.slow_statements()
+            if slow_statements:
+                _log_slow_queries(stats.method, stats.path, stats.count, stats.total_ms, slow_statements)
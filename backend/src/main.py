@@ -1,10 +1,18 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.config import settings
-from src.database import init_db
+from src.database import init_db, close_db, get_async_database, close_async_db
+from src.instrumentation import register_sql_instrumentation, SQLInstrumentationMiddleware
+from src.security.password_hasher import password_hasher
+from src.security.token_cache import token_cache
+from src.security.api_key_usage import flush_api_key_usage, flush_api_key_usage_periodically
+from src.flow_snapshots import take_flow_snapshots_nightly
+from src.pagination import NEXT_CURSOR_HEADER
 from src.models import *
 from src.api.routes import api_router
+from src.security.auth_dependencies import get_current_admin
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -14,9 +22,23 @@ async def lifespan(app: FastAPI):
     init_db()
     print("Database Initialized.")
 
+    if settings.async_routes_enabled:
+        get_async_database()
+        print("Async database Initialized.")
+
+    api_key_usage_task = asyncio.create_task(flush_api_key_usage_periodically())
+    flow_snapshot_task = asyncio.create_task(take_flow_snapshots_nightly()) if settings.flow_snapshots_enabled else None
+
     yield
 
     print("Shutting down SprintDesk..")
+    api_key_usage_task.cancel()
+    if flow_snapshot_task:
+        flow_snapshot_task.cancel()
+    flush_api_key_usage()
+    close_db()
+    await close_async_db()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title=settings.app_name,
@@ -32,9 +54,15 @@ app.add_middleware(
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-DB-Query-Count", NEXT_CURSOR_HEADER]
 )
 
+# Per-request query count, DB time and slow query log
+if settings.sql_instrumentation_enabled:
+    register_sql_instrumentation()
+    app.add_middleware(SQLInstrumentationMiddleware)
+
 # Include API routes
 app.include_router(api_router)
 
@@ -47,6 +75,16 @@ async def root():
         "docs": "/docs"
     }
 
+@app.get("/metrics/password-hashing", dependencies=[Depends(get_current_admin)])
+async def password_hashing_metrics():
+    """Queue depth and latency of the password hashing pool (Admin only)"""
+    return password_hasher.metrics.snapshot()
+
+@app.get("/metrics/token-cache", dependencies=[Depends(get_current_admin)])
+async def token_cache_metrics():
+    """Hits and misses of the verified token cache (Admin only)"""
+    return token_cache.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
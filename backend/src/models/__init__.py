@@ -4,7 +4,12 @@ from .issue import Issue
 from .comment import Comment
 from .label import Label
 from .intermediate_tables import ProjectMembership, IssueLabel
-from .enums import UserRole, ProjectStatus, IssueStatus, IssuePriority
+from .refresh_token import RefreshToken
+from .token_revocation import TokenRevocation
+from .api_key import ApiKey
+from .project_issue_stats import ProjectIssueStats
+from .project_flow_snapshot import ProjectFlowSnapshot
+from .enums import UserRole, ApiKeyScope, ProjectStatus, IssueStatus, IssuePriority
 
 __all__ = [
     "User",
@@ -14,7 +19,13 @@ __all__ = [
     "Label",
     "ProjectMembership",
     "IssueLabel",
+    "RefreshToken",
+    "TokenRevocation",
+    "ApiKey",
+    "ProjectIssueStats",
+    "ProjectFlowSnapshot",
     "UserRole",
+    "ApiKeyScope",
     "ProjectStatus",
     "IssueStatus",
     "IssuePriority"
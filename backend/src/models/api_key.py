@@ -0,0 +1,25 @@
+from sqlalchemy import Column, JSON
+from sqlmodel import SQLModel, Field, Relationship
+from datetime import datetime, timezone
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models import User
+
+class ApiKey(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "api_keys"
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
+    name: str = Field(max_length=100)
+    # Start of the key, enough to tell keys apart in listings
+    key_prefix: str = Field(max_length=12)
+    # HMAC-SHA256 of the key, the key itself is never stored
+    key_hash: str = Field(unique=True, index=True, max_length=64)
+    scopes: list[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Written in batches, can lag behind actual use by API_KEY_USAGE_FLUSH_SECONDS
+    last_used_at: datetime | None = Field(default=None)
+    revoked_at: datetime | None = Field(default=None)
+    # Relationships
+    user: "User" = Relationship(back_populates="api_keys")
@@ -1,4 +1,4 @@
-from sqlmodel import Field, Relationship
+from sqlmodel import Field, Relationship, Index
 from src.models.base import CommentBase
 from datetime import datetime, timezone
 from typing import ClassVar, TYPE_CHECKING
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 class Comment(CommentBase, table=True):
     __tablename__:ClassVar[str] = "comments"
+    # Keyset pagination walks (created_at, id)
+    __table_args__: ClassVar[tuple] = (Index("ix_comments_created_at_id", "created_at", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     issue_id: int = Field(foreign_key="issues.id", index=True, ondelete="CASCADE")
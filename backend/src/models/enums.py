@@ -5,6 +5,10 @@ class UserRole(str, Enum):
     PROJECT_MANAGER = "Project Manager"
     CONTRIBUTOR = "Contributor"
 
+class ApiKeyScope(str, Enum):
+    READ = "read"
+    WRITE = "write"
+
 class ProjectStatus(str, Enum):
     ACTIVE = "Active"
     COMPLETED = "Completed"
@@ -1,4 +1,4 @@
-from sqlmodel import Relationship, Field
+from sqlmodel import Relationship, Field, Index
 from src.models.base import IssueBase
 from datetime import datetime, timezone
 from typing import ClassVar, TYPE_CHECKING, Optional
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 class Issue(IssueBase, table=True):
     __tablename__: ClassVar[str] = "issues"
+    # Keyset pagination walks (created_at, id)
+    __table_args__: ClassVar[tuple] = (Index("ix_issues_created_at_id", "created_at", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", nullable=False, index=True, ondelete="CASCADE")
@@ -1,14 +1,16 @@
-from sqlmodel import Relationship, Field
+from sqlmodel import Relationship, Field, Index
 from datetime import datetime, timezone
 from src.models.base import ProjectBase
 from src.models.intermediate_tables import ProjectMembership
-from typing import ClassVar, TYPE_CHECKING
+from typing import ClassVar, TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from src.models import User, Issue
+    from src.models import User, Issue, ProjectIssueStats, ProjectFlowSnapshot
 
 class Project(ProjectBase, table=True):
     __tablename__: ClassVar[str] = "projects"
+    # Keyset pagination walks (created_at, id)
+    __table_args__: ClassVar[tuple] = (Index("ix_projects_created_at_id", "created_at", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     created_by: int | None = Field(foreign_key="users.id", index=True, ondelete="SET NULL")
@@ -17,4 +19,6 @@ class Project(ProjectBase, table=True):
     creator: "User" = Relationship(back_populates="created_projects")
     issues: list["Issue"] = Relationship(back_populates="project", cascade_delete=True)
     memberships: list["ProjectMembership"] = Relationship(back_populates="project", cascade_delete=True)
-    members: list["User"] = Relationship(back_populates="projects", link_model=ProjectMembership)
\ No newline at end of file
+    members: list["User"] = Relationship(back_populates="projects", link_model=ProjectMembership)
+    issue_stats: Optional["ProjectIssueStats"] = Relationship(back_populates="project", cascade_delete=True)
+    flow_snapshots: list["ProjectFlowSnapshot"] = Relationship(back_populates="project", cascade_delete=True)
\ No newline at end of file
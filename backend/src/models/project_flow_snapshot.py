@@ -0,0 +1,24 @@
+from sqlmodel import SQLModel, Field, Relationship
+from datetime import date
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models import Project
+
+class ProjectFlowSnapshot(SQLModel, table=True):
+    """Issue counts of one project at the end of one UTC day, for cumulative flow and throughput charts"""
+    __tablename__: ClassVar[str] = "project_flow_snapshots"
+
+    project_id: int | None = Field(default=None, foreign_key="projects.id", primary_key=True, ondelete="CASCADE")
+    day: date = Field(primary_key=True)
+    # Issues in each status at the end of the day, the STATUS_COUNT_COLUMNS names of the issue rollup
+    open_count: int = Field(default=0)
+    in_progress_count: int = Field(default=0)
+    review_ready_count: int = Field(default=0)
+    blocked_count: int = Field(default=0)
+    closed_count: int = Field(default=0)
+    # Arrivals and departures during the day
+    created_count: int = Field(default=0)
+    resolved_count: int = Field(default=0)
+    # Relationships
+    project: "Project" = Relationship(back_populates="flow_snapshots")
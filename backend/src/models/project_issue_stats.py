@@ -0,0 +1,44 @@
+from sqlmodel import SQLModel, Field, Relationship
+from datetime import datetime
+from typing import ClassVar, TYPE_CHECKING
+from src.models.enums import IssueStatus, IssuePriority
+
+if TYPE_CHECKING:
+    from src.models import Project
+
+# Rollup column counting the issues in each status
+STATUS_COUNT_COLUMNS = {
+    IssueStatus.OPEN: "open_count",
+    IssueStatus.IN_PROGRESS: "in_progress_count",
+    IssueStatus.READY_FOR_REVIEW: "review_ready_count",
+    IssueStatus.BLOCKED: "blocked_count",
+    IssueStatus.CLOSED: "closed_count"
+}
+
+# Rollup column counting the issues that are not closed in each priority
+PRIORITY_COUNT_COLUMNS = {
+    IssuePriority.LOW: "low_count",
+    IssuePriority.MEDIUM: "medium_count",
+    IssuePriority.HIGH: "high_count",
+    IssuePriority.CRITICAL: "critical_count"
+}
+
+class ProjectIssueStats(SQLModel, table=True):
+    """Issue counts of one project, kept up to date by the issue repositories on every write"""
+    __tablename__: ClassVar[str] = "project_issue_stats"
+
+    project_id: int | None = Field(default=None, foreign_key="projects.id", primary_key=True, ondelete="CASCADE")
+    open_count: int = Field(default=0)
+    in_progress_count: int = Field(default=0)
+    review_ready_count: int = Field(default=0)
+    blocked_count: int = Field(default=0)
+    closed_count: int = Field(default=0)
+    low_count: int = Field(default=0)
+    medium_count: int = Field(default=0)
+    high_count: int = Field(default=0)
+    critical_count: int = Field(default=0)
+    # Summed time estimates of the issues that are not closed, in hours
+    open_estimate_hours: int = Field(default=0)
+    last_activity_at: datetime | None = Field(default=None)
+    # Relationships
+    project: "Project" = Relationship(back_populates="issue_stats")
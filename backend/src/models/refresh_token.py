@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel, Field, Relationship
+from datetime import datetime, timezone
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models import User
+
+class RefreshToken(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "refresh_tokens"
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
+    # HMAC-SHA256 of the token, the token itself is never stored
+    token_hash: str = Field(unique=True, index=True, max_length=64)
+    expires_at: datetime
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    revoked_at: datetime | None = Field(default=None)
+    # Relationships
+    user: "User" = Relationship(back_populates="refresh_tokens")
@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime, timezone
+from typing import ClassVar
+
+def _utc_now_naive() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class TokenRevocation(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "token_revocations"
+
+    id: int | None = Field(default=None, primary_key=True)
+    # No foreign key, the row must outlive a deleted user
+    user_id: int = Field(index=True)
+    # Tokens carrying an older version are stale, None means every token of the user is (the user was deleted)
+    token_version: int | None = Field(default=None)
+    # Naive UTC, workers load the rows newer than the last one they saw
+    revoked_at: datetime = Field(default_factory=_utc_now_naive, index=True)
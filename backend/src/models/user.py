@@ -1,18 +1,22 @@
-from sqlmodel import Field, Relationship
+from sqlmodel import Field, Relationship, Index
 from src.models.base import UserBase
 from datetime import datetime, timezone
 from typing import ClassVar, TYPE_CHECKING
 from src.models.intermediate_tables import ProjectMembership
 
 if TYPE_CHECKING:
-    from src.models import Project, Issue, Comment
+    from src.models import Project, Issue, Comment, RefreshToken, ApiKey
 class User(UserBase, table=True):
     __tablename__: ClassVar[str] = "users"
+    # Keyset pagination walks (created_at, id)
+    __table_args__: ClassVar[tuple] = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     password_hash: str = Field(max_length=255)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = Field(default=True)
+    # Bumped on deactivation and role changes, stateless tokens minted before that are rejected
+    token_version: int = Field(default=0)
     # Relationships
     created_projects: list["Project"] = Relationship(back_populates="creator")
     authored_issues: list["Issue"] = Relationship(
@@ -30,4 +34,6 @@ class User(UserBase, table=True):
     comments: list["Comment"] = Relationship(back_populates="author")
     project_memberships: list["ProjectMembership"] = Relationship(back_populates="user", cascade_delete=True)
     projects: list["Project"] = Relationship(back_populates="members", link_model=ProjectMembership)
+    refresh_tokens: list["RefreshToken"] = Relationship(back_populates="user", cascade_delete=True)
+    api_keys: list["ApiKey"] = Relationship(back_populates="user", cascade_delete=True)
     
\ No newline at end of file
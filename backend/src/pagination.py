@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Generic, TypeVar
+from fastapi import Query, Response
+from src.config import settings
+from src.exceptions.pagination_exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+# Sort key of a keyset position: a timestamp or an integer rank
+CursorKey = datetime | int
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+@dataclass
+class PageParams:
+    """Page size and the cursor returned with the previous page"""
+    limit: int
+    cursor: str | None = None
+
+@dataclass
+class Page(Generic[T]):
+    """One page of rows ordered by (sort key, id), created_at unless stated otherwise"""
+    items: list[T]
+    next_cursor: str | None = None
+
+def _as_utc_naive(value: datetime) -> datetime:
+    """Timestamps are stored as naive UTC"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def encode_cursor(key: CursorKey, id: int) -> str:
+    """Opaque cursor pointing after the given row"""
+    value = _as_utc_naive(key).isoformat() if isinstance(key, datetime) else key
+    payload = json.dumps([value, id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, key_type: type[CursorKey] = datetime) -> tuple[CursorKey, int]:
+    """Position encoded by encode_cursor, the key must be of the type the caller sorts by"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if key_type is datetime:
+            return datetime.fromisoformat(key), int(id)
+        if not isinstance(key, int) or isinstance(key, bool):
+            raise ValueError("cursor key is not an integer")
+        return key, int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursorError()
+
+def _created_at(row) -> CursorKey:
+    return getattr(row, "created_at")
+
+def build_page(rows: list[T], limit: int, key: Callable[[T], CursorKey] = _created_at) -> Page[T]:
+    """Turn limit + 1 fetched rows into a page, the extra row only signals that more exist"""
+    if len(rows) <= limit:
+        return Page(items=rows)
+
+    items = rows[:limit]
+    last = items[-1]
+    return Page(items=items, next_cursor=encode_cursor(key(last), getattr(last, "id")))
+
+def get_page_params(
+    limit: int = Query(default=settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page")
+) -> PageParams:
+    """FastAPI dependency for keyset pagination query parameters"""
+    return PageParams(limit=limit, cursor=cursor)
+
+def page_items(response: Response, page: Page[T]) -> list[T]:
+    """Expose the next cursor as a header and return the rows as the response body"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -1,13 +1,35 @@
+from .api_key_repository import ApiKeyRepository
 from .comment_repository import CommentRepository
+from .dashboard_repository import DashboardRepository
+from .flow_snapshot_repository import FlowSnapshotRepository
 from .issue_repository import IssueRepository
 from .label_repository import LabelRepository
 from .project_repository import ProjectRepository
+from .project_issue_stats_repository import ProjectIssueStatsRepository
+from .refresh_token_repository import RefreshTokenRepository
 from .user_repository import UserRepository
+from .async_api_key_repository import AsyncApiKeyRepository
+from .async_comment_repository import AsyncCommentRepository
+from .async_issue_repository import AsyncIssueRepository
+from .async_label_repository import AsyncLabelRepository
+from .async_project_repository import AsyncProjectRepository
+from .async_user_repository import AsyncUserRepository
 
 __all__ = [
+    "ApiKeyRepository",
     "CommentRepository",
+    "DashboardRepository",
+    "FlowSnapshotRepository",
     "IssueRepository",
     "LabelRepository",
     "ProjectRepository",
-    "UserRepository"
+    "ProjectIssueStatsRepository",
+    "RefreshTokenRepository",
+    "UserRepository",
+    "AsyncApiKeyRepository",
+    "AsyncCommentRepository",
+    "AsyncIssueRepository",
+    "AsyncLabelRepository",
+    "AsyncProjectRepository",
+    "AsyncUserRepository"
 ]
\ No newline at end of file
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, select, col
+from src.models import ApiKey
+from .base_repository import BaseRepository
+
+class ApiKeyRepository(BaseRepository[ApiKey]):
+    """Repository for ApiKey operations"""
+
+    def __init__(self, session: Session):
+        super().__init__(ApiKey, session)
+
+    def create(self, api_key: ApiKey) -> ApiKey:
+        """Store a new API key"""
+        return self._flush(api_key)
+
+    def get_by_hash(self, key_hash: str) -> ApiKey | None:
+        """Get an API key and its user by the key's hash in one indexed lookup"""
+        statement = select(ApiKey).options(joinedload(ApiKey.user)).where(ApiKey.key_hash == key_hash)
+        return self.session.exec(statement).first()
+
+    def get_by_user(self, user_id: int) -> list[ApiKey]:
+        """Get all API keys of a user, newest first"""
+        statement = select(ApiKey).where(ApiKey.user_id == user_id).order_by(col(ApiKey.id).desc())
+        return list(self.session.exec(statement).all())
+
+    def revoke(self, api_key: ApiKey) -> ApiKey:
+        """Revoke an API key"""
+        api_key.revoked_at = datetime.now(timezone.utc)
+        return self._flush(api_key)
+
+    def update_last_used(self, last_used: dict[int, datetime]) -> None:
+        """Write last-used times of many keys in one batched statement"""
+        if not last_used:
+            return
+        self.session.execute(
+            update(ApiKey),
+            [{"id": key_id, "last_used_at": used_at} for key_id, used_at in last_used.items()]
+        )
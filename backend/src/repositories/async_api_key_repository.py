@@ -0,0 +1,17 @@
+from sqlalchemy.orm import joinedload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import ApiKey
+from .async_base_repository import AsyncBaseRepository
+
+class AsyncApiKeyRepository(AsyncBaseRepository[ApiKey]):
+    """Async repository for ApiKey lookups"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(ApiKey, session)
+
+    async def get_by_hash(self, key_hash: str) -> ApiKey | None:
+        """Get an API key and its user by the key's hash in one indexed lookup"""
+        statement = select(ApiKey).options(joinedload(ApiKey.user)).where(ApiKey.key_hash == key_hash)
+        result = await self.session.exec(statement)
+        return result.first()
@@ -0,0 +1,92 @@
+from typing import TypeVar, Generic, Type, Any
+from sqlalchemy import tuple_
+from sqlmodel import SQLModel, select, col
+from src.pagination import Page, PageParams, build_page, decode_cursor
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+T = TypeVar("T", bound=SQLModel)
+
+class AsyncBaseRepository(Generic[T]):
+    """Async base repository class with common CRUD operations"""
+
+    def __init__(self, model: Type[T], session: AsyncSession):
+        self.model = model
+        self.session = session
+
+    def _loader_options(self) -> list[Any]:
+        """Relationship loaders applied to every read, lazy loads are not allowed in async sessions"""
+        return []
+
+    def _select(self):
+        """Base select statement with the repository loader options"""
+        return select(self.model).options(*self._loader_options())
+
+    async def get_by_id(self, id: int) -> T | None:
+        """Get record by ID"""
+        statement = self._select().where(getattr(self.model, "id") == id)
+        result = await self.session.exec(statement)
+        return result.first()
+
+    async def get_by_ids(self, ids: list[int]) -> list[T]:
+        """Get records by a list of IDs in one query"""
+        if not ids:
+            return []
+        statement = self._select().where(col(getattr(self.model, "id")).in_(ids))
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def get_all(self) -> list[T]:
+        """Get all records"""
+        result = await self.session.exec(self._select())
+        return list(result.all())
+
+    async def get_page(self, page_params: PageParams, *criteria) -> Page[T]:
+        """Get one keyset page of records matching the criteria"""
+        return await self._paginate(self._select().where(*criteria), page_params)
+
+    async def _paginate(self, statement, page_params: PageParams) -> Page[T]:
+        """Apply keyset pagination on (created_at, id) to a select of this model"""
+        created_at, id = getattr(self.model, "created_at"), getattr(self.model, "id")
+        if page_params.cursor:
+            statement = statement.where(tuple_(created_at, id) > decode_cursor(page_params.cursor))
+
+        # One extra row tells whether another page exists
+        statement = statement.order_by(created_at, id).limit(page_params.limit + 1)
+        result = await self.session.exec(statement)
+        return build_page(list(result.all()), page_params.limit)
+
+    async def delete(self, id: int) -> bool:
+        """Delete a record by ID"""
+        db_obj = await self.session.get(self.model, id)
+        if not db_obj:
+            return False
+
+        await self.session.delete(db_obj)
+        await self.session.flush()
+        return True
+
+    async def get_by_field(self, field_name: str, value) -> T | None:
+        """Get record by any field"""
+        statement = self._select().where(getattr(self.model, field_name) == value)
+        result = await self.session.exec(statement)
+        return result.first()
+
+    async def get_all_by_field(self, field_name: str, value) -> list[T]:
+        """Get all records by field value"""
+        statement = self._select().where(getattr(self.model, field_name) == value)
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def _flush(self, db_obj: T) -> T:
+        """Write a record in the request's unit of work and reload it for serialization"""
+        self.session.add(db_obj)
+        await self.session.flush()
+        return await self._reload(db_obj)
+
+    async def _reload(self, db_obj: T) -> T:
+        """Reload a record with its relationships after a write"""
+        db_obj_id = getattr(db_obj, "id")
+        # Expire first so relationships loaded before the write are not served stale
+        self.session.expire(db_obj)
+        reloaded = await self.get_by_id(db_obj_id)
+        return reloaded if reloaded else db_obj
@@ -0,0 +1,47 @@
+from sqlalchemy.orm import selectinload
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models.comment import Comment
+from src.dto.comment import CommentUpdate
+from src.pagination import Page, PageParams
+from .async_base_repository import AsyncBaseRepository
+from .comment_repository import filter_author_comments
+
+class AsyncCommentRepository(AsyncBaseRepository[Comment]):
+    """Async repository for Comment operations"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Comment, session)
+
+    def _loader_options(self) -> list:
+        """Load everything CommentPublic serializes"""
+        return [selectinload(Comment.author)]
+
+    async def create(self, comment: Comment) -> Comment:
+        """Create a new comment"""
+        return await self._flush(comment)
+
+    async def update(self, comment_id: int, comment_update: CommentUpdate) -> Comment | None:
+        """Update existing comment"""
+        db_comment = await self.get_by_id(comment_id)
+        if not db_comment:
+            return None
+
+        update_data = comment_update.model_dump(exclude_unset=True)
+
+        db_comment.sqlmodel_update(update_data)
+        return await self._flush(db_comment)
+
+    async def get_comments_page_by_issue(self, issue_id: int, page_params: PageParams) -> Page[Comment]:
+        """Get one page of an issue's comments, oldest first"""
+        return await self.get_page(page_params, Comment.issue_id == issue_id)
+
+    async def get_comments_page_by_author(
+        self,
+        author_id: int,
+        page_params: PageParams,
+        visible_to: int | None = None,
+        include_created_projects: bool = False
+    ) -> Page[Comment]:
+        """Get one page of an author's comments, oldest first, optionally limited to the projects another user can view"""
+        statement = filter_author_comments(self._select(), author_id, visible_to, include_created_projects)
+        return await self._paginate(statement, page_params)
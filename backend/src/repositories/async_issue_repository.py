@@ -0,0 +1,163 @@
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timezone
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import Issue, IssueLabel, IssueStatus, Comment
+from src.dto.issue import IssueUpdate, IssueSearchFilters
+from src.pagination import Page, PageParams, build_page
+from .async_base_repository import AsyncBaseRepository
+from .issue_repository import apply_issue_search, issue_visibility
+from .project_issue_stats_repository import AsyncProjectIssueStatsRepository, IssueState, stats_changes
+
+class AsyncIssueRepository(AsyncBaseRepository[Issue]):
+    """Async repository for Issue operations"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Issue, session)
+        self.issue_stats = AsyncProjectIssueStatsRepository(session)
+
+    def _loader_options(self) -> list:
+        """Load everything IssuePublic serializes"""
+        return [
+            selectinload(Issue.author),
+            selectinload(Issue.assignee),
+            selectinload(Issue.project),
+            selectinload(Issue.comments).selectinload(Comment.author)
+        ]
+
+    async def create(self, issue: Issue) -> Issue:
+        """Create a new issue"""
+        db_issue = await self._flush(issue)
+        await self.issue_stats.apply(stats_changes(added=[IssueState.of(db_issue)]))
+        return db_issue
+
+    async def create_many(self, issues: list[Issue]) -> list[Issue]:
+        """Create several issues, flushed as one multi-row INSERT ... RETURNING"""
+        self.session.add_all(issues)
+        await self.session.flush()
+        await self.issue_stats.apply(stats_changes(added=[IssueState.of(issue) for issue in issues]))
+        return issues
+
+    async def update(self, issue_id: int, issue_update: IssueUpdate) -> Issue | None:
+        """Update existing issue"""
+        db_issue = await self.get_by_id(issue_id)
+        if not db_issue:
+            return None
+
+        before = IssueState.of(db_issue)
+        update_data = issue_update.model_dump(exclude_unset=True)
+        update_data["updated_at"] = datetime.now(timezone.utc)
+
+        db_issue.sqlmodel_update(update_data)
+        return await self._flush_with_stats(db_issue, before)
+
+    async def delete(self, id: int) -> bool:
+        """Delete an issue and take it out of its project's rollup"""
+        db_issue = await self.session.get(Issue, id)
+        if not db_issue:
+            return False
+
+        before = IssueState.of(db_issue)
+        await self.session.delete(db_issue)
+        await self.session.flush()
+        await self.issue_stats.apply(stats_changes(removed=[before]))
+        return True
+
+    async def _flush_with_stats(self, db_issue: Issue, before: IssueState) -> Issue:
+        """Write a changed issue and move its project's rollup from the old state to the new one"""
+        db_issue = await self._flush(db_issue)
+        await self.issue_stats.apply(stats_changes(removed=[before], added=[IssueState.of(db_issue)]))
+        return db_issue
+
+    async def get_issues_page_by_project(self, project_id: int, page_params: PageParams) -> Page[Issue]:
+        """Get one page of a project's issues"""
+        return await self.get_page(page_params, Issue.project_id == project_id)
+
+    async def get_issues_page_by_project_ids(self, project_ids: list[int], page_params: PageParams) -> Page[Issue]:
+        """Get one page of issues from multiple projects"""
+        if not project_ids:
+            return Page(items=[])
+        return await self.get_page(page_params, col(Issue.project_id).in_(project_ids))
+
+    async def search_issues(
+        self,
+        filters: IssueSearchFilters,
+        page_params: PageParams,
+        visible_to: int | None = None,
+        include_created_projects: bool = False
+    ) -> Page[Issue]:
+        """Get one page of issues matching every filter, in a single statement"""
+        statement, sort_key = apply_issue_search(self._select(), filters, page_params, visible_to, include_created_projects)
+        result = await self.session.exec(statement)
+        return build_page(list(result.all()), page_params.limit, sort_key)
+
+    async def get_issues_by_author(self, author_id: int, visible_to: int | None = None, include_created_projects: bool = False) -> list[Issue]:
+        """Get issues created by a specific user, optionally limited to the projects another user can view"""
+        statement = self._select().where(Issue.author_id == author_id)
+        if visible_to is not None:
+            statement = statement.where(issue_visibility(visible_to, include_created_projects))
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def get_issues_by_assignee(self, assignee_id: int, visible_to: int | None = None, include_created_projects: bool = False) -> list[Issue]:
+        """Get issues assigned to a specific user, optionally limited to the projects another user can view"""
+        statement = self._select().where(Issue.assignee_id == assignee_id)
+        if visible_to is not None:
+            statement = statement.where(issue_visibility(visible_to, include_created_projects))
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def assign_issue(self, issue_id: int, assignee_id: int | None) -> Issue | None:
+        """Assign or unassign an issue"""
+        issue_update = IssueUpdate(assignee_id=assignee_id)
+        return await self.update(issue_id, issue_update)
+
+    async def close_issue(self, issue_id: int, closed_by_user_id: int) -> Issue | None:
+        """Close an issue"""
+        db_issue = await self.get_by_id(issue_id)
+        if not db_issue:
+            return None
+
+        before = IssueState.of(db_issue)
+        db_issue.status = IssueStatus.CLOSED
+        db_issue.closed_at = datetime.now(timezone.utc)
+        db_issue.closed_by = closed_by_user_id
+        db_issue.updated_at = datetime.now(timezone.utc)
+
+        return await self._flush_with_stats(db_issue, before)
+
+    async def reopen_issue(self, issue_id: int) -> Issue | None:
+        """Reopen a closed issue"""
+        db_issue = await self.get_by_id(issue_id)
+        if not db_issue:
+            return None
+
+        before = IssueState.of(db_issue)
+        db_issue.status = IssueStatus.OPEN
+        db_issue.closed_at = None
+        db_issue.closed_by = None
+        db_issue.updated_at = datetime.now(timezone.utc)
+
+        return await self._flush_with_stats(db_issue, before)
+
+    async def add_label_to_issue(self, issue_id: int, label_id: int) -> IssueLabel:
+        """Add a label to an issue"""
+        issue_label = IssueLabel(issue_id=issue_id, label_id=label_id)
+        self.session.add(issue_label)
+        await self.session.flush()
+        return issue_label
+
+    async def remove_label_from_issue(self, issue_id: int, label_id: int) -> bool:
+        """Remove a label from an issue"""
+        statement = select(IssueLabel).where(
+            IssueLabel.issue_id == issue_id,
+            IssueLabel.label_id == label_id
+        )
+        result = await self.session.exec(statement)
+        issue_label = result.first()
+        if issue_label:
+            await self.session.delete(issue_label)
+            await self.session.flush()
+            return True
+        return False
+
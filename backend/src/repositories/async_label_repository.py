@@ -0,0 +1,21 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import Label, IssueLabel
+from .async_base_repository import AsyncBaseRepository
+
+class AsyncLabelRepository(AsyncBaseRepository[Label]):
+    """Async repository for Label lookups"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Label, session)
+
+    async def get_labels_by_issue(self, issue_id: int) -> list[Label]:
+        """Get all active labels for a specific issue"""
+        statement = (
+            self._select()
+            .join(IssueLabel)
+            .where(IssueLabel.issue_id == issue_id)
+            .where(Label.is_active == True)
+            .order_by(Label.name)
+        )
+        result = await self.session.exec(statement)
+        return list(result.all())
@@ -0,0 +1,149 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import selectinload
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import Project, ProjectMembership, User, ProjectStatus, ProjectIssueStats
+from src.dto.project import ProjectUpdate
+from src.pagination import Page, PageParams
+from .async_base_repository import AsyncBaseRepository
+
+class AsyncProjectRepository(AsyncBaseRepository[Project]):
+    """Async repository for Project operations"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Project, session)
+
+    def _loader_options(self) -> list:
+        """Load everything ProjectPublic serializes"""
+        return [
+            selectinload(Project.creator),
+            selectinload(Project.members),
+            selectinload(Project.issues),
+            selectinload(Project.issue_stats)
+        ]
+
+    async def create(self, project: Project) -> Project:
+        """Create a new project together with its empty issue rollup row"""
+        project.issue_stats = ProjectIssueStats()
+        return await self._flush(project)
+
+    async def update(self, project_id: int, project_update: ProjectUpdate) -> Project | None:
+        """Update existing project"""
+        db_project = await self.get_by_id(project_id)
+        if not db_project:
+            return None
+
+        update_data = project_update.model_dump(exclude_unset=True)
+
+        db_project.sqlmodel_update(update_data)
+        return await self._flush(db_project)
+
+    async def get_projects_by_creator(self, creator_id: int) -> list[Project]:
+        """Get projects created by a specific user"""
+        return await self.get_all_by_field("created_by", creator_id)
+
+    async def get_projects_by_status(self, status: ProjectStatus, creator_id: int | None = None, member_id: int | None = None) -> list[Project]:
+        """Get projects by status, optionally only those created by or shared with a user"""
+        statement = self._select().where(Project.status == status)
+        if creator_id is not None:
+            statement = statement.where(Project.created_by == creator_id)
+        if member_id is not None:
+            statement = statement.join(ProjectMembership).where(ProjectMembership.user_id == member_id)
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def get_user_projects(self, user_id: int) -> list[Project]:
+        """Get projects where user is a member"""
+        statement = (
+            self._select()
+            .join(ProjectMembership)
+            .where(ProjectMembership.user_id == user_id)
+        )
+        result = await self.session.exec(statement)
+        return list(result.all())
+
+    async def get_projects_page_by_creator(self, creator_id: int, page_params: PageParams) -> Page[Project]:
+        """Get one page of projects created by a specific user"""
+        return await self.get_page(page_params, Project.created_by == creator_id)
+
+    async def get_user_projects_page(self, user_id: int, page_params: PageParams) -> Page[Project]:
+        """Get one page of projects where user is a member"""
+        statement = (
+            self._select()
+            .join(ProjectMembership)
+            .where(ProjectMembership.user_id == user_id)
+        )
+        return await self._paginate(statement, page_params)
+
+    async def add_member(self, project_id: int, user_id: int) -> None:
+        """Add a member to a project"""
+        membership = ProjectMembership(project_id=project_id, user_id=user_id)
+        self.session.add(membership)
+        await self.session.flush()
+
+    async def remove_member(self, project_id: int, user_id: int) -> None:
+        """Remove a member from a project"""
+        statement = select(ProjectMembership).where(
+            ProjectMembership.project_id == project_id,
+            ProjectMembership.user_id == user_id
+        )
+        result = await self.session.exec(statement)
+        membership = result.first()
+        if membership:
+            await self.session.delete(membership)
+            await self.session.flush()
+
+    async def is_member(self, project_id: int | None, user_id: int) -> bool:
+        """Check if user is a member of the project"""
+        if project_id is None:
+            return False
+
+        statement = select(ProjectMembership).where(
+            ProjectMembership.project_id == project_id,
+            ProjectMembership.user_id == user_id
+        )
+        result = await self.session.exec(statement)
+        return result.first() is not None
+
+    async def get_memberships(self, project_ids: list[int], user_ids: list[int]) -> set[tuple[int, int]]:
+        """Get (project_id, user_id) pairs for every membership between the given projects and users"""
+        if not project_ids or not user_ids:
+            return set()
+
+        statement = select(ProjectMembership.project_id, ProjectMembership.user_id).where(
+            col(ProjectMembership.project_id).in_(project_ids),
+            col(ProjectMembership.user_id).in_(user_ids)
+        )
+        result = await self.session.exec(statement)
+        return {(project_id, user_id) for project_id, user_id in result.all()}
+
+    async def get_project_access(self, user_id: int) -> tuple[set[int], set[int]]:
+        """IDs of the projects a user created and of those they are a member of, in one query"""
+        statement = (
+            select(Project.id, Project.created_by, ProjectMembership.user_id)
+            .outerjoin(ProjectMembership, and_(ProjectMembership.project_id == Project.id, ProjectMembership.user_id == user_id))
+            .where(or_(Project.created_by == user_id, ProjectMembership.user_id == user_id))
+        )
+        result = await self.session.exec(statement)
+        created: set[int] = set()
+        member: set[int] = set()
+        for project_id, created_by, member_id in result.all():
+            if created_by == user_id:
+                created.add(project_id)
+            if member_id is not None:
+                member.add(project_id)
+        return created, member
+
+    async def get_project_members(self, project_id: int) -> list[User]:
+        """Get all members of a project, loaded for UserPublic"""
+        statement = (
+            select(User)
+            .join(ProjectMembership)
+            .where(ProjectMembership.project_id == project_id)
+            .options(
+                selectinload(User.projects),
+                selectinload(User.assigned_issues)
+            )
+        )
+        result = await self.session.exec(statement)
+        return list(result.all())
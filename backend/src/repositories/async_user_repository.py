@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models.user import User
+from src.models.token_revocation import TokenRevocation
+from .async_base_repository import AsyncBaseRepository
+
+class AsyncUserRepository(AsyncBaseRepository[User]):
+    """Async repository for User lookups"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(User, session)
+
+    async def get_token_revocations(self, since: datetime) -> list[TokenRevocation]:
+        """Get the token revocations recorded at or after a naive UTC time"""
+        statement = select(TokenRevocation).where(col(TokenRevocation.revoked_at) >= since)
+        result = await self.session.exec(statement)
+        return list(result.all())
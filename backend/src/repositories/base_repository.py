@@ -1,8 +1,17 @@
-from typing import TypeVar, Generic, Type
-from sqlmodel import SQLModel, Session, select
+from typing import TypeVar, Generic, Type, Any
+from sqlalchemy import inspect, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import SQLModel, Session, select, col
+from src.pagination import Page, PageParams, build_page, decode_cursor
 
 T = TypeVar("T", bound=SQLModel)
 
+def insert_ignoring_conflicts(dialect_name: str, model: type[SQLModel]) -> Any:
+    """INSERT ... ON CONFLICT DO NOTHING on PostgreSQL and SQLite, so concurrent writers of one row both succeed"""
+    insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+    return insert(model).on_conflict_do_nothing()
+
 class BaseRepository(Generic[T]):
     """Base repository class with common CRUD operations"""
     
@@ -10,15 +19,49 @@ class BaseRepository(Generic[T]):
         self.model = model
         self.session = session
 
-    def get_by_id(self, id: int) -> T | None:
-        """Get record by ID"""
-        return self.session.get(self.model, id)
+    def _loader_options(self) -> list[Any]:
+        """Relationship loaders for records serialized in responses, so serialization does not lazy load per row"""
+        return []
+
+    def _select(self):
+        """Select statement with the repository loader options, for reads that feed responses"""
+        return select(self.model).options(*self._loader_options())
+
+    def get_by_id(self, id: int, load_relationships: bool = False) -> T | None:
+        """Get record by ID, optionally with the relationships its response serializes"""
+        if not load_relationships:
+            # Identity map lookup, cheap enough for existence and permission checks
+            return self.session.get(self.model, id)
+
+        statement = self._select().where(getattr(self.model, "id") == id)
+        return self.session.exec(statement).first()
+
+    def get_by_ids(self, ids: list[int]) -> list[T]:
+        """Get records by a list of IDs in one query"""
+        if not ids:
+            return []
+        statement = select(self.model).where(col(getattr(self.model, "id")).in_(ids))
+        return list(self.session.exec(statement).all())
 
     def get_all(self) -> list[T]:
         """Get all records"""
         statement = select(self.model)
         return list(self.session.exec(statement).all())
 
+    def get_page(self, page_params: PageParams, *criteria) -> Page[T]:
+        """Get one keyset page of records matching the criteria"""
+        return self._paginate(self._select().where(*criteria), page_params)
+
+    def _paginate(self, statement, page_params: PageParams) -> Page[T]:
+        """Apply keyset pagination on (created_at, id) to a select of this model"""
+        created_at, id = getattr(self.model, "created_at"), getattr(self.model, "id")
+        if page_params.cursor:
+            statement = statement.where(tuple_(created_at, id) > decode_cursor(page_params.cursor))
+
+        # One extra row tells whether another page exists
+        statement = statement.order_by(created_at, id).limit(page_params.limit + 1)
+        return build_page(list(self.session.exec(statement).all()), page_params.limit)
+
     def delete(self, id: int) -> bool:
         """Delete a record by ID"""
         db_obj = self.get_by_id(id)
@@ -26,7 +69,7 @@ class BaseRepository(Generic[T]):
             return False
             
         self.session.delete(db_obj)
-        self.session.commit()
+        self.session.flush()
         return True
 
     def get_by_field(self, field_name: str, value) -> T | None:
@@ -37,4 +80,13 @@ class BaseRepository(Generic[T]):
     def get_all_by_field(self, field_name: str, value) -> list[T]:
         """Get all records by field value"""
         statement = select(self.model).where(getattr(self.model, field_name) == value)
-        return list(self.session.exec(statement).all())
\ No newline at end of file
+        return list(self.session.exec(statement).all())
+
+    def _flush(self, db_obj: T) -> T:
+        """Write a record in the request's unit of work, the request commits once at the end"""
+        self.session.add(db_obj)
+        # Generated keys come back with the INSERT (RETURNING), no refresh SELECT needed
+        self.session.flush()
+        # Relationships loaded before the write may be stale, reload them on next access
+        self.session.expire(db_obj, [relationship.key for relationship in inspect(self.model).relationships])
+        return db_obj
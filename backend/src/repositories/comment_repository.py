@@ -1,25 +1,46 @@
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
-from src.models.comment import Comment
+from typing import Any
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, col
+from src.models import Comment, Issue, Project, ProjectMembership
 from src.dto.comment import CommentUpdate
+from src.pagination import Page, PageParams
 from .base_repository import BaseRepository
 
+def filter_author_comments(statement, author_id: int, visible_to: int | None = None, include_created_projects: bool = False):
+    """Limit a select of comments to one author, joined through issues to projects so broken references drop out"""
+    statement = (
+        statement
+        .join(Issue, col(Comment.issue_id) == Issue.id)
+        .join(Project, col(Issue.project_id) == Project.id)
+        .where(Comment.author_id == author_id)
+    )
+    # None means unrestricted (admin)
+    if visible_to is None:
+        return statement
+
+    statement = statement.outerjoin(
+        ProjectMembership,
+        and_(col(ProjectMembership.project_id) == Project.id, col(ProjectMembership.user_id) == visible_to)
+    )
+    visible = col(ProjectMembership.user_id).is_not(None)
+    if include_created_projects:
+        visible = or_(visible, col(Project.created_by) == visible_to)
+    return statement.where(visible)
+
 class CommentRepository(BaseRepository[Comment]):
     """Repository for Comment operations"""
     
     def __init__(self, session: Session):
         super().__init__(Comment, session)
 
+    def _loader_options(self) -> list[Any]:
+        """Load everything CommentPublic serializes"""
+        return [joinedload(Comment.author)]
+
     def create(self, comment: Comment) -> Comment:
         """Create a new comment"""
-        try:
-            self.session.add(comment)
-            self.session.commit()
-            self.session.refresh(comment)
-            return comment
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return self._flush(comment)
 
     def update(self, comment_id: int, comment_update: CommentUpdate) -> Comment | None:
         """Update existing comment"""
@@ -29,30 +50,20 @@ class CommentRepository(BaseRepository[Comment]):
         
         update_data = comment_update.model_dump(exclude_unset=True)
         
-        try:
-            db_comment.sqlmodel_update(update_data)
-            self.session.add(db_comment)
-            self.session.commit()
-            self.session.refresh(db_comment)
-            return db_comment
-        except (ValueError, IntegrityError):
-            self.session.rollback()
-            raise
-
-    def get_comments_by_issue(self, issue_id: int) -> list[Comment]:
-        """Get all comments for an issue"""
-        statement = (
-            select(Comment)
-            .where(Comment.issue_id == issue_id)
-            .order_by("created_at")
-        )
-        return list(self.session.exec(statement).all())
-
-    def get_comments_by_author(self, author_id: int) -> list[Comment]:
-        """Get all comments by a specific author, ordered by creation date"""
-        statement = (
-            select(Comment)
-            .where(Comment.author_id == author_id)
-            .order_by("created_at")
-        )
-        return list(self.session.exec(statement).all())
\ No newline at end of file
+        db_comment.sqlmodel_update(update_data)
+        return self._flush(db_comment)
+
+    def get_comments_page_by_issue(self, issue_id: int, page_params: PageParams) -> Page[Comment]:
+        """Get one page of an issue's comments, oldest first"""
+        return self.get_page(page_params, Comment.issue_id == issue_id)
+
+    def get_comments_page_by_author(
+        self,
+        author_id: int,
+        page_params: PageParams,
+        visible_to: int | None = None,
+        include_created_projects: bool = False
+    ) -> Page[Comment]:
+        """Get one page of an author's comments, oldest first, optionally limited to the projects another user can view"""
+        statement = filter_author_comments(self._select(), author_id, visible_to, include_created_projects)
+        return self._paginate(statement, page_params)
\ No newline at end of file
@@ -0,0 +1,122 @@
+from typing import Any, Sequence
+from sqlalchemy import Integer, String, func, literal, null, type_coerce, union_all
+from sqlmodel import Session, select, col, and_
+from src.models import User, Project, Issue, ProjectMembership, ProjectIssueStats
+from src.models.enums import UserRole, ProjectStatus, IssueStatus
+from src.models.project_issue_stats import STATUS_COUNT_COLUMNS, PRIORITY_COUNT_COLUMNS
+
+def _open_issue_count() -> Any:
+    """Issues that are not closed, from a project's rollup row"""
+    columns = [getattr(ProjectIssueStats, column) for status, column in STATUS_COUNT_COLUMNS.items() if status != IssueStatus.CLOSED]
+    return sum(columns[1:], columns[0])
+
+class DashboardRepository:
+    """Repository for dashboard aggregates, read from the per-project issue rollup or computed with GROUP BY"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def count_users_by_role(self) -> dict[UserRole, int]:
+        """Number of users per role"""
+        statement = select(User.role, func.count()).group_by(User.role)
+        return {role: count for role, count in self.session.exec(statement).all()}
+
+    def count_projects_by_status(self) -> dict[ProjectStatus, int]:
+        """Number of projects per status"""
+        statement = select(Project.status, func.count()).group_by(Project.status)
+        return {status: count for status, count in self.session.exec(statement).all()}
+
+    def count_open_issues_by_active_project(self) -> list[tuple[int, str, int]]:
+        """(project id, name, open issues) for every active project, ordered by name"""
+        statement = (
+            select(Project.id, Project.name, func.coalesce(_open_issue_count(), 0))
+            .outerjoin(ProjectIssueStats, col(ProjectIssueStats.project_id) == Project.id)
+            .where(Project.status == ProjectStatus.ACTIVE)
+            .order_by(col(Project.name), col(Project.id))
+        )
+        return [(project_id or 0, name, count) for project_id, name, count in self.session.exec(statement).all()]
+
+    def count_open_issues(self) -> int:
+        """Number of issues that are not closed, across all projects"""
+        statement = select(func.coalesce(func.sum(_open_issue_count()), 0))
+        return self.session.exec(statement).one()
+
+    def get_manager_rows(self, created_by: int, project_id: int | None = None) -> Sequence[Any]:
+        """
+        Active issue counts of the projects a user created, in one UNION ALL round trip.
+        Status and priority counts come from the rollup rows, only the workload groups issues.
+        Rows are (kind, project_id, status, priority, user_id, name, issues, time_estimate) where kind is
+        "project" (one per project), "status" and "priority" (per project), "workload" (per assignee) or
+        "member" (team members, so idle ones show up with 0)
+        """
+        project_filter = [col(Project.created_by) == created_by]
+        if project_id is not None:
+            project_filter.append(col(Project.id) == project_id)
+        active_issue_filter = [*project_filter, col(Issue.status) != IssueStatus.CLOSED]
+
+        no_project = type_coerce(null(), Integer)
+        no_status = type_coerce(null(), col(Issue.status).type)
+        no_priority = type_coerce(null(), col(Issue.priority).type)
+        no_user = type_coerce(null(), Integer)
+        no_name = type_coerce(null(), String)
+        issue_count = func.count(col(Issue.id))
+        time_estimate = func.coalesce(func.sum(col(Issue.time_estimate)), 0)
+
+        projects = (
+            select(literal("project").label("kind"), col(Project.id).label("project_id"), no_status.label("status"),
+                   no_priority.label("priority"), no_user.label("user_id"), col(Project.name).label("name"),
+                   literal(0).label("issues"), literal(0).label("time_estimate"))
+            .where(*project_filter)
+        )
+        # One row per non-zero rollup column, the same shape the GROUP BY on issues would give
+        by_status = [
+            select(literal("status"), col(ProjectIssueStats.project_id), literal(status, col(Issue.status).type), no_priority,
+                   no_user, no_name, getattr(ProjectIssueStats, column), literal(0))
+            .join(Project, col(Project.id) == col(ProjectIssueStats.project_id))
+            .where(*project_filter, getattr(ProjectIssueStats, column) > 0)
+            for status, column in STATUS_COUNT_COLUMNS.items() if status != IssueStatus.CLOSED
+        ]
+        by_priority = [
+            select(literal("priority"), col(ProjectIssueStats.project_id), no_status, literal(priority, col(Issue.priority).type),
+                   no_user, no_name, getattr(ProjectIssueStats, column), literal(0))
+            .join(Project, col(Project.id) == col(ProjectIssueStats.project_id))
+            .where(*project_filter, getattr(ProjectIssueStats, column) > 0)
+            for priority, column in PRIORITY_COUNT_COLUMNS.items()
+        ]
+        by_assignee = (
+            select(literal("workload"), no_project, no_status, no_priority, col(Issue.assignee_id), col(User.username), issue_count, time_estimate)
+            .join(Project, col(Project.id) == col(Issue.project_id))
+            .outerjoin(User, col(User.id) == col(Issue.assignee_id))
+            .where(*active_issue_filter)
+            .group_by(col(Issue.assignee_id), col(User.username))
+        )
+        members = (
+            select(literal("member"), no_project, no_status, no_priority, col(ProjectMembership.user_id), col(User.username), literal(0), literal(0))
+            .join(Project, col(Project.id) == col(ProjectMembership.project_id))
+            .join(User, col(User.id) == col(ProjectMembership.user_id))
+            .where(*project_filter)
+            .group_by(col(ProjectMembership.user_id), col(User.username))
+        )
+
+        statement = union_all(projects, *by_status, *by_priority, by_assignee, members)
+        return self.session.exec(statement).all()
+
+    def get_assigned_issue_counts(self, user_id: int) -> Sequence[Any]:
+        """
+        A user's active assigned issues in the projects they are a member of, in one GROUP BY query.
+        Rows are (project_id, project_name, project_status, issue_status, priority, issues), projects
+        without such issues get one row with no status or priority and 0 issues
+        """
+        statement = (
+            select(col(Project.id), col(Project.name), col(Project.status), col(Issue.status), col(Issue.priority), func.count(col(Issue.id)))
+            .select_from(ProjectMembership)
+            .join(Project, col(Project.id) == col(ProjectMembership.project_id))
+            .outerjoin(Issue, and_(
+                col(Issue.project_id) == col(ProjectMembership.project_id),
+                col(Issue.assignee_id) == user_id,
+                col(Issue.status) != IssueStatus.CLOSED
+            ))
+            .where(col(ProjectMembership.user_id) == user_id)
+            .group_by(col(Project.id), col(Project.name), col(Project.status), col(Issue.status), col(Issue.priority))
+        )
+        return self.session.exec(statement).all()
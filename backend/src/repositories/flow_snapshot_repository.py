@@ -0,0 +1,92 @@
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import and_, case, func, not_, or_
+from sqlmodel import Session, select, col
+from src.models import Issue, Project, ProjectFlowSnapshot, IssueStatus
+from src.models.project_issue_stats import STATUS_COUNT_COLUMNS
+from .base_repository import insert_ignoring_conflicts
+
+# Advisory lock key held by the worker taking snapshots, an arbitrary constant
+FLOW_SNAPSHOT_LOCK_KEY = 7_210_425
+# Rows per INSERT, keeps the bound parameters of one statement well within driver limits
+INSERT_CHUNK_SIZE = 500
+
+class FlowSnapshotRepository:
+    """Repository for daily project flow snapshots"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_next_days(self) -> dict[int, date]:
+        """First day still to snapshot per project, the day after its last snapshot or the day it was created"""
+        statement = (
+            select(col(Project.id), col(Project.created_at), func.max(col(ProjectFlowSnapshot.day)))
+            .outerjoin(ProjectFlowSnapshot, col(ProjectFlowSnapshot.project_id) == col(Project.id))
+            .group_by(col(Project.id), col(Project.created_at))
+        )
+        return {
+            project_id: last_day + timedelta(days=1) if last_day else created_at.date()
+            for project_id, created_at, last_day in self.session.exec(statement).all()
+        }
+
+    def count_issues_at(self, day: date, project_ids: list[int]) -> list[ProjectFlowSnapshot]:
+        """Snapshots of the given projects at the end of a UTC day, from one GROUP BY over issues"""
+        # Naive UTC like the stored timestamps, an aware bound would be shifted by the session time zone
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+        existed = col(Issue.created_at) < day_end
+        closed_at = col(Issue.closed_at)
+        # Issues closed without a close time count as closed since an unknown day
+        closed = or_(and_(closed_at.is_not(None), closed_at < day_end), and_(closed_at.is_(None), col(Issue.status) == IssueStatus.CLOSED))
+
+        columns = []
+        for status, column in STATUS_COUNT_COLUMNS.items():
+            if status == IssueStatus.CLOSED:
+                in_status = closed
+            elif status == IssueStatus.OPEN:
+                # Status history is not stored, issues closed after the day count as open on it
+                in_status = and_(not_(closed), col(Issue.status).in_([IssueStatus.OPEN, IssueStatus.CLOSED]))
+            else:
+                in_status = and_(not_(closed), col(Issue.status) == status)
+            columns.append(func.count(case((and_(existed, in_status), 1))).label(column))
+        columns += [
+            func.count(case((and_(existed, col(Issue.created_at) >= day_start), 1))).label("created_count"),
+            func.count(case((and_(closed_at >= day_start, closed_at < day_end), 1))).label("resolved_count")
+        ]
+
+        statement = (
+            select(col(Project.id).label("project_id"), *columns)
+            .outerjoin(Issue, col(Issue.project_id) == col(Project.id))
+            .where(col(Project.id).in_(project_ids))
+            .group_by(col(Project.id))
+        )
+        rows = self.session.exec(statement).mappings().all()
+        return [ProjectFlowSnapshot(day=day, **row) for row in rows]
+
+    def try_lock(self) -> bool:
+        """Take the snapshot lock for the rest of the transaction, False when another worker holds it (PostgreSQL only)"""
+        if self.session.get_bind().dialect.name != "postgresql":
+            return True
+        return bool(self.session.exec(select(func.pg_try_advisory_xact_lock(FLOW_SNAPSHOT_LOCK_KEY))).one())
+
+    def insert_many(self, snapshots: list[ProjectFlowSnapshot]) -> int:
+        """Insert snapshots, skipping days already taken by another run, returning how many were new"""
+        rows = [snapshot.model_dump() for snapshot in snapshots]
+        dialect_name = self.session.get_bind().dialect.name
+        inserted = 0
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            statement = insert_ignoring_conflicts(dialect_name, ProjectFlowSnapshot).values(rows[start:start + INSERT_CHUNK_SIZE])
+            inserted += self.session.exec(statement).rowcount
+        return inserted
+
+    def get_range(self, project_id: int, from_day: date, to_day: date) -> list[ProjectFlowSnapshot]:
+        """A project's snapshots between two days, inclusive and in day order"""
+        statement = (
+            select(ProjectFlowSnapshot)
+            .where(
+                ProjectFlowSnapshot.project_id == project_id,
+                col(ProjectFlowSnapshot.day) >= from_day,
+                col(ProjectFlowSnapshot.day) <= to_day
+            )
+            .order_by(col(ProjectFlowSnapshot.day))
+        )
+        return list(self.session.exec(statement).all())
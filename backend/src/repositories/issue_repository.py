@@ -1,26 +1,124 @@
-from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timezone
+from typing import Any, Callable
+from sqlalchemy import case, func, or_, tuple_
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Session, select, col
-from src.models import Issue, IssueLabel, IssueStatus
-from src.dto.issue import IssueUpdate
+from src.models import Issue, IssueLabel, IssueStatus, IssuePriority, Project, ProjectMembership, Comment
+from src.dto.issue import IssueUpdate, IssueSearchFilters, IssueSort
+from src.pagination import CursorKey, Page, PageParams, build_page, decode_cursor
 from .base_repository import BaseRepository
+from .project_issue_stats_repository import ProjectIssueStatsRepository, IssueState, stats_changes
+
+# Priorities ranked by severity, the stored enum values do not sort meaningfully
+PRIORITY_RANK = {
+    IssuePriority.LOW: 0,
+    IssuePriority.MEDIUM: 1,
+    IssuePriority.HIGH: 2,
+    IssuePriority.CRITICAL: 3
+}
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _sort_key(sort: IssueSort) -> tuple[Any, Callable[[Issue], CursorKey], type[CursorKey]]:
+    """SQL sort expression, the same key computed from a loaded issue, and the key type"""
+    field = sort.value.lstrip("-")
+    if field == "created_at":
+        return col(Issue.created_at), lambda issue: issue.created_at, datetime
+    if field == "updated_at":
+        # Never NULL, so keyset comparisons stay well defined
+        return func.coalesce(Issue.updated_at, Issue.created_at), lambda issue: issue.updated_at or issue.created_at, datetime
+    rank = case(*((Issue.priority == priority, value) for priority, value in PRIORITY_RANK.items()))
+    return rank, lambda issue: PRIORITY_RANK[issue.priority], int
+
+def issue_visibility(visible_to: int, include_created_projects: bool = False) -> Any:
+    """Criterion limiting issues to the projects a user is a member of, and optionally those they created"""
+    member_projects = select(ProjectMembership.project_id).where(ProjectMembership.user_id == visible_to)
+    visible = col(Issue.project_id).in_(member_projects)
+    if include_created_projects:
+        created_projects = select(Project.id).where(Project.created_by == visible_to)
+        visible = or_(visible, col(Issue.project_id).in_(created_projects))
+    return visible
+
+def apply_issue_search(
+    statement,
+    filters: IssueSearchFilters,
+    page_params: PageParams,
+    visible_to: int | None = None,
+    include_created_projects: bool = False
+) -> tuple[Any, Callable[[Issue], CursorKey]]:
+    """Add filters, visibility, keyset position and sort order to a select of issues, plus the row sort key for cursors"""
+    criteria = []
+
+    # Visibility is part of the query, None means unrestricted (admin)
+    if visible_to is not None:
+        criteria.append(issue_visibility(visible_to, include_created_projects))
+
+    if filters.project_id:
+        criteria.append(col(Issue.project_id).in_(filters.project_id))
+    if filters.status:
+        criteria.append(col(Issue.status).in_(filters.status))
+    if filters.priority:
+        criteria.append(col(Issue.priority).in_(filters.priority))
+    if filters.assignee_id and filters.unassigned:
+        criteria.append(or_(col(Issue.assignee_id).in_(filters.assignee_id), col(Issue.assignee_id).is_(None)))
+    elif filters.assignee_id:
+        criteria.append(col(Issue.assignee_id).in_(filters.assignee_id))
+    elif filters.unassigned:
+        criteria.append(col(Issue.assignee_id).is_(None))
+    if filters.author_id:
+        criteria.append(col(Issue.author_id).in_(filters.author_id))
+    if filters.label_id:
+        labelled = select(IssueLabel.issue_id).where(col(IssueLabel.label_id).in_(filters.label_id))
+        criteria.append(col(Issue.id).in_(labelled))
+    if filters.q:
+        pattern = f"%{_escape_like(filters.q)}%"
+        criteria.append(or_(col(Issue.title).ilike(pattern, escape="\\"), col(Issue.description).ilike(pattern, escape="\\")))
+    if filters.updated_since:
+        criteria.append(func.coalesce(Issue.updated_at, Issue.created_at) >= filters.updated_since)
+
+    sort_expression, sort_key, key_type = _sort_key(filters.sort)
+    descending = filters.sort.value.startswith("-")
+    id = col(Issue.id)
+
+    if page_params.cursor:
+        position = tuple_(sort_expression, id)
+        after = decode_cursor(page_params.cursor, key_type)
+        criteria.append(position < after if descending else position > after)
+
+    order_by = (sort_expression.desc(), id.desc()) if descending else (sort_expression, id)
+    # One extra row tells whether another page exists
+    statement = statement.where(*criteria).order_by(*order_by).limit(page_params.limit + 1)
+    return statement, sort_key
 
 class IssueRepository(BaseRepository[Issue]):
     """Repository for Issue operations"""
     
     def __init__(self, session: Session):
         super().__init__(Issue, session)
+        self.issue_stats = ProjectIssueStatsRepository(session)
+
+    def _loader_options(self) -> list[Any]:
+        """Load everything IssuePublic serializes"""
+        return [
+            joinedload(Issue.author),
+            joinedload(Issue.assignee),
+            joinedload(Issue.project),
+            selectinload(Issue.comments).joinedload(Comment.author)
+        ]
 
     def create(self, issue: Issue) -> Issue:
         """Create a new issue"""
-        try:
-            self.session.add(issue)
-            self.session.commit()
-            self.session.refresh(issue)
-            return issue
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        db_issue = self._flush(issue)
+        self.issue_stats.apply(stats_changes(added=[IssueState.of(db_issue)]))
+        return db_issue
+
+    def create_many(self, issues: list[Issue]) -> list[Issue]:
+        """Create several issues, flushed as one multi-row INSERT ... RETURNING"""
+        self.session.add_all(issues)
+        self.session.flush()
+        self.issue_stats.apply(stats_changes(added=[IssueState.of(issue) for issue in issues]))
+        return issues
 
     def update(self, issue_id: int, issue_update: IssueUpdate) -> Issue | None:
         """Update existing issue"""
@@ -28,37 +126,65 @@ class IssueRepository(BaseRepository[Issue]):
         if not db_issue:
             return None
         
+        before = IssueState.of(db_issue)
         update_data = issue_update.model_dump(exclude_unset=True)
         update_data["updated_at"] = datetime.now(timezone.utc)
         
-        try:
-            db_issue.sqlmodel_update(update_data)
-            self.session.add(db_issue)
-            self.session.commit()
-            self.session.refresh(db_issue)
-            return db_issue
-        except (ValueError, IntegrityError):
-            self.session.rollback()
-            raise
-
-    def get_issues_by_project(self, project_id: int) -> list[Issue]:
-        """Get issues by project"""
-        return self.get_all_by_field("project_id", project_id)
-    
-    def get_issues_by_project_ids(self, project_ids: list[int]) -> list[Issue]:
-        """Get issues by multiple project IDs"""
+        db_issue.sqlmodel_update(update_data)
+        return self._flush_with_stats(db_issue, before)
+
+    def delete(self, id: int) -> bool:
+        """Delete an issue and take it out of its project's rollup"""
+        db_issue = self.get_by_id(id)
+        if not db_issue:
+            return False
+
+        before = IssueState.of(db_issue)
+        self.session.delete(db_issue)
+        self.session.flush()
+        self.issue_stats.apply(stats_changes(removed=[before]))
+        return True
+
+    def _flush_with_stats(self, db_issue: Issue, before: IssueState) -> Issue:
+        """Write a changed issue and move its project's rollup from the old state to the new one"""
+        db_issue = self._flush(db_issue)
+        self.issue_stats.apply(stats_changes(removed=[before], added=[IssueState.of(db_issue)]))
+        return db_issue
+
+    def get_issues_page_by_project(self, project_id: int, page_params: PageParams) -> Page[Issue]:
+        """Get one page of a project's issues"""
+        return self.get_page(page_params, Issue.project_id == project_id)
+
+    def get_issues_page_by_project_ids(self, project_ids: list[int], page_params: PageParams) -> Page[Issue]:
+        """Get one page of issues from multiple projects"""
         if not project_ids:
-            return []
-        statement = select(Issue).where(col(Issue.project_id).in_(project_ids))
-        return list(self.session.exec(statement).all())
+            return Page(items=[])
+        return self.get_page(page_params, col(Issue.project_id).in_(project_ids))
 
-    def get_issues_by_author(self, author_id: int) -> list[Issue]:
-        """Get issues created by a specific user"""
-        return self.get_all_by_field("author_id", author_id)
+    def search_issues(
+        self,
+        filters: IssueSearchFilters,
+        page_params: PageParams,
+        visible_to: int | None = None,
+        include_created_projects: bool = False
+    ) -> Page[Issue]:
+        """Get one page of issues matching every filter, in a single statement"""
+        statement, sort_key = apply_issue_search(self._select(), filters, page_params, visible_to, include_created_projects)
+        return build_page(list(self.session.exec(statement).all()), page_params.limit, sort_key)
 
-    def get_issues_by_assignee(self, assignee_id: int) -> list[Issue]:
-        """Get issues assigned to a specific user"""
-        return self.get_all_by_field("assignee_id", assignee_id)
+    def get_issues_by_author(self, author_id: int, visible_to: int | None = None, include_created_projects: bool = False) -> list[Issue]:
+        """Get issues created by a specific user, optionally limited to the projects another user can view"""
+        statement = self._select().where(Issue.author_id == author_id)
+        if visible_to is not None:
+            statement = statement.where(issue_visibility(visible_to, include_created_projects))
+        return list(self.session.exec(statement).all())
+
+    def get_issues_by_assignee(self, assignee_id: int, visible_to: int | None = None, include_created_projects: bool = False) -> list[Issue]:
+        """Get issues assigned to a specific user, optionally limited to the projects another user can view"""
+        statement = self._select().where(Issue.assignee_id == assignee_id)
+        if visible_to is not None:
+            statement = statement.where(issue_visibility(visible_to, include_created_projects))
+        return list(self.session.exec(statement).all())
 
     def get_issues_by_status(self, status: str) -> list[Issue]:
         """Get issues by status"""
@@ -79,19 +205,13 @@ class IssueRepository(BaseRepository[Issue]):
         if not db_issue:
             return None
         
+        before = IssueState.of(db_issue)
         db_issue.status = IssueStatus.CLOSED
         db_issue.closed_at = datetime.now(timezone.utc)
         db_issue.closed_by = closed_by_user_id
         db_issue.updated_at = datetime.now(timezone.utc)
 
-        try:
-            self.session.add(db_issue)
-            self.session.commit()
-            self.session.refresh(db_issue)
-            return db_issue
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return self._flush_with_stats(db_issue, before)
 
     def reopen_issue(self, issue_id: int) -> Issue | None:
         """Reopen a closed issue"""
@@ -99,31 +219,20 @@ class IssueRepository(BaseRepository[Issue]):
         if not db_issue:
             return None
         
+        before = IssueState.of(db_issue)
         db_issue.status = IssueStatus.OPEN
         db_issue.closed_at = None
         db_issue.closed_by = None
         db_issue.updated_at = datetime.now(timezone.utc)
 
-        try:
-            self.session.add(db_issue)
-            self.session.commit()
-            self.session.refresh(db_issue)
-            return db_issue
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return self._flush_with_stats(db_issue, before)
 
     def add_label_to_issue(self, issue_id: int, label_id: int) -> IssueLabel:
         """Add a label to an issue"""
         issue_label = IssueLabel(issue_id=issue_id, label_id=label_id)
-        try:
-            self.session.add(issue_label)
-            self.session.commit()
-            self.session.refresh(issue_label)
-            return issue_label
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        self.session.add(issue_label)
+        self.session.flush()
+        return issue_label
 
     def remove_label_from_issue(self, issue_id: int, label_id: int) -> bool:
         """Remove a label from an issue"""
@@ -133,11 +242,7 @@ class IssueRepository(BaseRepository[Issue]):
         )
         issue_label = self.session.exec(statement).first()
         if issue_label:
-            try:
-                self.session.delete(issue_label)
-                self.session.commit()
-                return True
-            except IntegrityError:
-                self.session.rollback()
-                raise
+            self.session.delete(issue_label)
+            self.session.flush()
+            return True
         return False
\ No newline at end of file
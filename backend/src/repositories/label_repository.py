@@ -1,4 +1,3 @@
-from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select, func
 from src.models import Label, IssueLabel
 from src.dto.label import LabelUpdate
@@ -12,14 +11,7 @@ class LabelRepository(BaseRepository[Label]):
 
     def create(self, label: Label) -> Label:
         """Create a new label"""
-        try:
-            self.session.add(label)
-            self.session.commit()
-            self.session.refresh(label)
-            return label
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return self._flush(label)
 
     def update(self, label_id: int, label_update: LabelUpdate) -> Label | None:
         """Update existing label"""
@@ -29,15 +21,8 @@ class LabelRepository(BaseRepository[Label]):
         
         update_data = label_update.model_dump(exclude_unset=True)
         
-        try:
-            db_label.sqlmodel_update(update_data)
-            self.session.add(db_label)
-            self.session.commit()
-            self.session.refresh(db_label)
-            return db_label
-        except (ValueError, IntegrityError):
-            self.session.rollback()
-            raise
+        db_label.sqlmodel_update(update_data)
+        return self._flush(db_label)
 
     def get_by_name(self, name: str) -> Label | None:
         """Get label by name"""
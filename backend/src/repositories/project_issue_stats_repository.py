@@ -0,0 +1,193 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Iterable, NamedTuple
+from sqlalchemy import and_, case, func, update
+from sqlmodel import Session, select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models import Issue, Project, ProjectIssueStats, IssueStatus, IssuePriority
+from src.models.project_issue_stats import STATUS_COUNT_COLUMNS, PRIORITY_COUNT_COLUMNS
+from .base_repository import insert_ignoring_conflicts
+
+COUNTER_COLUMNS = [*STATUS_COUNT_COLUMNS.values(), *PRIORITY_COUNT_COLUMNS.values(), "open_estimate_hours"]
+
+class IssueState(NamedTuple):
+    """The issue fields the rollup counts"""
+    project_id: int
+    status: IssueStatus
+    priority: IssuePriority
+    time_estimate: int | None
+
+    @classmethod
+    def of(cls, issue: Issue) -> "IssueState":
+        return cls(issue.project_id, issue.status, issue.priority, issue.time_estimate)
+
+def _contribution(state: IssueState) -> Counter:
+    """Rollup columns one issue adds to its project"""
+    contribution = Counter({STATUS_COUNT_COLUMNS[state.status]: 1})
+    if state.status != IssueStatus.CLOSED:
+        contribution[PRIORITY_COUNT_COLUMNS[state.priority]] += 1
+        contribution["open_estimate_hours"] += state.time_estimate or 0
+    return contribution
+
+def stats_changes(removed: Iterable[IssueState] = (), added: Iterable[IssueState] = ()) -> dict[int, dict[str, int]]:
+    """Column deltas per project for issues leaving and entering a state, every touched project is included"""
+    changes: dict[int, Counter] = {}
+    for state in removed:
+        changes.setdefault(state.project_id, Counter()).subtract(_contribution(state))
+    for state in added:
+        changes.setdefault(state.project_id, Counter()).update(_contribution(state))
+    return {
+        project_id: {column: delta for column, delta in deltas.items() if delta}
+        for project_id, deltas in changes.items()
+    }
+
+def _increment_statement(project_id: int, deltas: dict[str, int], now: datetime) -> Any:
+    """Atomic UPDATE adding the deltas in the database, so concurrent writers cannot lose each other's counts"""
+    values = {column: getattr(ProjectIssueStats, column) + delta for column, delta in deltas.items()}
+    return (
+        update(ProjectIssueStats)
+        .where(col(ProjectIssueStats.project_id) == project_id)
+        .values(**values, last_activity_at=now)
+    )
+
+def _rollup_statement(project_ids: list[int] | None, missing_only: bool) -> Any:
+    """Rollup columns recomputed from the issues table, one row per project"""
+    not_closed = col(Issue.status) != IssueStatus.CLOSED
+    columns = [
+        func.count(case((col(Issue.status) == status, 1))).label(column)
+        for status, column in STATUS_COUNT_COLUMNS.items()
+    ]
+    columns += [
+        func.count(case((and_(not_closed, col(Issue.priority) == priority), 1))).label(column)
+        for priority, column in PRIORITY_COUNT_COLUMNS.items()
+    ]
+    columns += [
+        func.coalesce(func.sum(case((not_closed, col(Issue.time_estimate)))), 0).label("open_estimate_hours"),
+        func.max(func.coalesce(col(Issue.updated_at), col(Issue.created_at))).label("last_activity_at")
+    ]
+
+    statement = (
+        select(col(Project.id).label("project_id"), *columns)
+        .outerjoin(Issue, col(Issue.project_id) == col(Project.id))
+        .group_by(col(Project.id))
+    )
+    if project_ids is not None:
+        statement = statement.where(col(Project.id).in_(project_ids))
+    if missing_only:
+        statement = statement.where(col(Project.id).not_in(select(ProjectIssueStats.project_id)))
+    return statement
+
+def _insert_statement(dialect_name: str, rollup: Any) -> Any:
+    """INSERT of a recomputed rollup row that does nothing when a concurrent writer inserted the row first"""
+    return insert_ignoring_conflicts(dialect_name, ProjectIssueStats).values(**rollup)
+
+def _existing_statement(project_ids: list[int] | None) -> Any:
+    """Current rollup rows, locked so increments wait for the rebuild"""
+    statement = select(ProjectIssueStats).with_for_update()
+    if project_ids is not None:
+        statement = statement.where(col(ProjectIssueStats.project_id).in_(project_ids))
+    return statement
+
+def _repair(stats: ProjectIssueStats, rollup: Any) -> bool:
+    """Copy recomputed counts onto a rollup row, returning whether they had drifted"""
+    drifted = any(getattr(stats, column) != rollup[column] for column in COUNTER_COLUMNS)
+    for column in COUNTER_COLUMNS:
+        setattr(stats, column, rollup[column])
+    if stats.last_activity_at is None:
+        stats.last_activity_at = rollup["last_activity_at"]
+    return drifted
+
+class ProjectIssueStatsRepository:
+    """Repository for the per-project issue rollup, written in the same transaction as the issues"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def apply(self, changes: dict[int, dict[str, int]]) -> None:
+        """Add column deltas to the projects' rollup rows, recomputing rows that do not exist yet"""
+        now = datetime.now(timezone.utc)
+        missing = [
+            project_id for project_id, deltas in changes.items()
+            if self.session.exec(_increment_statement(project_id, deltas, now)).rowcount == 0
+        ]
+        # The recomputed row already counts this write, a row inserted concurrently does not, so it gets the delta
+        for project_id in self._insert_missing(missing):
+            self.session.exec(_increment_statement(project_id, changes[project_id], now))
+
+    def _insert_missing(self, project_ids: list[int]) -> list[int]:
+        """Insert recomputed rows for projects without one, returning the projects another writer inserted first"""
+        if not project_ids:
+            return []
+        dialect_name = self.session.get_bind().dialect.name
+        rollups = self.session.exec(_rollup_statement(project_ids, missing_only=False)).mappings().all()
+        return [
+            rollup["project_id"] for rollup in rollups
+            if self.session.exec(_insert_statement(dialect_name, rollup)).rowcount == 0
+        ]
+
+    def rebuild(self, project_ids: list[int] | None = None, missing_only: bool = False) -> int:
+        """Recompute rollup rows from the issues table, returning how many were missing or had drifted"""
+        existing = {} if missing_only else {
+            stats.project_id: stats for stats in self.session.exec(_existing_statement(project_ids)).all()
+        }
+        dialect_name = self.session.get_bind().dialect.name
+        repaired = 0
+        for rollup in self.session.exec(_rollup_statement(project_ids, missing_only)).mappings().all():
+            stats = existing.get(rollup["project_id"])
+            if stats is None:
+                # Another worker may be filling in the same row, its count is as good as ours
+                repaired += self.session.exec(_insert_statement(dialect_name, rollup)).rowcount
+            elif _repair(stats, rollup):
+                repaired += 1
+        self.session.flush()
+        return repaired
+
+class AsyncProjectIssueStatsRepository:
+    """Async repository for the per-project issue rollup, written in the same transaction as the issues"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(self, changes: dict[int, dict[str, int]]) -> None:
+        """Add column deltas to the projects' rollup rows, recomputing rows that do not exist yet"""
+        now = datetime.now(timezone.utc)
+        missing = []
+        for project_id, deltas in changes.items():
+            result = await self.session.exec(_increment_statement(project_id, deltas, now))
+            if result.rowcount == 0:
+                missing.append(project_id)
+        # The recomputed row already counts this write, a row inserted concurrently does not, so it gets the delta
+        for project_id in await self._insert_missing(missing):
+            await self.session.exec(_increment_statement(project_id, changes[project_id], now))
+
+    async def _insert_missing(self, project_ids: list[int]) -> list[int]:
+        """Insert recomputed rows for projects without one, returning the projects another writer inserted first"""
+        if not project_ids:
+            return []
+        dialect_name = self.session.get_bind().dialect.name
+        rollups = (await self.session.exec(_rollup_statement(project_ids, missing_only=False))).mappings().all()
+        conflicted = []
+        for rollup in rollups:
+            result = await self.session.exec(_insert_statement(dialect_name, rollup))
+            if result.rowcount == 0:
+                conflicted.append(rollup["project_id"])
+        return conflicted
+
+    async def rebuild(self, project_ids: list[int] | None = None, missing_only: bool = False) -> int:
+        """Recompute rollup rows from the issues table, returning how many were missing or had drifted"""
+        existing = {} if missing_only else {
+            stats.project_id: stats for stats in (await self.session.exec(_existing_statement(project_ids))).all()
+        }
+        dialect_name = self.session.get_bind().dialect.name
+        repaired = 0
+        rollups = (await self.session.exec(_rollup_statement(project_ids, missing_only))).mappings().all()
+        for rollup in rollups:
+            stats = existing.get(rollup["project_id"])
+            if stats is None:
+                # Another worker may be filling in the same row, its count is as good as ours
+                result = await self.session.exec(_insert_statement(dialect_name, rollup))
+                repaired += result.rowcount
+            elif _repair(stats, rollup):
+                repaired += 1
+        await self.session.flush()
+        return repaired
@@ -1,7 +1,10 @@
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
-from src.models import Project, ProjectMembership, User
+from typing import Any
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session, select, col
+from src.models import Project, ProjectMembership, User, ProjectStatus, ProjectIssueStats
 from src.dto.project import ProjectUpdate
+from src.pagination import Page, PageParams
 from .base_repository import BaseRepository
 
 class ProjectRepository(BaseRepository[Project]):
@@ -10,16 +13,19 @@ class ProjectRepository(BaseRepository[Project]):
     def __init__(self, session: Session):
         super().__init__(Project, session)
 
+    def _loader_options(self) -> list[Any]:
+        """Load everything ProjectPublic serializes"""
+        return [
+            joinedload(Project.creator),
+            selectinload(Project.members),
+            selectinload(Project.issues),
+            joinedload(Project.issue_stats)
+        ]
+
     def create(self, project: Project) -> Project:
-        """Create a new project"""
-        try:
-            self.session.add(project)
-            self.session.commit()
-            self.session.refresh(project)
-            return project
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        """Create a new project together with its empty issue rollup row"""
+        project.issue_stats = ProjectIssueStats()
+        return self._flush(project)
 
     def update(self, project_id: int, project_update: ProjectUpdate) -> Project | None:
         """Update existing project"""
@@ -29,23 +35,21 @@ class ProjectRepository(BaseRepository[Project]):
         
         update_data = project_update.model_dump(exclude_unset=True)
         
-        try:
-            db_project.sqlmodel_update(update_data)
-            self.session.add(db_project)
-            self.session.commit()
-            self.session.refresh(db_project)
-            return db_project
-        except (ValueError, IntegrityError):
-            self.session.rollback()
-            raise
+        db_project.sqlmodel_update(update_data)
+        return self._flush(db_project)
 
     def get_projects_by_creator(self, creator_id: int) -> list[Project]:
         """Get projects created by a specific user"""
         return self.get_all_by_field("created_by", creator_id)
 
-    def get_projects_by_status(self, status: str) -> list[Project]:
-        """Get projects by status"""
-        return self.get_all_by_field("status", status)
+    def get_projects_by_status(self, status: ProjectStatus, creator_id: int | None = None, member_id: int | None = None) -> list[Project]:
+        """Get projects by status, optionally only those created by or shared with a user"""
+        statement = self._select().where(Project.status == status)
+        if creator_id is not None:
+            statement = statement.where(Project.created_by == creator_id)
+        if member_id is not None:
+            statement = statement.join(ProjectMembership).where(ProjectMembership.user_id == member_id)
+        return list(self.session.exec(statement).all())
 
     def get_user_projects(self, user_id: int) -> list[Project]:
         """Get projects where user is a member"""
@@ -56,30 +60,35 @@ class ProjectRepository(BaseRepository[Project]):
         )
         return list(self.session.exec(statement).all())
 
+    def get_projects_page_by_creator(self, creator_id: int, page_params: PageParams) -> Page[Project]:
+        """Get one page of projects created by a specific user"""
+        return self.get_page(page_params, Project.created_by == creator_id)
+
+    def get_user_projects_page(self, user_id: int, page_params: PageParams) -> Page[Project]:
+        """Get one page of projects where user is a member"""
+        statement = (
+            self._select()
+            .join(ProjectMembership)
+            .where(ProjectMembership.user_id == user_id)
+        )
+        return self._paginate(statement, page_params)
+
     def add_member(self, project_id: int, user_id: int) -> None:
         """Add a member to a project"""
         membership = ProjectMembership(project_id=project_id, user_id=user_id)
-        try:
-            self.session.add(membership)
-            self.session.commit()
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        self.session.add(membership)
+        self.session.flush()
 
     def remove_member(self, project_id: int, user_id: int) -> None:
         """Remove a member from a project"""
-        try:
-            statement = select(ProjectMembership).where(
-                ProjectMembership.project_id == project_id,
-                ProjectMembership.user_id == user_id
-            )
-            membership = self.session.exec(statement).first()
-            if membership:
-                self.session.delete(membership)
-                self.session.commit()
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        statement = select(ProjectMembership).where(
+            ProjectMembership.project_id == project_id,
+            ProjectMembership.user_id == user_id
+        )
+        membership = self.session.exec(statement).first()
+        if membership:
+            self.session.delete(membership)
+            self.session.flush()
 
     def is_member(self, project_id: int | None, user_id: int) -> bool:
         """Check if user is a member of the project"""
@@ -92,11 +101,40 @@ class ProjectRepository(BaseRepository[Project]):
         )
         return self.session.exec(statement).first() is not None
 
+    def get_memberships(self, project_ids: list[int], user_ids: list[int]) -> set[tuple[int, int]]:
+        """Get (project_id, user_id) pairs for every membership between the given projects and users"""
+        if not project_ids or not user_ids:
+            return set()
+
+        statement = select(ProjectMembership.project_id, ProjectMembership.user_id).where(
+            col(ProjectMembership.project_id).in_(project_ids),
+            col(ProjectMembership.user_id).in_(user_ids)
+        )
+        return {(project_id, user_id) for project_id, user_id in self.session.exec(statement).all()}
+
+    def get_project_access(self, user_id: int) -> tuple[set[int], set[int]]:
+        """IDs of the projects a user created and of those they are a member of, in one query"""
+        statement = (
+            select(Project.id, Project.created_by, ProjectMembership.user_id)
+            .outerjoin(ProjectMembership, and_(ProjectMembership.project_id == Project.id, ProjectMembership.user_id == user_id))
+            .where(or_(Project.created_by == user_id, ProjectMembership.user_id == user_id))
+        )
+        created: set[int] = set()
+        member: set[int] = set()
+        for project_id, created_by, member_id in self.session.exec(statement).all():
+            if created_by == user_id:
+                created.add(project_id)
+            if member_id is not None:
+                member.add(project_id)
+        return created, member
+
     def get_project_members(self, project_id: int) -> list[User]:
         """Get all members of a project"""
         statement = (
             select(User)
             .join(ProjectMembership)
             .where(ProjectMembership.project_id == project_id)
+            # Load everything UserPublic serializes
+            .options(selectinload(User.projects), selectinload(User.assigned_issues))
         )
         return list(self.session.exec(statement).all())
\ No newline at end of file
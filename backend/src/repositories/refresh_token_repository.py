@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlmodel import Session, select, col
+from src.models import RefreshToken
+from .base_repository import BaseRepository
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    """Repository for RefreshToken operations"""
+
+    def __init__(self, session: Session):
+        super().__init__(RefreshToken, session)
+
+    def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        """Store a new refresh token"""
+        return self._flush(refresh_token)
+
+    def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        """Get a refresh token by its keyed hash"""
+        statement = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+        return self.session.exec(statement).first()
+
+    def revoke(self, refresh_token: RefreshToken) -> bool:
+        """Revoke one refresh token with a conditional UPDATE, False when another request revoked it first"""
+        statement = (
+            update(RefreshToken)
+            .where(col(RefreshToken.id) == refresh_token.id, col(RefreshToken.revoked_at).is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        return self.session.exec(statement).rowcount == 1
+
+    def revoke_all_for_user(self, user_id: int) -> None:
+        """Revoke every active refresh token of a user in one statement"""
+        statement = (
+            update(RefreshToken)
+            .where(col(RefreshToken.user_id) == user_id, col(RefreshToken.revoked_at).is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        self.session.exec(statement)
@@ -1,6 +1,9 @@
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session
+from datetime import datetime
+from typing import Any
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select, col
 from src.models.user import User
+from src.models.token_revocation import TokenRevocation
 from src.dto.user import UserUpdate
 from .base_repository import BaseRepository
 
@@ -10,16 +13,16 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, session: Session):
         super().__init__(User, session)
 
+    def _loader_options(self) -> list[Any]:
+        """Load everything UserPublic serializes"""
+        return [
+            selectinload(User.projects),
+            selectinload(User.assigned_issues)
+        ]
+
     def create(self, db_user: User) -> User:
         """Create a new user"""
-        try:
-            self.session.add(db_user)
-            self.session.commit()
-            self.session.refresh(db_user)
-            return db_user
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return self._flush(db_user)
 
     def update(self, user_id: int, user_update: UserUpdate | None = None , extra_data: dict | None = None) -> User | None:
         """Update existing user"""
@@ -32,15 +35,8 @@ class UserRepository(BaseRepository[User]):
         if user_update:
             update_data = user_update.model_dump(exclude_unset=True)
         
-        try:
-            db_user.sqlmodel_update(update_data, update=extra_data)
-            self.session.add(db_user)
-            self.session.commit()
-            self.session.refresh(db_user)
-            return db_user
-        except (ValueError, IntegrityError):
-            self.session.rollback()
-            raise
+        db_user.sqlmodel_update(update_data, update=extra_data)
+        return self._flush(db_user)
 
     def get_by_username(self, username: str) -> User | None:
         """Get user by username"""
@@ -52,17 +48,42 @@ class UserRepository(BaseRepository[User]):
 
     def get_active_users(self) -> list[User]:
         """Get all active users"""
-        return self.get_all_by_field("is_active", True)
+        statement = self._select().where(User.is_active == True)
+        return list(self.session.exec(statement).all())
 
     def get_users_by_role(self, role: str) -> list[User]:
         """Get users by role"""
-        return self.get_all_by_field("role", role)
+        statement = self._select().where(User.role == role)
+        return list(self.session.exec(statement).all())
 
     def deactivate_user(self, user_id: int) -> User | None:
         """Deactivate a user"""
         user_update = UserUpdate(is_active=False)
         return self.update(user_id, user_update)
 
+    def bump_token_version(self, user_id: int) -> User | None:
+        """Increment a user's token version and record it, invalidating tokens that carry an older one in every worker"""
+        db_user = self.get_by_id(user_id)
+        if not db_user:
+            return None
+        
+        db_user.token_version += 1
+        self.session.add(TokenRevocation(user_id=user_id, token_version=db_user.token_version))
+        return self._flush(db_user)
+
+    def delete(self, id: int) -> bool:
+        """Delete a user, recording a revocation of all their tokens in the same transaction"""
+        if not self.get_by_id(id):
+            return False
+        
+        self.session.add(TokenRevocation(user_id=id))
+        return super().delete(id)
+
+    def get_token_revocations(self, since: datetime) -> list[TokenRevocation]:
+        """Get the token revocations recorded at or after a naive UTC time"""
+        statement = select(TokenRevocation).where(col(TokenRevocation.revoked_at) >= since)
+        return list(self.session.exec(statement).all())
+
     def activate_user(self, user_id: int) -> User | None:
         """Activate a user"""
         user_update = UserUpdate(is_active=True)
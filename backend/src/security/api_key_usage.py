@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from threading import Lock
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from src.config import settings
+from src.database import get_database
+from src.repositories.api_key_repository import ApiKeyRepository
+
+logger = logging.getLogger("sprintdesk.auth")
+
+class ApiKeyUsageTracker:
+    """Collects API key last-used times in memory so they are written in batches, not on every request"""
+
+    def __init__(self) -> None:
+        self._last_used: dict[int, datetime] = {}
+        self._lock = Lock()
+
+    def record(self, api_key_id: int) -> None:
+        """Note that a key was just used"""
+        with self._lock:
+            self._last_used[api_key_id] = datetime.now(timezone.utc)
+
+    def flush(self, session: Session) -> int:
+        """Write and commit pending last-used times, returning how many keys were updated"""
+        with self._lock:
+            pending, self._last_used = self._last_used, {}
+        if not pending:
+            return 0
+
+        try:
+            ApiKeyRepository(session).update_last_used(pending)
+            session.commit()
+        except Exception:
+            session.rollback()
+            # Keep them for the next flush, unless the key was used again meanwhile
+            with self._lock:
+                self._last_used = {**pending, **self._last_used}
+            raise
+        return len(pending)
+
+    def __len__(self) -> int:
+        return len(self._last_used)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._last_used.clear()
+
+api_key_usage = ApiKeyUsageTracker()
+
+def flush_api_key_usage() -> None:
+    """Write pending last-used times on the primary database"""
+    if not api_key_usage:
+        return
+    try:
+        with get_database().get_session() as session:
+            api_key_usage.flush(session)
+    except Exception:
+        logger.exception("Failed to write API key usage")
+
+async def flush_api_key_usage_periodically() -> None:
+    """Background loop writing API key usage every API_KEY_USAGE_FLUSH_SECONDS"""
+    while True:
+        await asyncio.sleep(settings.api_key_usage_flush_seconds)
+        await run_in_threadpool(flush_api_key_usage)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from src.models.enums import UserRole
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Role and project access of the current user, built once per request"""
+    user_id: int
+    role: UserRole
+    created_project_ids: frozenset[int] = field(default_factory=frozenset)
+    member_project_ids: frozenset[int] = field(default_factory=frozenset)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == UserRole.ADMIN
+
+    def manages_project(self, project_id: int | None) -> bool:
+        """Admins manage every project, Project Managers the projects they created"""
+        if self.is_admin:
+            return True
+        return self.role == UserRole.PROJECT_MANAGER and project_id in self.created_project_ids
+
+    def is_member(self, project_id: int | None) -> bool:
+        """Check if the user is a member of the project"""
+        return project_id in self.member_project_ids
+
+    def can_access_project(self, project_id: int | None) -> bool:
+        """View the project, its issues and comments, create issues and comment in it"""
+        return self.manages_project(project_id) or self.is_member(project_id)
@@ -1,42 +1,98 @@
-from fastapi import Depends, HTTPException, status
+from typing import Awaitable, Callable
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
-from src.database import get_db_session
-from src.repositories import UserRepository, ProjectRepository, IssueRepository, LabelRepository, CommentRepository
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.config import settings
+from src.database import READ_METHODS, get_db_session, get_async_db_session
+from src.repositories import UserRepository, ProjectRepository, IssueRepository, LabelRepository, CommentRepository, ApiKeyRepository, DashboardRepository, FlowSnapshotRepository
+from src.repositories import AsyncUserRepository, AsyncProjectRepository, AsyncIssueRepository, AsyncLabelRepository, AsyncCommentRepository, AsyncApiKeyRepository
 from src.services.auth_service import AuthService
 from src.services.user_service import UserService
+from src.services.api_key_service import ApiKeyService
 from src.services.issue_service import IssueService
 from src.services.project_service import ProjectService
 from src.services.comment_service import CommentService
 from src.services.label_service import LabelService
+from src.services.dashboard_service import DashboardService
+from src.services.flow_service import FlowService
+from src.services.async_issue_service import AsyncIssueService
+from src.services.async_project_service import AsyncProjectService
+from src.services.async_comment_service import AsyncCommentService
 from src.models.user import User
-from src.exceptions.user_exceptions import InvalidUsernameError, UserNotFoundError
-from src.exceptions.auth_exceptions import InvalidTokenError, InvalidTokenPayloadError
+from src.models.enums import UserRole, ApiKeyScope
+from src.models.api_key import ApiKey
+from src.dto.auth import TokenData
+from src.security.auth_context import AuthContext
+from src.security.principal_cache import Principal, principal_cache
+from src.security.token_versions import token_versions
+from src.security.rate_limiter import rate_limiter
+from src.security.security import is_api_key, hash_api_key, hash_refresh_token
+from src.exceptions.user_exceptions import UserNotFoundError
+from src.exceptions.api_key_exceptions import InvalidApiKeyError, ApiKeyScopeError
+from src.exceptions.auth_exceptions import InvalidTokenError, InvalidTokenPayloadError, RateLimitExceededError
 
 security = HTTPBearer()
 
+def _api_key_user(request: Request, api_key: ApiKey | None) -> User:
+    """User of an API key, which needs the write scope for anything but reads"""
+    required_scope = ApiKeyScope.READ if request.method in READ_METHODS else ApiKeyScope.WRITE
+    try:
+        return ApiKeyService.authenticate(api_key, required_scope)
+    except ApiKeyScopeError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
+
+def _check_token_version(token_data: TokenData, token_version: int) -> None:
+    """Reject a token minted before the user's token version was bumped"""
+    if token_data.token_version is not None and token_data.token_version != token_version:
+        raise InvalidTokenError()
+
+def _trusts_claims(request: Request, token_data: TokenData) -> bool:
+    """Check if a read request can use the token's role claim without loading the user"""
+    return (
+        settings.stateless_auth_enabled
+        and request.method in READ_METHODS
+        and token_data.role is not None
+        and token_data.token_version is not None
+    )
+
+def _principal_from_claims(token_data: TokenData) -> Principal | None:
+    """Principal built from token claims alone, None when the tracker knows the token is stale"""
+    if token_versions.is_stale(token_data.user_id, token_data.token_version or 0):
+        return None
+    return Principal(
+        id=token_data.user_id,
+        role=UserRole(token_data.role),
+        is_active=True,
+        token_version=token_data.token_version or 0
+    )
+
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: Session = Depends(get_db_session)
 ) -> User:
     """
-    Get current user from JWT token
+    Get current user from JWT token or API key
     """
     user_repository = UserRepository(session)
-    auth_service = AuthService(user_repository)
     
     try:
-        token_data = auth_service.get_current_user_data(credentials.credentials)
-        if not token_data.user_id:
-            raise InvalidTokenPayloadError()
+        if is_api_key(credentials.credentials):
+            api_key = ApiKeyRepository(session).get_by_hash(hash_api_key(credentials.credentials))
+            return _api_key_user(request, api_key)
+        
+        token_data = AuthService.get_token_data(credentials.credentials)
         
         user = user_repository.get_by_id(token_data.user_id)
         if not user:
-            raise InvalidUsernameError()
+            raise UserNotFoundError()
+        _check_token_version(token_data, user.token_version)
         
+        principal_cache.put(Principal.from_user(user))
         return user
     
-    except (InvalidUsernameError, InvalidTokenError, InvalidTokenPayloadError, UserNotFoundError) as e:
+    except (InvalidTokenError, InvalidTokenPayloadError, UserNotFoundError, InvalidApiKeyError) as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=e.message,
@@ -54,29 +110,319 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
             )
     return current_user
 
-def get_project_service(session: Session = Depends(get_db_session)) -> ProjectService:
+def _active_principal(principal: Principal) -> Principal:
+    """Reject principals of deactivated users"""
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user"
+            )
+    return principal
+
+def get_current_principal(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: Session = Depends(get_db_session)
+) -> Principal:
+    """
+    Get the active current user's id and role from JWT token, reading the users table only on a principal cache miss
+    or, in stateless mode, only for writes and stale tokens. API keys are looked up on every request
+    """
+    try:
+        if is_api_key(credentials.credentials):
+            api_key = ApiKeyRepository(session).get_by_hash(hash_api_key(credentials.credentials))
+            return _active_principal(Principal.from_user(_api_key_user(request, api_key)))
+        
+        token_data = AuthService.get_token_data(credentials.credentials)
+        user_repository = UserRepository(session)
+        
+        principal = None
+        if _trusts_claims(request, token_data):
+            if token_versions.is_due():
+                token_versions.merge(user_repository.get_token_revocations(token_versions.since()))
+            principal = _principal_from_claims(token_data)
+        
+        if principal is None:
+            principal = principal_cache.get(token_data.user_id)
+        if principal is None:
+            user = user_repository.get_by_id(token_data.user_id)
+            if not user:
+                raise UserNotFoundError()
+            principal = Principal.from_user(user)
+            principal_cache.put(principal)
+        _check_token_version(token_data, principal.token_version)
+    
+    except (InvalidTokenError, InvalidTokenPayloadError, UserNotFoundError, InvalidApiKeyError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return _active_principal(principal)
+
+def get_current_admin(current_user: Principal = Depends(get_current_principal)) -> Principal:
+    """Get the current principal, rejecting everyone but admins with 403"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can access this resource.")
+    return current_user
+
+async def get_current_user_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_async_db_session)
+) -> User:
+    """
+    Get current user from JWT token or API key without leaving the event loop
+    """
+    user_repository = AsyncUserRepository(session)
+
+    try:
+        if is_api_key(credentials.credentials):
+            api_key = await AsyncApiKeyRepository(session).get_by_hash(hash_api_key(credentials.credentials))
+            return _api_key_user(request, api_key)
+
+        token_data = AuthService.get_token_data(credentials.credentials)
+
+        user = await user_repository.get_by_id(token_data.user_id)
+        if not user:
+            raise UserNotFoundError()
+        _check_token_version(token_data, user.token_version)
+
+        principal_cache.put(Principal.from_user(user))
+        return user
+
+    except (InvalidTokenError, InvalidTokenPayloadError, UserNotFoundError, InvalidApiKeyError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """
+    Async dependency to ensure user is active
+    """
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user"
+            )
+    return current_user
+
+async def get_current_principal_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_async_db_session)
+) -> Principal:
+    """
+    Async dependency for the active current user's id and role, reading the users table only on a principal cache miss
+    or, in stateless mode, only for writes and stale tokens. API keys are looked up on every request
+    """
+    try:
+        if is_api_key(credentials.credentials):
+            api_key = await AsyncApiKeyRepository(session).get_by_hash(hash_api_key(credentials.credentials))
+            return _active_principal(Principal.from_user(_api_key_user(request, api_key)))
+
+        token_data = AuthService.get_token_data(credentials.credentials)
+        user_repository = AsyncUserRepository(session)
+
+        principal = None
+        if _trusts_claims(request, token_data):
+            if token_versions.is_due():
+                token_versions.merge(await user_repository.get_token_revocations(token_versions.since()))
+            principal = _principal_from_claims(token_data)
+
+        if principal is None:
+            principal = principal_cache.get(token_data.user_id)
+        if principal is None:
+            user = await user_repository.get_by_id(token_data.user_id)
+            if not user:
+                raise UserNotFoundError()
+            principal = Principal.from_user(user)
+            principal_cache.put(principal)
+        _check_token_version(token_data, principal.token_version)
+
+    except (InvalidTokenError, InvalidTokenPayloadError, UserNotFoundError, InvalidApiKeyError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return _active_principal(principal)
+
+def get_auth_context(
+    current_user: Principal = Depends(get_current_principal),
+    session: Session = Depends(get_db_session)
+) -> AuthContext:
+    """
+    Load the current user's project access once per request
+    """
+    if current_user.role == UserRole.ADMIN:
+        return AuthContext(user_id=current_user.id, role=current_user.role)
+
+    created_project_ids, member_project_ids = ProjectRepository(session).get_project_access(current_user.id)
+    return AuthContext(
+        user_id=current_user.id,
+        role=current_user.role,
+        created_project_ids=frozenset(created_project_ids),
+        member_project_ids=frozenset(member_project_ids)
+    )
+
+async def get_auth_context_async(
+    current_user: Principal = Depends(get_current_principal_async),
+    session: AsyncSession = Depends(get_async_db_session)
+) -> AuthContext:
+    """
+    Async dependency loading the current user's project access once per request
+    """
+    if current_user.role == UserRole.ADMIN:
+        return AuthContext(user_id=current_user.id, role=current_user.role)
+
+    created_project_ids, member_project_ids = await AsyncProjectRepository(session).get_project_access(current_user.id)
+    return AuthContext(
+        user_id=current_user.id,
+        role=current_user.role,
+        created_project_ids=frozenset(created_project_ids),
+        member_project_ids=frozenset(member_project_ids)
+    )
+
+def _client_address(request: Request) -> str:
+    """The caller's address, taken from X-Forwarded-For only when the direct peer is a trusted proxy"""
+    address = request.client.host if request.client else ""
+    if address not in settings.trusted_proxies:
+        return address
+    # Rightmost hop not added by one of our proxies, anything left of it is client supplied
+    for hop in reversed(request.headers.get("x-forwarded-for", "").split(",")):
+        hop = hop.strip()
+        if hop and hop not in settings.trusted_proxies:
+            return hop
+    return address
+
+def _rate_limit_key(request: Request, by_user: bool) -> str:
+    """Identify the caller for rate limiting, by user id when the bearer token is valid, else by client address"""
+    authorization = request.headers.get("authorization", "")
+    if by_user and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+        if is_api_key(token):
+            return f"key:{hash_api_key(token)}"
+        try:
+            return f"user:{AuthService.get_token_data(token).user_id}"
+        except (InvalidTokenError, InvalidTokenPayloadError):
+            pass
+    return f"ip:{_client_address(request)}"
+
+async def _auth_credential(request: Request) -> str:
+    """The account a sign-in request targets, the submitted username or a digest of the refresh token"""
+    try:
+        body = await request.json()
+    except ValueError:
+        return ""
+    if not isinstance(body, dict):
+        return ""
+    if isinstance(body.get("username"), str):
+        return f"user:{body['username'][:150]}"
+    if isinstance(body.get("refresh_token"), str):
+        return f"refresh:{hash_refresh_token(body['refresh_token'])}"
+    return ""
+
+def rate_limit(group: str | None = None) -> Callable[[Request], Awaitable[None]]:
+    """
+    Dependency spending one request from the caller's bucket, reads and writes are told apart by method unless a group is given
+    """
+    async def check_rate_limit(request: Request) -> None:
+        route_group = group or ("reads" if request.method in READ_METHODS else "writes")
+        try:
+            if route_group == "auth":
+                # Per address and account, so users behind one NAT or proxy do not share a bucket,
+                # with a looser per address cap on top against one address spraying many accounts
+                address_key = _rate_limit_key(request, by_user=False)
+                rate_limiter.check("auth_address", address_key)
+                rate_limiter.check("auth", f"{address_key}:{await _auth_credential(request)}")
+            else:
+                rate_limiter.check(route_group, _rate_limit_key(request, by_user=True))
+        except RateLimitExceededError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=e.message,
+                headers={"Retry-After": str(e.retry_after)}
+            )
+    return check_rate_limit
+
+def get_project_service(
+    session: Session = Depends(get_db_session),
+    auth_context: AuthContext = Depends(get_auth_context)
+) -> ProjectService:
     project_repository = ProjectRepository(session)
     user_repository = UserRepository(session)
-    return ProjectService(project_repository, user_repository)
+    return ProjectService(project_repository, user_repository, auth_context)
 
 def get_user_service(session: Session = Depends(get_db_session)) -> UserService:
     user_repository = UserRepository(session)
     return UserService(user_repository)
 
-def get_issue_service(session: Session = Depends(get_db_session)) -> IssueService:
+def get_api_key_service(session: Session = Depends(get_db_session)) -> ApiKeyService:
+    api_key_repository = ApiKeyRepository(session)
+    user_repository = UserRepository(session)
+    return ApiKeyService(api_key_repository, user_repository)
+
+def get_issue_service(
+    session: Session = Depends(get_db_session),
+    auth_context: AuthContext = Depends(get_auth_context)
+) -> IssueService:
     issue_repository = IssueRepository(session)
     project_repository = ProjectRepository(session)
     user_repository = UserRepository(session)
     label_repository = LabelRepository(session)
-    return IssueService(issue_repository, project_repository, user_repository, label_repository)
+    return IssueService(issue_repository, project_repository, user_repository, label_repository, auth_context)
 
-def get_comment_service(session: Session = Depends(get_db_session)) -> CommentService:
+def get_comment_service(
+    session: Session = Depends(get_db_session),
+    auth_context: AuthContext = Depends(get_auth_context)
+) -> CommentService:
     comment_repository = CommentRepository(session)
     issue_repository = IssueRepository(session)
-    project_repository = ProjectRepository(session)
-    return CommentService(comment_repository, issue_repository, project_repository)
+    return CommentService(comment_repository, issue_repository, auth_context)
 
 def get_label_service(session: Session = Depends(get_db_session)) -> LabelService:
     label_repository = LabelRepository(session)
     return LabelService(label_repository)
 
+def get_dashboard_service(session: Session = Depends(get_db_session)) -> DashboardService:
+    dashboard_repository = DashboardRepository(session)
+    return DashboardService(dashboard_repository)
+
+def get_flow_service(
+    session: Session = Depends(get_db_session),
+    auth_context: AuthContext = Depends(get_auth_context)
+) -> FlowService:
+    flow_snapshot_repository = FlowSnapshotRepository(session)
+    project_repository = ProjectRepository(session)
+    return FlowService(flow_snapshot_repository, project_repository, auth_context)
+
+async def get_async_project_service(
+    session: AsyncSession = Depends(get_async_db_session),
+    auth_context: AuthContext = Depends(get_auth_context_async)
+) -> AsyncProjectService:
+    project_repository = AsyncProjectRepository(session)
+    user_repository = AsyncUserRepository(session)
+    return AsyncProjectService(project_repository, user_repository, auth_context)
+
+async def get_async_issue_service(
+    session: AsyncSession = Depends(get_async_db_session),
+    auth_context: AuthContext = Depends(get_auth_context_async)
+) -> AsyncIssueService:
+    issue_repository = AsyncIssueRepository(session)
+    project_repository = AsyncProjectRepository(session)
+    user_repository = AsyncUserRepository(session)
+    label_repository = AsyncLabelRepository(session)
+    return AsyncIssueService(issue_repository, project_repository, user_repository, label_repository, auth_context)
+
+async def get_async_comment_service(
+    session: AsyncSession = Depends(get_async_db_session),
+    auth_context: AuthContext = Depends(get_auth_context_async)
+) -> AsyncCommentService:
+    comment_repository = AsyncCommentRepository(session)
+    issue_repository = AsyncIssueRepository(session)
+    return AsyncCommentService(comment_repository, issue_repository, auth_context)
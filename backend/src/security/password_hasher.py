@@ -0,0 +1,136 @@
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+from typing import Callable, TypeVar
+from src.config import settings
+from src.exceptions.auth_exceptions import PasswordHasherBusyError
+from src.security.security import get_password_hash, verify_and_update_password
+
+logger = logging.getLogger("sprintdesk.auth")
+
+T = TypeVar("T")
+
+@dataclass
+class PasswordHashMetrics:
+    """Queue depth and latency of the password hashing pool"""
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    running: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait_ms: float = 0.0
+    total_hash_ms: float = 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        """Current values, with average wait and hash latency"""
+        return {
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_ms / self.completed, 2) if self.completed else 0.0,
+            "avg_hash_ms": round(self.total_hash_ms / self.completed, 2) if self.completed else 0.0
+        }
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated bounded thread pool so a login storm cannot starve the request threadpool"""
+
+    def __init__(self, workers: int, queue_limit: int, retry_after_seconds: int) -> None:
+        self.workers = workers
+        self.retry_after_seconds = retry_after_seconds
+        self.metrics = PasswordHashMetrics()
+        # Running plus waiting jobs, anything beyond is turned away
+        self._slots = BoundedSemaphore(workers + queue_limit)
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _timed(self, fn: Callable[..., T], args: tuple, queued_at: float) -> T:
+        started_at = time.perf_counter()
+        with self._lock:
+            self.metrics.queue_depth -= 1
+            self.metrics.running += 1
+            self.metrics.total_wait_ms += (started_at - queued_at) * 1000
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.metrics.running -= 1
+                self.metrics.completed += 1
+                self.metrics.total_hash_ms += (time.perf_counter() - started_at) * 1000
+
+    def _release(self, future: Future) -> None:
+        # A job cancelled before it started never left the queue
+        if future.cancelled():
+            with self._lock:
+                self.metrics.queue_depth -= 1
+        self._slots.release()
+
+    def _submit(self, fn: Callable[..., T], args: tuple) -> "Future[T]":
+        """Queue fn on the pool, or raise PasswordHasherBusyError when the queue is full"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.metrics.rejected += 1
+                snapshot = self.metrics.snapshot()
+            logger.warning(json.dumps({"event": "password_hash_rejected", **snapshot}))
+            raise PasswordHasherBusyError(self.retry_after_seconds)
+
+        try:
+            with self._lock:
+                self.metrics.queue_depth += 1
+                self.metrics.peak_queue_depth = max(self.metrics.peak_queue_depth, self.metrics.queue_depth)
+            future = self._get_executor().submit(self._timed, fn, args, time.perf_counter())
+        except BaseException:
+            with self._lock:
+                self.metrics.queue_depth -= 1
+            self._slots.release()
+            raise
+        # The slot is held until the job is done, even if the caller stopped waiting
+        future.add_done_callback(self._release)
+        return future
+
+    def run(self, fn: Callable[..., T], *args) -> T:
+        """Run fn on the pool and block until it is done, for callers already on a worker thread"""
+        return self._submit(fn, args).result()
+
+    async def run_async(self, fn: Callable[..., T], *args) -> T:
+        """Run fn on the pool and await it, so a waiting request holds no threadpool thread"""
+        return await asyncio.wrap_future(self._submit(fn, args))
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured cost"""
+        return self.run(get_password_hash, password)
+
+    def verify_and_update(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        """Verify a password, plus a new hash when the stored one uses an outdated cost"""
+        return self.run(verify_and_update_password, password, password_hash)
+
+    async def hash_async(self, password: str) -> str:
+        """Hash a password with the configured cost, without holding a thread while queued"""
+        return await self.run_async(get_password_hash, password)
+
+    async def verify_and_update_async(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        """Verify a password and rehash outdated costs, without holding a thread while queued"""
+        return await self.run_async(verify_and_update_password, password, password_hash)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+password_hasher = PasswordHasher(
+    settings.password_hash_workers,
+    settings.password_hash_queue_limit,
+    settings.password_hash_retry_after_seconds
+)
@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from src.config import settings
+from src.models.user import User
+from src.models.enums import UserRole
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user's id, role and active flag, all most endpoints need"""
+    id: int
+    role: UserRole
+    is_active: bool
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id or 0, role=user.role, is_active=user.is_active, token_version=user.token_version)
+
+class PrincipalCache:
+    """Short-lived in-process cache of principals so most requests skip the users table"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[int, tuple[Principal, float]] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: int) -> Principal | None:
+        """Get a cached principal, None when missing or expired"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        principal, cached_at = entry
+        if time.monotonic() - cached_at >= self.ttl_seconds:
+            return None
+        return principal
+
+    def put(self, principal: Principal) -> None:
+        """Cache a principal loaded from the database"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._prune(now)
+            self._entries[principal.id] = (principal, now)
+
+    def invalidate(self, user_id: int) -> None:
+        """Forget a user after their role, active flag or existence changed"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, and the oldest ones if still full"""
+        self._entries = {
+            user_id: entry for user_id, entry in self._entries.items()
+            if now - entry[1] < self.ttl_seconds
+        }
+        while len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+principal_cache = PrincipalCache(settings.principal_cache_ttl_seconds)
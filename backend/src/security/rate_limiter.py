@@ -0,0 +1,112 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from src.config import settings
+from src.exceptions.auth_exceptions import RateLimitExceededError
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket holding `capacity` requests, refilled evenly over `period_seconds`"""
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse "<requests>/<seconds>", e.g. "10/60" """
+        capacity, period_seconds = value.split("/")
+        return cls(capacity=int(capacity), period_seconds=float(period_seconds))
+
+class BucketStore(ABC):
+    """Where bucket levels live, swap in a shared store to limit across worker processes"""
+
+    @abstractmethod
+    def take(self, key: str, limit: RateLimit) -> float:
+        """Take one token from the key's bucket, returning 0 on success or the seconds until one is available"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every bucket"""
+
+class InMemoryBucketStore(BucketStore):
+    """Per-process buckets in an LRU map, idle buckets are evicted first when it is full"""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        # key -> (tokens left, last update, seconds to refill completely)
+        self._buckets: OrderedDict[str, tuple[float, float, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def take(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_entries:
+                    self._prune(now)
+                tokens = float(limit.capacity)
+            else:
+                tokens, updated_at, _ = bucket
+                tokens = min(float(limit.capacity), tokens + (now - updated_at) * limit.refill_per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / limit.refill_per_second
+
+            self._buckets[key] = (tokens, now, (limit.capacity - tokens) / limit.refill_per_second)
+            self._buckets.move_to_end(key)
+        return retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that refilled completely, a new bucket would be identical, then the least recently used"""
+        self._buckets = OrderedDict(
+            (key, bucket) for key, bucket in self._buckets.items()
+            if now - bucket[1] < bucket[2]
+        )
+        while len(self._buckets) >= self.max_entries:
+            self._buckets.popitem(last=False)
+
+class RateLimiter:
+    """Token bucket rate limiting per route group and client"""
+
+    def __init__(self, store: BucketStore, limits: dict[str, RateLimit], enabled: bool = True) -> None:
+        self.store = store
+        self.limits = limits
+        self.enabled = enabled
+
+    def check(self, group: str, client_key: str) -> None:
+        """Spend one request of the client's bucket for this group, or raise RateLimitExceededError"""
+        limit = self.limits.get(group)
+        if not self.enabled or limit is None:
+            return
+
+        retry_after = self.store.take(f"{group}:{client_key}", limit)
+        if retry_after > 0:
+            raise RateLimitExceededError(max(1, math.ceil(retry_after)))
+
+rate_limiter = RateLimiter(
+    InMemoryBucketStore(settings.rate_limit_max_buckets),
+    {
+        "auth": RateLimit.parse(settings.rate_limit_auth),
+        "auth_address": RateLimit.parse(settings.rate_limit_auth_per_address),
+        "reads": RateLimit.parse(settings.rate_limit_reads),
+        "writes": RateLimit.parse(settings.rate_limit_writes),
+        "bulk": RateLimit.parse(settings.rate_limit_bulk)
+    },
+    enabled=settings.rate_limit_enabled
+)
@@ -1,26 +1,58 @@
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from src.config import settings
 from src.exceptions.auth_exceptions import InvalidTokenError
+from src.security.token_cache import token_cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+API_KEY_PREFIX = "sdk_"
 
-def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
-    """Create JWT access token"""
+# Pinning min and max to the configured cost flags hashes made with any other cost for rehashing
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds
+)
+
+def create_access_token(subject: str | Any, expires_delta: timedelta | None = None, claims: dict[str, Any] | None = None) -> str:
+    """Create JWT access token, with optional extra claims"""
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {**(claims or {}), "exp": expire, "sub": str(subject)}
     try:
         encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     except JWTError:
         raise InvalidTokenError("Failed to create access token.")
     return encoded_jwt
 
+def create_refresh_token() -> str:
+    """Create an opaque random refresh token"""
+    return secrets.token_urlsafe(32)
+
+def hash_refresh_token(token: str) -> str:
+    """Keyed hash of a refresh token for storage, fast because the token is already high entropy"""
+    return hmac.new(settings.secret_key.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+def create_api_key() -> str:
+    """Create a random API key, prefixed so it can be told apart from a JWT"""
+    return API_KEY_PREFIX + secrets.token_urlsafe(32)
+
+def is_api_key(token: str) -> bool:
+    return token.startswith(API_KEY_PREFIX)
+
+def hash_api_key(api_key: str) -> str:
+    """Keyed hash of an API key for storage and lookup, no bcrypt needed for a high entropy key"""
+    return hmac.new(settings.secret_key.encode(), api_key.encode(), hashlib.sha256).hexdigest()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -29,10 +61,20 @@ def get_password_hash(password: str) -> str:
     """Hash password"""
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify password against hash, plus a new hash when the stored one uses an outdated cost"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def decode_token(token: str) -> dict[str, Any]:
-    """Decode JWT token"""
+    """Decode JWT token, skipping verification for tokens verified before"""
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=settings.algorithm)
-        return payload
     except JWTError:
-        raise InvalidTokenError()
\ No newline at end of file
+        raise InvalidTokenError()
+
+    token_cache.put(token, payload)
+    return payload
\ No newline at end of file
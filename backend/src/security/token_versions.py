@@ -0,0 +1,81 @@
+import time
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Iterable
+from src.config import settings
+from src.models.token_revocation import TokenRevocation
+
+# Rows committed late or stamped by a worker with a slower clock are still picked up, reloading them is harmless
+REVOCATION_OVERLAP = timedelta(seconds=60)
+
+def _utc_now_naive() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class TokenVersionTracker:
+    """In-memory view of recent token revocations, so stateless auth can spot stale tokens without a query"""
+
+    def __init__(self, refresh_seconds: float, retention_seconds: float) -> None:
+        self.refresh_seconds = refresh_seconds
+        # Tokens minted before a revocation expire within this, so older revocations can be forgotten
+        self.retention = timedelta(seconds=retention_seconds)
+        # Lowest valid version per user, None when the user was deleted, with when it was revoked
+        self._revocations: dict[int, tuple[int | None, datetime]] = {}
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._lock = Lock()
+
+    def is_due(self) -> bool:
+        """Check if new revocations should be loaded from the database"""
+        with self._lock:
+            return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_seconds
+
+    def since(self) -> datetime:
+        """Naive UTC time to load revocations from, the last one seen or the retention window on the first load"""
+        with self._lock:
+            if self._watermark is None:
+                return _utc_now_naive() - self.retention
+            return self._watermark - REVOCATION_OVERLAP
+
+    def merge(self, revocations: Iterable[TokenRevocation]) -> None:
+        """Add revocations loaded from the database and forget the ones whose tokens have expired"""
+        with self._lock:
+            for revocation in revocations:
+                self._record(revocation.user_id, revocation.token_version, revocation.revoked_at)
+                self._watermark = max(self._watermark or revocation.revoked_at, revocation.revoked_at)
+            cutoff = _utc_now_naive() - self.retention
+            self._revocations = {
+                user_id: entry for user_id, entry in self._revocations.items() if entry[1] >= cutoff
+            }
+            self._refreshed_at = time.monotonic()
+
+    def bump(self, user_id: int, version: int) -> None:
+        """Record a version bumped by this process"""
+        with self._lock:
+            self._record(user_id, version, _utc_now_naive())
+
+    def mark_deleted(self, user_id: int) -> None:
+        """Treat every token of a user deleted by this process as stale"""
+        with self._lock:
+            self._record(user_id, None, _utc_now_naive())
+
+    def _record(self, user_id: int, version: int | None, revoked_at: datetime) -> None:
+        current = self._revocations.get(user_id)
+        if current is not None:
+            # A deletion outranks any version
+            version = None if version is None or current[0] is None else max(version, current[0])
+            revoked_at = max(revoked_at, current[1])
+        self._revocations[user_id] = (version, revoked_at)
+
+    def is_stale(self, user_id: int, version: int) -> bool:
+        """Check if a token version is older than the user's current one"""
+        with self._lock:
+            entry = self._revocations.get(user_id)
+            return entry is not None and (entry[0] is None or version < entry[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revocations.clear()
+            self._watermark = None
+            self._refreshed_at = None
+
+token_versions = TokenVersionTracker(settings.token_version_refresh_seconds, settings.access_token_expire_minutes * 60)
@@ -0,0 +1,66 @@
+from src.dto.api_key import ApiKeyCreate
+from src.models import ApiKey, User, UserRole, ApiKeyScope
+from src.repositories import ApiKeyRepository, UserRepository
+from src.security.security import create_api_key, hash_api_key
+from src.security.api_key_usage import api_key_usage
+from src.exceptions.api_key_exceptions import ApiKeyNotFoundError, InvalidApiKeyError, ApiKeyScopeError
+from src.exceptions.user_exceptions import UserNotFoundError
+from src.exceptions.auth_exceptions import NotAuthorizedError
+
+class ApiKeyService:
+    """Service for service-account API keys"""
+
+    def __init__(self, api_key_repository: ApiKeyRepository, user_repository: UserRepository):
+        self.api_key_repository = api_key_repository
+        self.user_repository = user_repository
+
+    def create_api_key(self, api_key_create: ApiKeyCreate, current_user_id: int, current_user_role: UserRole) -> tuple[ApiKey, str]:
+        """Create an API key, returning it together with the plain key that is shown only once"""
+        user_id = api_key_create.user_id or current_user_id
+        if user_id != current_user_id and current_user_role != UserRole.ADMIN:
+            raise NotAuthorizedError("Only admins can create API keys for other users.")
+
+        if not self.user_repository.get_by_id(user_id):
+            raise UserNotFoundError()
+
+        plain_key = create_api_key()
+        api_key = self.api_key_repository.create(ApiKey(
+            user_id=user_id,
+            name=api_key_create.name,
+            key_prefix=plain_key[:12],
+            key_hash=hash_api_key(plain_key),
+            scopes=[scope.value for scope in dict.fromkeys(api_key_create.scopes)]
+        ))
+        return api_key, plain_key
+
+    def get_api_keys(self, user_id: int, current_user_id: int, current_user_role: UserRole) -> list[ApiKey]:
+        """Get a user's API keys (own keys, or any user's for admins)"""
+        if user_id != current_user_id and current_user_role != UserRole.ADMIN:
+            raise NotAuthorizedError("You can only view your own API keys.")
+
+        return self.api_key_repository.get_by_user(user_id)
+
+    def revoke_api_key(self, api_key_id: int, current_user_id: int, current_user_role: UserRole) -> ApiKey:
+        """Revoke an API key (owner or admin)"""
+        api_key = self.api_key_repository.get_by_id(api_key_id)
+        if not api_key:
+            raise ApiKeyNotFoundError()
+
+        if api_key.user_id != current_user_id and current_user_role != UserRole.ADMIN:
+            raise NotAuthorizedError("You can only revoke your own API keys.")
+
+        if api_key.revoked_at is not None:
+            return api_key
+        return self.api_key_repository.revoke(api_key)
+
+    @staticmethod
+    def authenticate(api_key: ApiKey | None, required_scope: ApiKeyScope) -> User:
+        """Check a looked up API key against the scope a request needs and return its user"""
+        if not api_key or api_key.revoked_at is not None:
+            raise InvalidApiKeyError()
+
+        if required_scope.value not in api_key.scopes:
+            raise ApiKeyScopeError()
+
+        api_key_usage.record(api_key.id or 0)
+        return api_key.user
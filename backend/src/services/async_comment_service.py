@@ -0,0 +1,117 @@
+from src.dto.comment import CommentCreate, CommentUpdate
+from src.models import Comment, Issue
+from src.exceptions.issue_exceptions import IssueNotFoundError
+from src.exceptions.comment_exceptions import CommentNotFoundError
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.repositories import AsyncCommentRepository, AsyncIssueRepository
+from src.models.enums import UserRole
+from src.pagination import Page, PageParams
+from src.security.auth_context import AuthContext
+
+class AsyncCommentService:
+    """Async service for comment operations"""
+    
+    def __init__(self, comment_repository: AsyncCommentRepository, issue_repository: AsyncIssueRepository, auth_context: AuthContext):
+        self.comment_repository = comment_repository
+        self.issue_repository = issue_repository
+        self.auth_context = auth_context
+
+    async def create_comment(self, comment_create: CommentCreate, current_user_id: int, current_user_role: UserRole) -> Comment:
+        """Create a new comment"""
+        # Check if issue exists
+        issue = await self.issue_repository.get_by_id(comment_create.issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        # Check if user can comment on this issue
+        if not self.auth_context.can_access_project(issue.project_id):
+            raise NotAuthorizedError("Not allowed to comment on this issue.")
+        
+        db_comment = Comment.model_validate(comment_create, update={"author_id": current_user_id})
+        
+        return await self.comment_repository.create(db_comment)
+
+    async def get_comment_by_id(self, comment_id: int, current_user_id: int, current_user_role: UserRole) -> Comment:
+        """Get comment by ID"""
+        comment, issue = await self._validate_comment_and_get_issue(comment_id)
+        
+        if not self.auth_context.can_access_project(issue.project_id):
+            raise NotAuthorizedError("Not allowed to view this comment.")
+        
+        return comment
+
+    async def get_comments_by_issue(self, issue_id: int, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Comment]:
+        """Get one page of comments for an issue"""
+        # Check if issue exists
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        # Check if user can accesss this project's issues
+        if not self.auth_context.can_access_project(issue.project_id):
+            raise NotAuthorizedError("Not allowed to view comments for this issue.")
+        
+        return await self.comment_repository.get_comments_page_by_issue(issue_id, page_params)
+
+    async def get_comments_by_author(self, author_id: int, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Comment]:
+        """Get one page of comments by a specific author"""
+        # Admin can see any user's comments
+        if current_user_role == UserRole.ADMIN:
+            return await self.comment_repository.get_comments_page_by_author(author_id, page_params)
+        
+        # Contributors can only see their own comments
+        if current_user_role == UserRole.CONTRIBUTOR and author_id != current_user_id:
+            raise NotAuthorizedError("Not allowed to view these comments.")
+        
+        # Only comments in projects the user can access, Project Managers also see the projects they created
+        return await self.comment_repository.get_comments_page_by_author(
+            author_id,
+            page_params,
+            visible_to=current_user_id,
+            include_created_projects=current_user_role == UserRole.PROJECT_MANAGER
+        )
+
+    async def update_comment(self, comment_id: int, comment_update: CommentUpdate, current_user_id: int, current_user_role: UserRole) -> Comment:
+        """Update comment"""
+        comment, issue = await self._validate_comment_and_get_issue(comment_id)
+        
+        # Check if user can update this comment
+        if not self._can_modify_comment(comment, issue.project_id):
+            raise NotAuthorizedError("Not allowed to update this comment.")
+        
+        updated_comment = await self.comment_repository.update(comment_id, comment_update)
+        if not updated_comment:
+            raise CommentNotFoundError("Comment no longer exists.")
+        
+        return updated_comment
+
+    async def delete_comment(self, comment_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Delete comment"""
+        comment, issue = await self._validate_comment_and_get_issue(comment_id)
+        
+        # Check if user can delete this comment
+        if not self._can_modify_comment(comment, issue.project_id):
+            raise NotAuthorizedError("Not allowed to delete this comment.")
+        
+        await self.comment_repository.delete(comment_id)
+    
+    def _can_modify_comment(self, comment: Comment, project_id: int) -> bool:
+        """Check if the current user can update/delete comment"""
+        # Admin, or the Project Manager who owns the project
+        if self.auth_context.manages_project(project_id):
+            return True
+        
+        # Contributors can only modify their own comments
+        return comment.author_id == self.auth_context.user_id
+    
+    async def _validate_comment_and_get_issue(self, comment_id: int) -> tuple[Comment, Issue]:
+        """Validate comment exists and get its issue"""
+        comment = await self.comment_repository.get_by_id(comment_id)
+        if not comment:
+            raise CommentNotFoundError()
+        
+        issue = await self.issue_repository.get_by_id(comment.issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        return comment, issue
\ No newline at end of file
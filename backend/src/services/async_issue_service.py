@@ -0,0 +1,370 @@
+from src.dto.issue import IssueCreate, IssueUpdate, IssueSearchFilters
+from src.repositories import AsyncIssueRepository, AsyncProjectRepository, AsyncUserRepository, AsyncLabelRepository
+from src.exceptions.project_exceptions import ProjectNotFoundError
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
+from src.exceptions.issue_exceptions import IssueAssigneeError, IssueNotFoundError
+from src.exceptions.label_exceptions import LabelNotFoundError, LabelAlreadyAddedError
+from src.exceptions.base_exception import AppException
+from src.models import Issue, User
+from src.models.enums import UserRole
+from src.pagination import Page, PageParams
+from src.security.auth_context import AuthContext
+
+class AsyncIssueService:
+    """Async service for issue operations"""
+    
+    def __init__(self, issue_repository: AsyncIssueRepository, project_repository: AsyncProjectRepository, user_repository: AsyncUserRepository, label_repository: AsyncLabelRepository, auth_context: AuthContext):
+        self.issue_repository = issue_repository
+        self.project_repository = project_repository
+        self.user_repository = user_repository
+        self.label_repository = label_repository
+        self.auth_context = auth_context
+
+    async def create_issue(self, issue_create: IssueCreate, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Create a new issue"""
+        # Check if project exists
+        project = await self.project_repository.get_by_id(issue_create.project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Check if user can create issues in this project
+        if not self.auth_context.can_access_project(project.id):
+            raise NotAuthorizedError("Cannot create issue in this project.")
+        
+        # Validate assignee if provided
+        if issue_create.assignee_id:
+            await self._validate_assignee(issue_create.project_id, issue_create.assignee_id)
+            
+        db_issue = issue_create.model_dump()
+        db_issue["author_id"] = current_user_id
+        db_issue = Issue.model_validate(db_issue)
+
+        return await self.issue_repository.create(db_issue)
+
+    async def create_issues_bulk(self, issues_create: list[IssueCreate], current_user_id: int, current_user_role: UserRole) -> list[Issue | AppException]:
+        """Create many issues at once, returning the created issue or the error for every row"""
+        project_ids = list({issue_create.project_id for issue_create in issues_create})
+        assignee_ids = list({issue_create.assignee_id for issue_create in issues_create if issue_create.assignee_id})
+
+        projects = {project.id: project for project in await self.project_repository.get_by_ids(project_ids)}
+        assignees = {user.id: user for user in await self.user_repository.get_by_ids(assignee_ids)}
+        # One membership query covers every assignee, the current user's access is already known
+        memberships = await self.project_repository.get_memberships(list(projects), assignee_ids)
+
+        # Authorize each distinct project once
+        writable_project_ids = {project_id for project_id in projects if self.auth_context.can_access_project(project_id)}
+
+        results: list[Issue | AppException] = []
+        new_issues: list[Issue] = []
+        for issue_create in issues_create:
+            try:
+                project = projects.get(issue_create.project_id)
+                if not project:
+                    raise ProjectNotFoundError()
+
+                if project.id not in writable_project_ids:
+                    raise NotAuthorizedError("Cannot create issue in this project.")
+
+                if issue_create.assignee_id:
+                    self._check_bulk_assignee(issue_create.project_id, assignees.get(issue_create.assignee_id), issue_create.assignee_id, memberships)
+            except AppException as e:
+                results.append(e)
+                continue
+
+            db_issue = issue_create.model_dump()
+            db_issue["author_id"] = current_user_id
+            db_issue = Issue.model_validate(db_issue)
+            new_issues.append(db_issue)
+            results.append(db_issue)
+
+        if new_issues:
+            await self.issue_repository.create_many(new_issues)
+
+        return results
+
+    async def get_issue_by_id(self, issue_id: int, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Get issue by ID"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        # Check if user can view this issue
+        if not self.auth_context.can_access_project(issue.project_id):
+            raise NotAuthorizedError("Not authorized to view this issue.")
+        
+        return issue
+
+    async def get_all_issues(self, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Get one page of all issues based on user role and permissions"""
+        # Admin can see all issues
+        if current_user_role == UserRole.ADMIN:
+            return await self.issue_repository.get_page(page_params)
+        
+        # Project Manager sees issues from projects they created
+        if current_user_role == UserRole.PROJECT_MANAGER:
+            project_ids = list(self.auth_context.created_project_ids)
+
+        else:
+            # Contributors see issues from projects they are members of
+            project_ids = list(self.auth_context.member_project_ids)
+
+        return await self.issue_repository.get_issues_page_by_project_ids(project_ids, page_params)
+
+
+    async def search_issues(self, filters: IssueSearchFilters, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Search the issues a user can view, filtering, scoping and sorting in one query"""
+        if current_user_role == UserRole.ADMIN:
+            return await self.issue_repository.search_issues(filters, page_params)
+
+        # Same visibility as viewing a single issue: member projects, plus created projects for Project Managers
+        return await self.issue_repository.search_issues(
+            filters,
+            page_params,
+            visible_to=current_user_id,
+            include_created_projects=current_user_role == UserRole.PROJECT_MANAGER
+        )
+
+    async def get_issues_by_project(self, project_id: int, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Get one page of issues by project"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        if not self.auth_context.can_access_project(project_id):
+            raise NotAuthorizedError("You are not authorized to view the issues of this project.")
+        
+        return await self.issue_repository.get_issues_page_by_project(project_id, page_params)
+
+    async def update_issue(self, issue_id: int, issue_update: IssueUpdate, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Update issue"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError("No issue was found to update.")
+
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("Not authorized to update this issue.")
+        
+        # Validate assignee if being updated
+        if issue_update.assignee_id:
+            await self._validate_assignee(issue.project_id, issue_update.assignee_id)
+        
+        updated_issue = await self.issue_repository.update(issue_id, issue_update)
+
+        if not updated_issue:
+            raise IssueNotFoundError("Issue no longer exists.")
+        
+        return updated_issue
+
+    async def delete_issue(self, issue_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Delete issue"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        # Admin can delete any issue, Project Manager can delete issues in their projects
+        if self.auth_context.manages_project(issue.project_id):
+            await self.issue_repository.delete(issue_id)
+            return
+        
+        # Contributors can delete their own issues only
+        if issue.author_id == current_user_id:
+            await self.issue_repository.delete(issue_id)
+            return        
+        
+        raise NotAuthorizedError("Not authorized to delete this issue.")
+
+    async def assign_issue(self, issue_id: int, assignee_id: int | None, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Assign or unassign issue"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+
+        # For unassignment (assignee_id is None)
+        if assignee_id is None:
+            # Only validate that user can update the issue
+            if not self._can_update_issue(issue):
+                raise NotAuthorizedError("Not authorized to unassign this issue.")
+
+            updated_issue = await self.issue_repository.assign_issue(issue_id, None)
+            if not updated_issue:
+                raise IssueNotFoundError("Issue no longer exists.")
+        
+            return updated_issue
+        
+        # For assignment -> (assignee_id is not None) Validate if user has permission to assign the issue    
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("Not authorized to assign this issue.")
+        
+        # Validate if assignee is valid to be assigned the issue
+        await self._validate_assignee(issue.project_id, assignee_id)
+        
+        updated_issue = await self.issue_repository.assign_issue(issue_id, assignee_id)
+
+        if not updated_issue:
+            raise IssueNotFoundError("Issue no longer exists.")
+        
+        return updated_issue
+
+    async def close_issue(self, issue_id: int, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Close issue"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("You are not authorized to close this issue.")
+        
+        updated_issue = await self.issue_repository.close_issue(issue_id, current_user_id)
+
+        if not updated_issue:
+            raise IssueNotFoundError("Issue no longer exists.")
+
+        return updated_issue
+
+    async def reopen_issue(self, issue_id: int, current_user_id: int, current_user_role: UserRole) -> Issue:
+        """Reopen issue"""
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError()
+        
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("You are not authorized to reopen this issue.")
+        
+        updated_issue = await self.issue_repository.reopen_issue(issue_id)
+
+        if not updated_issue:
+            raise IssueNotFoundError("Issue no longer exists.")
+
+        return updated_issue
+
+    async def get_issues_by_assignee(self, assignee_id: int, current_user_id: int, current_user_role: UserRole) -> list[Issue]:
+        """Get issues assigned to user"""
+        # Validate assigne exists
+        assignee = await self.user_repository.get_by_id(assignee_id)
+        if not assignee:
+            raise UserNotFoundError("Assignee not found.")
+        # Admin can see any user's assigned issues
+        if current_user_role == UserRole.ADMIN:
+            return await self.issue_repository.get_issues_by_assignee(assignee_id)
+        
+        # Project Manager can see assigned issues in projects they created or are a member of
+        if current_user_role == UserRole.PROJECT_MANAGER:
+            return await self.issue_repository.get_issues_by_assignee(assignee_id, visible_to=current_user_id, include_created_projects=True)
+
+        # Contributors can only see their own assigned issues, in projects they are a member of
+        if assignee_id != current_user_id:
+            raise NotAuthorizedError("You can only view your assigned issues.")
+        
+        return await self.issue_repository.get_issues_by_assignee(assignee_id, visible_to=current_user_id)
+
+    async def get_issues_by_author(self, author_id: int, current_user_id: int, current_user_role: UserRole) -> list[Issue]:
+        """Get issues created by user"""
+        # Check that author exists
+        author = await self.user_repository.get_by_id(author_id)
+        if not author:
+            raise UserNotFoundError(f"User with id:{author_id} was not found.")
+        
+        # Admin can view any user's authored issues
+        if current_user_role == UserRole.ADMIN:
+            return await self.issue_repository.get_issues_by_author(author_id)
+        
+        # Contributors can only view their own authored issues
+        if current_user_role == UserRole.CONTRIBUTOR:
+            if author_id != current_user_id:
+                raise NotAuthorizedError("You can only view issues created by yourself.")
+            return await self.issue_repository.get_issues_by_author(author_id)
+        
+        # Project Managers can view issues authored by anyone in projects they created or are a member of
+        return await self.issue_repository.get_issues_by_author(author_id, visible_to=current_user_id, include_created_projects=True)
+
+    async def add_label_to_issue(self, issue_id: int, label_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Add label to issue"""
+        # Check issue exists
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError("Couldn't add label to issue: Issue does not exist.")
+        
+        # Check label exists
+        label = await self.label_repository.get_by_id(label_id)
+        if not label:
+            raise LabelNotFoundError()
+        
+        # Check if user is authorized to modify this issue
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("You cannot add labels to this issue.")
+        
+        # Check if issue already has this label
+        current_labels = await self.label_repository.get_labels_by_issue(issue_id)
+        current_label_ids = [label.id for label in current_labels]
+        if label_id in current_label_ids:
+            raise LabelAlreadyAddedError()
+        
+        await self.issue_repository.add_label_to_issue(issue_id, label_id)
+
+    async def remove_label_from_issue(self, issue_id: int, label_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Remove label from issue"""
+        # Check issue exists
+        issue = await self.issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError("Couldn't remove label from issue: Issue does not exist.")
+        
+        # Check label exists
+        label = await self.label_repository.get_by_id(label_id)
+        if not label:
+            raise LabelNotFoundError()
+        
+        # Check if user is authorized to modify this issue
+        if not self._can_update_issue(issue):
+            raise NotAuthorizedError("You cannot remove labels from this issue.")
+        
+        await self.issue_repository.remove_label_from_issue(issue_id, label_id)
+
+    def _can_update_issue(self, issue: Issue) -> bool:
+        """Check if the current user can update issue"""
+        # Admin, or the Project Manager who owns the project
+        if self.auth_context.manages_project(issue.project_id):
+            return True
+        
+        # Contributors can update issues assigned to them or issues they created
+        return issue.assignee_id == self.auth_context.user_id or issue.author_id == self.auth_context.user_id
+
+    async def _validate_assignee(self, project_id: int, assignee_id: int) -> None:
+        """Validate if user can be assigned to project issues"""
+        # Check if assignee exists and is active
+        assignee = await self.user_repository.get_by_id(assignee_id)
+        if not assignee:
+            raise UserNotFoundError()
+        
+        if not assignee.is_active:
+            raise InactiveUserAccountError("Cannot assign issues to inactive users.")
+        
+        if not await self.project_repository.is_member(project_id, assignee_id):
+            raise IssueAssigneeError()
+        
+        self._check_assigner(project_id, assignee_id)
+
+    def _check_bulk_assignee(self, project_id: int, assignee: User | None, assignee_id: int, memberships: set[tuple[int, int]]) -> None:
+        """Same rules as _validate_assignee, checked against preloaded users and memberships"""
+        if not assignee:
+            raise UserNotFoundError()
+
+        if not assignee.is_active:
+            raise InactiveUserAccountError("Cannot assign issues to inactive users.")
+
+        if (project_id, assignee_id) not in memberships:
+            raise IssueAssigneeError()
+
+        self._check_assigner(project_id, assignee_id)
+
+    def _check_assigner(self, project_id: int, assignee_id: int) -> None:
+        """Check if the current user may assign this user in the project"""
+        # Admin, or the Project Manager who owns the project
+        if self.auth_context.manages_project(project_id):
+            return
+
+        # Contributors can only assign themselves
+        if self.auth_context.role == UserRole.CONTRIBUTOR and assignee_id == self.auth_context.user_id:
+            return
+
+        raise NotAuthorizedError("You are not authorized to assign this user to the issue.")
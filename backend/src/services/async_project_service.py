@@ -0,0 +1,159 @@
+from src.dto.project import ProjectCreate, ProjectUpdate
+from src.repositories import AsyncProjectRepository, AsyncUserRepository
+from src.models import Project, UserRole, User, ProjectStatus
+from src.pagination import Page, PageParams
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.project_exceptions import ProjectNotFoundError, AlreadyProjectMemberError, ProjectCreatorRemoveError, NotProjectMemberError, InvalidProjectStatusError
+from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
+from src.security.auth_context import AuthContext
+
+class AsyncProjectService:
+    """Async service for project operations"""
+    
+    def __init__(self, project_repository: AsyncProjectRepository, user_repository: AsyncUserRepository, auth_context: AuthContext):
+        self.project_repository = project_repository
+        self.user_repository = user_repository
+        self.auth_context = auth_context
+
+    async def create_project(self, project_create: ProjectCreate, current_user_id: int, current_user_role: UserRole) -> Project:
+        """Create a new project (Admin and Project Manager only)"""
+        if not current_user_role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
+            raise NotAuthorizedError("Not authorized to create projects.")
+        
+        db_project = Project.model_validate(project_create, update={"created_by": current_user_id})
+
+        return await self.project_repository.create(db_project)
+
+    async def get_project_by_id(self, project_id: int, current_user_id: int, current_user_role: UserRole) -> Project:
+        """Get project by ID"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Admin can see any project, Project Manager the projects they created, Contributors their member projects
+        if self.auth_context.can_access_project(project_id):
+            return project
+        
+        raise NotAuthorizedError("Not authorized to view this project.")
+
+    async def get_all_projects(self, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Project]:
+        """Get one page of all projects based on user role"""
+        # Admin can see all projects
+        if current_user_role == UserRole.ADMIN:
+            projects = await self.project_repository.get_page(page_params)
+
+        # Project Manager can see projects they created
+        elif current_user_role == UserRole.PROJECT_MANAGER:
+            projects = await self.project_repository.get_projects_page_by_creator(current_user_id, page_params)
+        else:
+            # Contributors can only see projects they are members of
+            projects = await self.project_repository.get_user_projects_page(current_user_id, page_params)
+        
+        return projects
+
+    async def update_project(self, project_id: int, project_update: ProjectUpdate, current_user_id: int, current_user_role: UserRole) -> Project:
+        """Update an existing project with authorization checks"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Admin can update any project, Project Manager can update projects they created
+        if not self.auth_context.manages_project(project_id):
+            raise NotAuthorizedError("Not authorized to update this project.")
+        
+        updated_project = await self.project_repository.update(project_id, project_update)
+
+        if not updated_project:
+            raise ProjectNotFoundError("Project no longer exists.")
+
+        return updated_project
+
+    async def delete_project(self, project_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Delete existing project with authorization checks"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Admin can delete any project, Project Manager can delete projects they created
+        if not self.auth_context.manages_project(project_id):
+            raise NotAuthorizedError("Not authorized to delete this project.")
+
+        await self.project_repository.delete(project_id)
+
+    async def add_member(self, project_id: int, user_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Add member to project"""
+        # Check if the member we are trying to add to the project exists and is active
+        member = await self.user_repository.get_by_id(user_id)
+        if not member:
+            raise UserNotFoundError()
+        
+        if not member.is_active:
+            raise InactiveUserAccountError("Cannot add inactive users to projects.")
+
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Admin can add members to any project, Project Manager can add members to projects they created
+        if not self.auth_context.manages_project(project_id):
+            raise NotAuthorizedError("Not authorized to add members to this project.")
+
+        if await self.project_repository.is_member(project_id, user_id):
+            raise AlreadyProjectMemberError()
+
+        await self.project_repository.add_member(project_id, user_id)
+
+    async def remove_member(self, project_id: int, user_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+        """Remove member from project"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        if not await self.project_repository.is_member(project_id, user_id):
+            raise NotProjectMemberError()
+        
+        # Admin can remove members from any project, Project Manager can remove members from projects they created
+        if not self.auth_context.manages_project(project_id):
+            raise NotAuthorizedError("Not authorized to remove members from this project.")
+
+        if user_id == project.created_by:
+            raise ProjectCreatorRemoveError()
+
+        await self.project_repository.remove_member(project_id, user_id)
+
+    async def get_project_members(self, project_id: int, current_user_id: int, current_user_role: UserRole) -> list[User]:
+        """Get project members"""
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError()
+        
+        # Admin can see members of any project, Project Manager of projects they created, Contributors of their member projects
+        if self.auth_context.can_access_project(project_id):
+            return await self.project_repository.get_project_members(project_id)
+        
+        raise NotAuthorizedError("Not authorized to view members of this project.")
+
+    async def is_member(self, project_id: int, user_id: int) -> bool:
+        """Check if user is member of project"""
+        return await self.project_repository.is_member(project_id, user_id)
+
+    async def get_projects_by_status(self, status_name: str, current_user_id: int, current_user_role: UserRole) -> list[Project]:
+        """Get projects by status based on user role"""
+        try:
+            status = status_name.strip().replace("-","_").title()
+            status = ProjectStatus(status)
+        except ValueError:
+            raise InvalidProjectStatusError()
+
+        # Admin can see all projects with this status
+        if current_user_role == UserRole.ADMIN:
+            projects = await self.project_repository.get_projects_by_status(status)
+
+        # Project Manager can see their projects with this status
+        elif current_user_role == UserRole.PROJECT_MANAGER:
+            projects = await self.project_repository.get_projects_by_status(status, creator_id=current_user_id)
+        else:
+            # Contributors can see their member projects with this status
+            projects = await self.project_repository.get_projects_by_status(status, member_id=current_user_id)
+        
+        return projects
\ No newline at end of file
@@ -1,21 +1,35 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from typing import cast
+from starlette.concurrency import run_in_threadpool
 from src.dto.auth import LoginRequest, TokenResponse, TokenData
 from src.dto.user import UserCreate
-from src.models import User
+from src.models import User, RefreshToken
 from src.repositories.user_repository import UserRepository
-from src.security.security import verify_password, get_password_hash, create_access_token, decode_token
-from src.exceptions.user_exceptions import EmailAlreadyExistsError, UsernameAlreadyExistsError, InactiveUserAccountError, IncorrectPasswordError, InvalidUsernameError, UserNotFoundError
-from src.exceptions.auth_exceptions import InvalidTokenPayloadError, InvalidTokenError
+from src.repositories.refresh_token_repository import RefreshTokenRepository
+from src.security.security import create_access_token, create_refresh_token, hash_refresh_token, decode_token
+from src.security.password_hasher import password_hasher
+from src.exceptions.user_exceptions import EmailAlreadyExistsError, UsernameAlreadyExistsError, InactiveUserAccountError, IncorrectPasswordError, InvalidUsernameError
+from src.exceptions.auth_exceptions import InvalidTokenPayloadError, InvalidTokenError, InvalidRefreshTokenError, RefreshTokenReuseError
 from src.config import settings
 
 class AuthService:
     """Service for authentication operations"""
     
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, refresh_token_repository: RefreshTokenRepository):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
 
-    def register_user(self, user_create: UserCreate) -> User:
-        """Register a new user"""
+    async def register_user(self, user_create: UserCreate) -> User:
+        """Register a new user, the database steps run on the threadpool and the hash on the bcrypt pool"""
+        await run_in_threadpool(self._check_available, user_create)
+        
+        # Hash password
+        hashed_password = await password_hasher.hash_async(user_create.password)
+        db_user = User.model_validate(user_create, update={"password_hash": hashed_password})
+        
+        return await run_in_threadpool(self.user_repository.create, db_user)
+
+    def _check_available(self, user_create: UserCreate) -> None:
         # Check if username already exists
         if self.user_repository.get_by_username(user_create.username):
             raise UsernameAlreadyExistsError()
@@ -23,17 +37,21 @@ class AuthService:
         # Check if email already exists
         if self.user_repository.get_by_email(user_create.email):
             raise EmailAlreadyExistsError()
+
+    async def authenticate_user(self, login_request: LoginRequest) -> TokenResponse:
+        """Authenticate user and return access and refresh tokens, no thread is held while bcrypt is queued"""
+        user = await run_in_threadpool(self._get_active_user, login_request.username)
         
-        # Hash password
-        hashed_password = get_password_hash(user_create.password)
-        db_user = User.model_validate(user_create, update={"password_hash": hashed_password})
+        # Verify password
+        is_valid, new_password_hash = await password_hasher.verify_and_update_async(login_request.password, user.password_hash)
+        if not is_valid:
+            raise IncorrectPasswordError()
         
-        return self.user_repository.create(db_user)
+        return await run_in_threadpool(self._complete_login, user, new_password_hash)
 
-    def authenticate_user(self, login_request: LoginRequest) -> TokenResponse:
-        """Authenticate user and return access token"""
+    def _get_active_user(self, username: str) -> User:
         # Get user by username
-        user = self.user_repository.get_by_username(login_request.username)
+        user = self.user_repository.get_by_username(username)
         
         if not user:
             raise InvalidUsernameError()
@@ -41,24 +59,77 @@ class AuthService:
         if not user.is_active:
             raise InactiveUserAccountError()
         
-        # Verify password
-        if not verify_password(login_request.password, user.password_hash):
-            raise IncorrectPasswordError()
+        return user
+
+    def _complete_login(self, user: User, new_password_hash: str | None) -> TokenResponse:
+        # Stored hash uses an outdated bcrypt cost
+        if new_password_hash:
+            self.user_repository.update(cast(int, user.id), extra_data={"password_hash": new_password_hash})
+        
+        return self._issue_tokens(user)
+
+    def refresh_tokens(self, refresh_token: str) -> TokenResponse:
+        """Rotate a refresh token into new access and refresh tokens, without verifying the password"""
+        stored_token = self.refresh_token_repository.get_by_hash(hash_refresh_token(refresh_token))
+        if not stored_token:
+            raise InvalidRefreshTokenError()
+        
+        # A rotated or revoked token came back, so it may have leaked: end every session of the user
+        if stored_token.revoked_at is not None:
+            self.refresh_token_repository.revoke_all_for_user(stored_token.user_id)
+            raise RefreshTokenReuseError()
+        
+        # Stored naive, in UTC
+        if stored_token.expires_at.replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc):
+            raise InvalidRefreshTokenError()
+        
+        user = self.user_repository.get_by_id(stored_token.user_id)
+        if not user or not user.is_active:
+            raise InvalidRefreshTokenError()
         
-        # Create access token
+        # Two refreshes with one token can both pass the check above, only the one whose revoke lands may rotate it
+        if not self.refresh_token_repository.revoke(stored_token):
+            self.refresh_token_repository.revoke_all_for_user(stored_token.user_id)
+            raise RefreshTokenReuseError()
+        
+        return self._issue_tokens(user)
+
+    def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Revoke a refresh token on logout, unknown or already revoked tokens are ignored"""
+        stored_token = self.refresh_token_repository.get_by_hash(hash_refresh_token(refresh_token))
+        if stored_token and stored_token.revoked_at is None:
+            self.refresh_token_repository.revoke(stored_token)
+
+    def _issue_tokens(self, user: User) -> TokenResponse:
+        """Create an access token and a stored, rotating refresh token"""
+        user_id = cast(int, user.id)
         access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+        # Stateless mode lets read requests trust the role in the token, the version makes it revocable
+        claims = {"role": user.role.value, "ver": user.token_version} if settings.stateless_auth_enabled else None
         access_token = create_access_token(
-                subject=user.id, 
-                expires_delta=access_token_expires
+                subject=user_id, 
+                expires_delta=access_token_expires,
+                claims=claims
             )
         
+        refresh_token = create_refresh_token()
+        refresh_token_expires = timedelta(days=settings.refresh_token_expire_days)
+        self.refresh_token_repository.create(RefreshToken(
+            user_id=user_id,
+            token_hash=hash_refresh_token(refresh_token),
+            expires_at=datetime.now(timezone.utc) + refresh_token_expires
+        ))
+        
         return TokenResponse(
             access_token=access_token,
-            expires_in=settings.access_token_expire_minutes * 60  # convert to seconds
+            expires_in=settings.access_token_expire_minutes * 60,  # convert to seconds
+            refresh_token=refresh_token,
+            refresh_expires_in=int(refresh_token_expires.total_seconds())
         )
 
-    def get_current_user_data(self, token: str) -> TokenData:
-        """Get current user data from token"""
+    @staticmethod
+    def get_token_data(token: str) -> TokenData:
+        """Get the user id (subject) and any role and version claims from a token without touching the database"""
         payload = decode_token(token)
         if not payload:
             raise InvalidTokenError()
@@ -67,13 +138,4 @@ class AuthService:
         if not user_id:
             raise InvalidTokenPayloadError()
         
-        # Get user from database
-        user = self.user_repository.get_by_id(int(user_id))
-        if not user:
-            raise UserNotFoundError()
-        
-        return TokenData(
-            user_id=user.id,
-            username=user.username,
-            role=user.role
-        )
\ No newline at end of file
+        return TokenData(user_id=int(user_id), role=payload.get("role"), token_version=payload.get("ver"))
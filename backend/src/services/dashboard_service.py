@@ -0,0 +1,102 @@
+from collections import Counter
+from src.dto.dashboard import AdminDashboard, ProjectIssueCount, ManagerDashboard, ProjectIssueBreakdown, AssigneeWorkload, ContributorDashboard
+from src.models.enums import UserRole, ProjectStatus
+from src.repositories import DashboardRepository
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.project_exceptions import ProjectNotFoundError
+
+class DashboardService:
+    """Service for dashboard aggregates"""
+
+    def __init__(self, dashboard_repository: DashboardRepository):
+        self.dashboard_repository = dashboard_repository
+
+    def get_admin_dashboard(self, current_user_role: UserRole) -> AdminDashboard:
+        """Get user, project and open issue counts (Admin only)"""
+        if current_user_role != UserRole.ADMIN:
+            raise NotAuthorizedError("Only admins can view the admin dashboard.")
+
+        users_by_role = self.dashboard_repository.count_users_by_role()
+        projects_by_status = self.dashboard_repository.count_projects_by_status()
+        open_issues_by_project = [
+            ProjectIssueCount(project_id=project_id, project_name=name, open_issues=count)
+            for project_id, name, count in self.dashboard_repository.count_open_issues_by_active_project()
+        ]
+
+        return AdminDashboard(
+            users_by_role=users_by_role,
+            projects_by_status=projects_by_status,
+            open_issues_by_project=open_issues_by_project,
+            total_users=sum(users_by_role.values()),
+            total_projects=sum(projects_by_status.values()),
+            active_projects=projects_by_status.get(ProjectStatus.ACTIVE, 0),
+            open_issues=self.dashboard_repository.count_open_issues()
+        )
+
+    def get_manager_dashboard(self, current_user_id: int, current_user_role: UserRole, project_id: int | None = None) -> ManagerDashboard:
+        """Get active issue breakdowns and team workload for the caller's projects (Admin and Project Manager)"""
+        if current_user_role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
+            raise NotAuthorizedError("Only admins and project managers can view the manager dashboard.")
+
+        projects: dict[int, ProjectIssueBreakdown] = {}
+        workload: dict[int | None, AssigneeWorkload] = {}
+        rows = self.dashboard_repository.get_manager_rows(current_user_id, project_id)
+
+        for kind, row_project_id, _, _, user_id, name, _, _ in rows:
+            if kind == "project":
+                projects[row_project_id] = ProjectIssueBreakdown(
+                    project_id=row_project_id, project_name=name, issues_by_status={}, issues_by_priority={}
+                )
+            elif kind == "member":
+                workload[user_id] = AssigneeWorkload(assignee_id=user_id, username=name, active_issues=0, time_estimate=0)
+
+        # Only projects the caller created are aggregated
+        if project_id is not None and not projects:
+            raise ProjectNotFoundError()
+
+        for kind, row_project_id, status, priority, user_id, name, issues, time_estimate in rows:
+            if kind == "status":
+                projects[row_project_id].issues_by_status[status] = issues
+            elif kind == "priority":
+                projects[row_project_id].issues_by_priority[priority] = issues
+            elif kind == "workload":
+                workload[user_id] = AssigneeWorkload(assignee_id=user_id, username=name, active_issues=issues, time_estimate=time_estimate)
+
+        issues_by_status: Counter = Counter()
+        issues_by_priority: Counter = Counter()
+        for project in projects.values():
+            issues_by_status.update(project.issues_by_status)
+            issues_by_priority.update(project.issues_by_priority)
+
+        return ManagerDashboard(
+            projects=sorted(projects.values(), key=lambda project: (project.project_name, project.project_id)),
+            issues_by_status=dict(issues_by_status),
+            issues_by_priority=dict(issues_by_priority),
+            workload=sorted(workload.values(), key=lambda entry: (entry.assignee_id is None, entry.username or "")),
+            total_projects=len(projects),
+            active_issues=sum(issues_by_status.values())
+        )
+
+    def get_contributor_dashboard(self, current_user_id: int) -> ContributorDashboard:
+        """Get the caller's active assigned issues by status, priority and project"""
+        issues_by_status: Counter = Counter()
+        issues_by_priority: Counter = Counter()
+        issues_by_project: dict[int, ProjectIssueCount] = {}
+        project_ids: set[int] = set()
+
+        for project_id, name, project_status, issue_status, priority, issues in self.dashboard_repository.get_assigned_issue_counts(current_user_id):
+            project_ids.add(project_id)
+            if project_status == ProjectStatus.ACTIVE:
+                project = issues_by_project.setdefault(project_id, ProjectIssueCount(project_id=project_id, project_name=name, open_issues=0))
+                project.open_issues += issues
+            if issues:
+                issues_by_status[issue_status] += issues
+                issues_by_priority[priority] += issues
+
+        return ContributorDashboard(
+            issues_by_status=dict(issues_by_status),
+            issues_by_priority=dict(issues_by_priority),
+            issues_by_project=sorted(issues_by_project.values(), key=lambda project: (project.project_name, project.project_id)),
+            total_projects=len(project_ids),
+            active_issues=sum(issues_by_status.values())
+        )
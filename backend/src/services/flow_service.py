@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from src.config import settings
+from src.models import ProjectFlowSnapshot, UserRole
+from src.dto.flow import FlowSnapshotResult
+from src.repositories import FlowSnapshotRepository, ProjectRepository
+from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.exceptions.project_exceptions import ProjectNotFoundError, InvalidFlowRangeError, FlowSnapshotsInProgressError
+from src.security.auth_context import AuthContext
+
+class FlowService:
+    """Service for daily project flow snapshots"""
+
+    def __init__(self, flow_snapshot_repository: FlowSnapshotRepository, project_repository: ProjectRepository, auth_context: AuthContext | None = None):
+        self.flow_snapshot_repository = flow_snapshot_repository
+        self.project_repository = project_repository
+        self.auth_context = auth_context
+
+    def take_snapshots(self, until: date, current_user_role: UserRole | None = None) -> FlowSnapshotResult:
+        """
+        Snapshot every project for the next FLOW_SNAPSHOT_BATCH_DAYS days before `until` it has no snapshot for yet
+        (Admin only, None is the nightly job). One batch keeps the transaction short, callers repeat until none remain
+        """
+        if current_user_role is not None and current_user_role != UserRole.ADMIN:
+            raise NotAuthorizedError("Only admins can take flow snapshots.")
+
+        if not self.flow_snapshot_repository.try_lock():
+            raise FlowSnapshotsInProgressError()
+
+        next_days = self.flow_snapshot_repository.get_next_days()
+        if not next_days:
+            return FlowSnapshotResult(snapshots=0, remaining_days=0)
+
+        day = min(next_days.values())
+        batch_end = min(until, day + timedelta(days=settings.flow_snapshot_batch_days))
+        written = 0
+        while day < batch_end:
+            due = [project_id for project_id, next_day in next_days.items() if next_day <= day]
+            written += self.flow_snapshot_repository.insert_many(self.flow_snapshot_repository.count_issues_at(day, due))
+            day += timedelta(days=1)
+        return FlowSnapshotResult(snapshots=written, remaining_days=max((until - batch_end).days, 0))
+
+    def get_project_flow(self, project_id: int, from_day: date | None, to_day: date | None, today: date) -> list[ProjectFlowSnapshot]:
+        """Get a project's daily snapshots, by default the last 30 snapshotted days"""
+        if not self.project_repository.get_by_id(project_id):
+            raise ProjectNotFoundError()
+
+        if not self.auth_context or not self.auth_context.can_access_project(project_id):
+            raise NotAuthorizedError("Not authorized to view this project.")
+
+        to_day = to_day or today - timedelta(days=1)
+        from_day = from_day or to_day - timedelta(days=29)
+        if from_day > to_day:
+            raise InvalidFlowRangeError("'from' must not be after 'to'.")
+        if (to_day - from_day).days >= settings.flow_max_days:
+            raise InvalidFlowRangeError(f"The range can span at most {settings.flow_max_days} days.")
+
+        return self.flow_snapshot_repository.get_range(project_id, from_day, to_day)
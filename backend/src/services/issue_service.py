@@ -1,21 +1,25 @@
-from src.dto.issue import IssueCreate, IssueUpdate
+from src.dto.issue import IssueCreate, IssueUpdate, IssueSearchFilters
 from src.repositories import IssueRepository, ProjectRepository, UserRepository, LabelRepository
 from src.exceptions.project_exceptions import ProjectNotFoundError
 from src.exceptions.auth_exceptions import NotAuthorizedError
 from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
 from src.exceptions.issue_exceptions import IssueAssigneeError, IssueNotFoundError
 from src.exceptions.label_exceptions import LabelNotFoundError, LabelAlreadyAddedError
-from src.models import Issue, Project
+from src.exceptions.base_exception import AppException
+from src.models import Issue, User
 from src.models.enums import UserRole
+from src.pagination import Page, PageParams
+from src.security.auth_context import AuthContext
 
 class IssueService:
     """Service for issue operations"""
     
-    def __init__(self, issue_repository: IssueRepository, project_repository: ProjectRepository, user_repository: UserRepository, label_repository: LabelRepository):
+    def __init__(self, issue_repository: IssueRepository, project_repository: ProjectRepository, user_repository: UserRepository, label_repository: LabelRepository, auth_context: AuthContext):
         self.issue_repository = issue_repository
         self.project_repository = project_repository
         self.user_repository = user_repository
         self.label_repository = label_repository
+        self.auth_context = auth_context
 
     def create_issue(self, issue_create: IssueCreate, current_user_id: int, current_user_role: UserRole) -> Issue:
         """Create a new issue"""
@@ -25,12 +29,12 @@ class IssueService:
             raise ProjectNotFoundError()
         
         # Check if user can create issues in this project
-        if not self._can_create_issue_in_project(project, current_user_id, current_user_role):
+        if not self.auth_context.can_access_project(project.id):
             raise NotAuthorizedError("Cannot create issue in this project.")
         
         # Validate assignee if provided
         if issue_create.assignee_id:
-            self._validate_assignee(project, issue_create.assignee_id, current_user_id, current_user_role)
+            self._validate_assignee(issue_create.project_id, issue_create.assignee_id)
             
         db_issue = issue_create.model_dump()
         db_issue["author_id"] = current_user_id
@@ -38,52 +42,99 @@ class IssueService:
 
         return self.issue_repository.create(db_issue)
 
+    def create_issues_bulk(self, issues_create: list[IssueCreate], current_user_id: int, current_user_role: UserRole) -> list[Issue | AppException]:
+        """Create many issues at once, returning the created issue or the error for every row"""
+        project_ids = list({issue_create.project_id for issue_create in issues_create})
+        assignee_ids = list({issue_create.assignee_id for issue_create in issues_create if issue_create.assignee_id})
+
+        projects = {project.id: project for project in self.project_repository.get_by_ids(project_ids)}
+        assignees = {user.id: user for user in self.user_repository.get_by_ids(assignee_ids)}
+        # One membership query covers every assignee, the current user's access is already known
+        memberships = self.project_repository.get_memberships(list(projects), assignee_ids)
+
+        # Authorize each distinct project once
+        writable_project_ids = {project_id for project_id in projects if self.auth_context.can_access_project(project_id)}
+
+        results: list[Issue | AppException] = []
+        new_issues: list[Issue] = []
+        for issue_create in issues_create:
+            try:
+                project = projects.get(issue_create.project_id)
+                if not project:
+                    raise ProjectNotFoundError()
+
+                if project.id not in writable_project_ids:
+                    raise NotAuthorizedError("Cannot create issue in this project.")
+
+                if issue_create.assignee_id:
+                    self._check_bulk_assignee(issue_create.project_id, assignees.get(issue_create.assignee_id), issue_create.assignee_id, memberships)
+            except AppException as e:
+                results.append(e)
+                continue
+
+            db_issue = issue_create.model_dump()
+            db_issue["author_id"] = current_user_id
+            db_issue = Issue.model_validate(db_issue)
+            new_issues.append(db_issue)
+            results.append(db_issue)
+
+        if new_issues:
+            self.issue_repository.create_many(new_issues)
+
+        return results
+
     def get_issue_by_id(self, issue_id: int, current_user_id: int, current_user_role: UserRole) -> Issue:
         """Get issue by ID"""
-        issue = self.issue_repository.get_by_id(issue_id)
+        issue = self.issue_repository.get_by_id(issue_id, load_relationships=True)
         if not issue:
             raise IssueNotFoundError()
         
         # Check if user can view this issue
-        if not self._can_view_issue(issue.project_id, current_user_id, current_user_role):
+        if not self.auth_context.can_access_project(issue.project_id):
             raise NotAuthorizedError("Not authorized to view this issue.")
         
         return issue
 
-    def get_all_issues(self, current_user_id: int, current_user_role: UserRole) -> list[Issue]:
-        """Get all issues based on user role and permissions"""
+    def get_all_issues(self, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Get one page of all issues based on user role and permissions"""
         # Admin can see all issues
         if current_user_role == UserRole.ADMIN:
-            return self.issue_repository.get_all()
+            return self.issue_repository.get_page(page_params)
         
         # Project Manager sees issues from projects they created
         if current_user_role == UserRole.PROJECT_MANAGER:
-            projects = self.project_repository.get_projects_by_creator(current_user_id)
-            project_ids = [project.id for project in projects if project.id is not None]
+            project_ids = list(self.auth_context.created_project_ids)
 
         else:
             # Contributors see issues from projects they are members of
-            projects = self.project_repository.get_user_projects(current_user_id)
-            project_ids = [project.id for project in projects if project.id is not None]
+            project_ids = list(self.auth_context.member_project_ids)
 
-        if not project_ids:
-            return []
-        
-        return self.issue_repository.get_issues_by_project_ids(project_ids)
+        return self.issue_repository.get_issues_page_by_project_ids(project_ids, page_params)
 
 
-    def get_issues_by_project(self, project_id: int, current_user_id: int, current_user_role: UserRole) -> list[Issue]:
-        """Get issues by project"""
+    def search_issues(self, filters: IssueSearchFilters, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Search the issues a user can view, filtering, scoping and sorting in one query"""
+        if current_user_role == UserRole.ADMIN:
+            return self.issue_repository.search_issues(filters, page_params)
+
+        # Same visibility as viewing a single issue: member projects, plus created projects for Project Managers
+        return self.issue_repository.search_issues(
+            filters,
+            page_params,
+            visible_to=current_user_id,
+            include_created_projects=current_user_role == UserRole.PROJECT_MANAGER
+        )
+
+    def get_issues_by_project(self, project_id: int, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Issue]:
+        """Get one page of issues by project"""
         project = self.project_repository.get_by_id(project_id)
         if not project:
             raise ProjectNotFoundError()
         
-        if not self._can_view_issue(project_id, current_user_id, current_user_role):
+        if not self.auth_context.can_access_project(project_id):
             raise NotAuthorizedError("You are not authorized to view the issues of this project.")
         
-        issues = self.issue_repository.get_issues_by_project(project_id)
-
-        return issues
+        return self.issue_repository.get_issues_page_by_project(project_id, page_params)
 
     def update_issue(self, issue_id: int, issue_update: IssueUpdate, current_user_id: int, current_user_role: UserRole) -> Issue:
         """Update issue"""
@@ -91,17 +142,12 @@ class IssueService:
         if not issue:
             raise IssueNotFoundError("No issue was found to update.")
 
-        can_update, project = self._can_update_issue(issue, current_user_id, current_user_role)
-
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("Not authorized to update this issue.")
         
-        if not project:
-            raise ProjectNotFoundError("Project no longer exists.")
-        
         # Validate assignee if being updated
         if issue_update.assignee_id:
-            self._validate_assignee(project, issue_update.assignee_id, current_user_id, current_user_role)
+            self._validate_assignee(issue.project_id, issue_update.assignee_id)
         
         updated_issue = self.issue_repository.update(issue_id, issue_update)
 
@@ -116,14 +162,8 @@ class IssueService:
         if not issue:
             raise IssueNotFoundError()
         
-        # Admin can delete any issue
-        if current_user_role == UserRole.ADMIN:
-            self.issue_repository.delete(issue_id)
-            return
-        
-        # Project Manager can delete issues in their projects
-        project = self.project_repository.get_by_id(issue.project_id)
-        if current_user_role == UserRole.PROJECT_MANAGER and project and project.created_by == current_user_id:
+        # Admin can delete any issue, Project Manager can delete issues in their projects
+        if self.auth_context.manages_project(issue.project_id):
             self.issue_repository.delete(issue_id)
             return
         
@@ -143,12 +183,8 @@ class IssueService:
         # For unassignment (assignee_id is None)
         if assignee_id is None:
             # Only validate that user can update the issue
-            can_update, project = self._can_update_issue(issue, current_user_id, current_user_role)
-            if not can_update:
+            if not self._can_update_issue(issue):
                 raise NotAuthorizedError("Not authorized to unassign this issue.")
-            
-            if not project:
-                raise ProjectNotFoundError("Project no longer exists.")
 
             updated_issue = self.issue_repository.assign_issue(issue_id, None)
             if not updated_issue:
@@ -157,16 +193,11 @@ class IssueService:
             return updated_issue
         
         # For assignment -> (assignee_id is not None) Validate if user has permission to assign the issue    
-        can_update, project = self._can_update_issue(issue, current_user_id, current_user_role)
-
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("Not authorized to assign this issue.")
         
-        if not project:
-            raise ProjectNotFoundError("Project no longer exists.")
-        
         # Validate if assignee is valid to be assigned the issue
-        self._validate_assignee(project, assignee_id, current_user_id, current_user_role)
+        self._validate_assignee(issue.project_id, assignee_id)
         
         updated_issue = self.issue_repository.assign_issue(issue_id, assignee_id)
 
@@ -181,8 +212,7 @@ class IssueService:
         if not issue:
             raise IssueNotFoundError()
         
-        can_update, _ = self._can_update_issue(issue, current_user_id, current_user_role)
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("You are not authorized to close this issue.")
         
         updated_issue = self.issue_repository.close_issue(issue_id, current_user_id)
@@ -198,8 +228,7 @@ class IssueService:
         if not issue:
             raise IssueNotFoundError()
         
-        can_update, _ = self._can_update_issue(issue, current_user_id, current_user_role)
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("You are not authorized to reopen this issue.")
         
         updated_issue = self.issue_repository.reopen_issue(issue_id)
@@ -219,27 +248,15 @@ class IssueService:
         if current_user_role == UserRole.ADMIN:
             return self.issue_repository.get_issues_by_assignee(assignee_id)
         
-        # Project Manager can see assigned issues for users in their projects
+        # Project Manager can see assigned issues in projects they created or are a member of
         if current_user_role == UserRole.PROJECT_MANAGER:
-            issues = self.issue_repository.get_issues_by_assignee(assignee_id)
-            accessible_issues = []
-            for issue in issues:
-                if self._can_view_issue(issue.project_id, current_user_id, current_user_role):
-                    accessible_issues.append(issue)
-                    return accessible_issues
-
-        # Contributors can only see their own assigned issues
+            return self.issue_repository.get_issues_by_assignee(assignee_id, visible_to=current_user_id, include_created_projects=True)
+
+        # Contributors can only see their own assigned issues, in projects they are a member of
         if assignee_id != current_user_id:
             raise NotAuthorizedError("You can only view your assigned issues.")
         
-        issues = self.issue_repository.get_issues_by_assignee(assignee_id)
-        # Filter issues from projects user has access to
-        accessible_issues = []
-        for issue in issues:
-            if self._can_view_issue(issue.project_id, current_user_id, current_user_role):
-                accessible_issues.append(issue)
-        
-        return accessible_issues
+        return self.issue_repository.get_issues_by_assignee(assignee_id, visible_to=current_user_id)
 
     def get_issues_by_author(self, author_id: int, current_user_id: int, current_user_role: UserRole) -> list[Issue]:
         """Get issues created by user"""
@@ -258,14 +275,8 @@ class IssueService:
                 raise NotAuthorizedError("You can only view issues created by yourself.")
             return self.issue_repository.get_issues_by_author(author_id)
         
-        # Project Managers can view issues authored by anyone in projects they own 
-        issues = self.issue_repository.get_issues_by_author(author_id)
-        accessible_issues = []
-        for issue in issues:
-            if self._can_view_issue(issue.project_id, current_user_id, current_user_role):
-                accessible_issues.append(issue)
-        
-        return accessible_issues
+        # Project Managers can view issues authored by anyone in projects they created or are a member of
+        return self.issue_repository.get_issues_by_author(author_id, visible_to=current_user_id, include_created_projects=True)
 
     def add_label_to_issue(self, issue_id: int, label_id: int, current_user_id: int, current_user_role: UserRole) -> None:
         """Add label to issue"""
@@ -280,8 +291,7 @@ class IssueService:
             raise LabelNotFoundError()
         
         # Check if user is authorized to modify this issue
-        can_update, _ = self._can_update_issue(issue,current_user_id,current_user_role)
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("You cannot add labels to this issue.")
         
         # Check if issue already has this label
@@ -305,54 +315,21 @@ class IssueService:
             raise LabelNotFoundError()
         
         # Check if user is authorized to modify this issue
-        can_update, _ = self._can_update_issue(issue,current_user_id,current_user_role)
-        if not can_update:
+        if not self._can_update_issue(issue):
             raise NotAuthorizedError("You cannot remove labels from this issue.")
         
         self.issue_repository.remove_label_from_issue(issue_id, label_id)
 
-    def _can_create_issue_in_project(self, project: Project, user_id: int, user_role: UserRole) -> bool:
-        """Check if user can create issues in project"""
-        if user_role == UserRole.ADMIN:
-            return True
-        
-        if user_role == UserRole.PROJECT_MANAGER and project.created_by == user_id:
+    def _can_update_issue(self, issue: Issue) -> bool:
+        """Check if the current user can update issue"""
+        # Admin, or the Project Manager who owns the project
+        if self.auth_context.manages_project(issue.project_id):
             return True
         
-        # Contributors can create issues in projects they are members of
-        return self.project_repository.is_member(project.id, user_id)
-
-    def _can_view_issue(self, project_id: int, user_id: int, user_role: UserRole) -> bool:
-        """Check if user can view issues in project"""
-        project = self.project_repository.get_by_id(project_id)
-        if not project:
-            return False
-        
-        if user_role == UserRole.ADMIN:
-            return True
-        
-        if user_role == UserRole.PROJECT_MANAGER and project.created_by == user_id:
-            return True
-        
-        return self.project_repository.is_member(project_id, user_id)
-
-    def _can_update_issue(self, issue: Issue, user_id: int, user_role: UserRole) -> tuple[bool, Project | None]:
-        """Check if user can update issue"""
-        project = self.project_repository.get_by_id(issue.project_id)
-        if not project:
-            return False, None
-
-        if user_role == UserRole.ADMIN:
-            return True, project
-        
-        # Project Manager can update issues in their projects
-        if user_role == UserRole.PROJECT_MANAGER and project.created_by == user_id:
-            return True, project
-        
         # Contributors can update issues assigned to them or issues they created
-        return issue.assignee_id == user_id or issue.author_id == user_id, project
+        return issue.assignee_id == self.auth_context.user_id or issue.author_id == self.auth_context.user_id
 
-    def _validate_assignee(self, project: Project, assignee_id: int, current_user_id: int, current_user_role: UserRole) -> None:
+    def _validate_assignee(self, project_id: int, assignee_id: int) -> None:
         """Validate if user can be assigned to project issues"""
         # Check if assignee exists and is active
         assignee = self.user_repository.get_by_id(assignee_id)
@@ -362,16 +339,32 @@ class IssueService:
         if not assignee.is_active:
             raise InactiveUserAccountError("Cannot assign issues to inactive users.")
         
-        if not self.project_repository.is_member(project.id, assignee_id):
+        if not self.project_repository.is_member(project_id, assignee_id):
             raise IssueAssigneeError()
         
-        if current_user_role == UserRole.ADMIN:
-            return
-        
-        if current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id:
+        self._check_assigner(project_id, assignee_id)
+
+    def _check_bulk_assignee(self, project_id: int, assignee: User | None, assignee_id: int, memberships: set[tuple[int, int]]) -> None:
+        """Same rules as _validate_assignee, checked against preloaded users and memberships"""
+        if not assignee:
+            raise UserNotFoundError()
+
+        if not assignee.is_active:
+            raise InactiveUserAccountError("Cannot assign issues to inactive users.")
+
+        if (project_id, assignee_id) not in memberships:
+            raise IssueAssigneeError()
+
+        self._check_assigner(project_id, assignee_id)
+
+    def _check_assigner(self, project_id: int, assignee_id: int) -> None:
+        """Check if the current user may assign this user in the project"""
+        # Admin, or the Project Manager who owns the project
+        if self.auth_context.manages_project(project_id):
             return
-        
-        if current_user_role == UserRole.CONTRIBUTOR and assignee_id == current_user_id:
+
+        # Contributors can only assign themselves
+        if self.auth_context.role == UserRole.CONTRIBUTOR and assignee_id == self.auth_context.user_id:
             return
 
-        raise NotAuthorizedError("You are not authorized to assign this user to the issue.")
\ No newline at end of file
+        raise NotAuthorizedError("You are not authorized to assign this user to the issue.")
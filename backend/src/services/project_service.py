@@ -1,16 +1,19 @@
 from src.dto.project import ProjectCreate, ProjectUpdate
 from src.repositories import ProjectRepository, UserRepository
 from src.models import Project, UserRole, User, ProjectStatus
+from src.pagination import Page, PageParams
 from src.exceptions.auth_exceptions import NotAuthorizedError
 from src.exceptions.project_exceptions import ProjectNotFoundError, AlreadyProjectMemberError, ProjectCreatorRemoveError, NotProjectMemberError, InvalidProjectStatusError
 from src.exceptions.user_exceptions import UserNotFoundError, InactiveUserAccountError
+from src.security.auth_context import AuthContext
 
 class ProjectService:
     """Service for project operations"""
     
-    def __init__(self, project_repository: ProjectRepository, user_repository: UserRepository):
+    def __init__(self, project_repository: ProjectRepository, user_repository: UserRepository, auth_context: AuthContext):
         self.project_repository = project_repository
         self.user_repository = user_repository
+        self.auth_context = auth_context
 
     def create_project(self, project_create: ProjectCreate, current_user_id: int, current_user_role: UserRole) -> Project:
         """Create a new project (Admin and Project Manager only)"""
@@ -23,36 +26,28 @@ class ProjectService:
 
     def get_project_by_id(self, project_id: int, current_user_id: int, current_user_role: UserRole) -> Project:
         """Get project by ID"""
-        project = self.project_repository.get_by_id(project_id)
+        project = self.project_repository.get_by_id(project_id, load_relationships=True)
         if not project:
             raise ProjectNotFoundError()
         
-        # Admin can see any project
-        if current_user_role == UserRole.ADMIN:
-            return project
-        
-        # Project Manager can see projects they created
-        if current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id:
-            return project
-        
-        # Contributors can only see projects they are members of
-        if self.project_repository.is_member(project_id, current_user_id):
+        # Admin can see any project, Project Manager the projects they created, Contributors their member projects
+        if self.auth_context.can_access_project(project_id):
             return project
         
         raise NotAuthorizedError("Not authorized to view this project.")
 
-    def get_all_projects(self, current_user_id: int, current_user_role: UserRole) -> list[Project]:
-        """Get all projects based on user role"""
+    def get_all_projects(self, current_user_id: int, current_user_role: UserRole, page_params: PageParams) -> Page[Project]:
+        """Get one page of all projects based on user role"""
         # Admin can see all projects
         if current_user_role == UserRole.ADMIN:
-            projects = self.project_repository.get_all()
+            projects = self.project_repository.get_page(page_params)
 
         # Project Manager can see projects they created
         elif current_user_role == UserRole.PROJECT_MANAGER:
-            projects = self.project_repository.get_projects_by_creator(current_user_id)
+            projects = self.project_repository.get_projects_page_by_creator(current_user_id, page_params)
         else:
             # Contributors can only see projects they are members of
-            projects = self.project_repository.get_user_projects(current_user_id)
+            projects = self.project_repository.get_user_projects_page(current_user_id, page_params)
         
         return projects
 
@@ -62,12 +57,8 @@ class ProjectService:
         if not project:
             raise ProjectNotFoundError()
         
-        if not (
-            # Admin can update any project
-            current_user_role == UserRole.ADMIN
-            # Project Manager can update projects they created
-            or (current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id)
-        ):
+        # Admin can update any project, Project Manager can update projects they created
+        if not self.auth_context.manages_project(project_id):
             raise NotAuthorizedError("Not authorized to update this project.")
         
         updated_project = self.project_repository.update(project_id, project_update)
@@ -83,12 +74,8 @@ class ProjectService:
         if not project:
             raise ProjectNotFoundError()
         
-        if not (
-            # Admin can delete any project
-            current_user_role == UserRole.ADMIN
-            # Project Manager can delete projects they created
-            or (current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id)
-        ):
+        # Admin can delete any project, Project Manager can delete projects they created
+        if not self.auth_context.manages_project(project_id):
             raise NotAuthorizedError("Not authorized to delete this project.")
 
         self.project_repository.delete(project_id)
@@ -107,12 +94,8 @@ class ProjectService:
         if not project:
             raise ProjectNotFoundError()
         
-        if not (
-            # Admin can add members to any project
-            current_user_role == UserRole.ADMIN
-            # Project Manager can add members to projects they created
-            or (current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id)
-        ):
+        # Admin can add members to any project, Project Manager can add members to projects they created
+        if not self.auth_context.manages_project(project_id):
             raise NotAuthorizedError("Not authorized to add members to this project.")
 
         if self.project_repository.is_member(project_id, user_id):
@@ -129,12 +112,8 @@ class ProjectService:
         if not self.project_repository.is_member(project_id, user_id):
             raise NotProjectMemberError()
         
-        if not (
-            # Admin can remove members from any project
-            current_user_role == UserRole.ADMIN
-            # Project Manager can remove members from projects they created
-            or (current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id)
-        ):
+        # Admin can remove members from any project, Project Manager can remove members from projects they created
+        if not self.auth_context.manages_project(project_id):
             raise NotAuthorizedError("Not authorized to remove members from this project.")
 
         if user_id == project.created_by:
@@ -148,14 +127,8 @@ class ProjectService:
         if not project:
             raise ProjectNotFoundError()
         
-        # Admin can see members of any project
-        if current_user_role == UserRole.ADMIN:
-            return self.project_repository.get_project_members(project_id)
-        # Project Manager can see members of projects they created
-        if current_user_role == UserRole.PROJECT_MANAGER and project.created_by == current_user_id:
-            return self.project_repository.get_project_members(project_id)
-        # Contributors can see members of projects they are part of
-        if self.project_repository.is_member(project_id, current_user_id):
+        # Admin can see members of any project, Project Manager of projects they created, Contributors of their member projects
+        if self.auth_context.can_access_project(project_id):
             return self.project_repository.get_project_members(project_id)
         
         raise NotAuthorizedError("Not authorized to view members of this project.")
@@ -178,11 +151,9 @@ class ProjectService:
 
         # Project Manager can see their projects with this status
         elif current_user_role == UserRole.PROJECT_MANAGER:
-            all_projects = self.project_repository.get_projects_by_creator(current_user_id)
-            projects = [project for project in all_projects if project.status == status]
+            projects = self.project_repository.get_projects_by_status(status, creator_id=current_user_id)
         else:
             # Contributors can see their member projects with this status
-            all_projects = self.project_repository.get_user_projects(current_user_id)
-            projects = [project for project in all_projects if project.status == status]
+            projects = self.project_repository.get_projects_by_status(status, member_id=current_user_id)
         
         return projects
\ No newline at end of file
@@ -1,9 +1,12 @@
 from src.models import User, UserRole
 from src.dto.user import UserCreate, UserUpdate
 from src.repositories import UserRepository
-from src.security.security import get_password_hash
+from src.security.password_hasher import password_hasher
+from src.security.principal_cache import principal_cache
+from src.security.token_versions import token_versions
 from src.exceptions.user_exceptions import EmailAlreadyExistsError, UsernameAlreadyExistsError, UserNotFoundError
 from src.exceptions.auth_exceptions import NotAuthorizedError
+from src.pagination import Page, PageParams
 
 class UserService:
     """Service for user operations"""
@@ -25,7 +28,7 @@ class UserService:
             raise EmailAlreadyExistsError()
         
         # Hash password
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = password_hasher.hash(user_create.password)
         db_user = User.model_validate(user_create, update={"password_hash": hashed_password})
         
         return self.user_repository.create(db_user)
@@ -36,18 +39,18 @@ class UserService:
         if not current_user_role == UserRole.ADMIN and current_user_id != user_id:
             raise NotAuthorizedError("You can only view your own profile.")
         
-        user = self.user_repository.get_by_id(user_id)
+        user = self.user_repository.get_by_id(user_id, load_relationships=True)
         if not user:
             raise UserNotFoundError()
 
         return user
 
-    def get_all_users(self, current_user_role: UserRole) -> list[User]:
-        """Get all users (Admin only)"""
+    def get_all_users(self, current_user_role: UserRole, page_params: PageParams) -> Page[User]:
+        """Get one page of all users (Admin only)"""
         if not current_user_role == UserRole.ADMIN:
             raise NotAuthorizedError("You can only view your own profile.")
         
-        return self.user_repository.get_all()
+        return self.user_repository.get_page(page_params)
 
     def get_active_users(self, current_user_role: UserRole) -> list[User]:
         """Get all active users (Admin and Project Manager)"""
@@ -62,6 +65,11 @@ class UserService:
         if not current_user_role == UserRole.ADMIN and current_user_id != user_id:
             raise NotAuthorizedError("You can only update your own profile.")
         
+        existing_user = self.user_repository.get_by_id(user_id)
+        if not existing_user:
+            raise UserNotFoundError()
+        previous_role, was_active = existing_user.role, existing_user.is_active
+        
         update_data = user_update.model_dump(exclude_unset=True)
         extra_data = {}
 
@@ -78,7 +86,7 @@ class UserService:
 
         # If updating password, hash it
         if "password" in update_data:
-            hashed_password = get_password_hash(update_data.pop("password"))
+            hashed_password = password_hasher.hash(update_data.pop("password"))
             extra_data["password_hash"] = hashed_password
         
         # Non-admins cannot change their role
@@ -102,7 +110,13 @@ class UserService:
         
         if not updated_user:
             raise UserNotFoundError()
-            
+        
+        # Tokens carrying the old role or issued before deactivation must stop working
+        if updated_user.role != previous_role or (was_active and not updated_user.is_active):
+            self._revoke_tokens(user_id)
+        
+        # Role or active flag may have changed
+        principal_cache.invalidate(user_id)
         return updated_user
         
 
@@ -113,6 +127,9 @@ class UserService:
         
         if not self.user_repository.delete(user_id):
             raise UserNotFoundError()
+        
+        token_versions.mark_deleted(user_id)
+        principal_cache.invalidate(user_id)
 
     def deactivate_user(self, user_id: int, current_user_role: UserRole) -> User:
         """Deactivate user (Admin only)"""
@@ -123,6 +140,8 @@ class UserService:
         if not user:
             raise UserNotFoundError()
         
+        self._revoke_tokens(user_id)
+        principal_cache.invalidate(user_id)
         return user
         
     def activate_user(self, user_id: int, current_user_role: UserRole) -> User:
@@ -134,6 +153,7 @@ class UserService:
         if not user:
             raise UserNotFoundError()
         
+        principal_cache.invalidate(user_id)
         return user
 
     def get_users_by_role(self, role: str, current_user_role: UserRole) -> list[User]:
@@ -141,4 +161,10 @@ class UserService:
         if not current_user_role == UserRole.ADMIN:
             raise NotAuthorizedError("Only admins can view users by role.")
         
-        return self.user_repository.get_users_by_role(role)
\ No newline at end of file
+        return self.user_repository.get_users_by_role(role)
+
+    def _revoke_tokens(self, user_id: int) -> None:
+        """Bump the user's token version so stateless tokens issued before now are rejected"""
+        user = self.user_repository.bump_token_version(user_id)
+        if user:
+            token_versions.bump(user_id, user.token_version)
@@ -0,0 +1,85 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+from src.models import User, ApiKey
+from src.security.api_key_usage import api_key_usage
+from src.security.security import hash_api_key
+from tests.conftest import QueryCounter, get_auth_token, get_auth_headers
+
+def create_key(client: TestClient, headers: dict, **data) -> dict:
+    response = client.post("/api/v1/api-keys/", json={"name": "CI", **data}, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+class TestApiKeys:
+    """Test service-account API keys"""
+
+    def test_key_authenticates_within_its_scopes(self, client: TestClient, regular_user: User, test_session: Session):
+        """Test that a read key works for reads, is refused for writes and is stored only as a hash"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        created = create_key(client, headers)
+        assert created["api_key"].startswith("sdk_")
+        assert created["scopes"] == ["read"]
+
+        stored = test_session.exec(select(ApiKey)).one()
+        assert stored.key_hash == hash_api_key(created["api_key"])
+
+        key_headers = get_auth_headers(created["api_key"])
+        response = client.get("/api/v1/users/me", headers=key_headers)
+        assert response.status_code == 200
+        assert response.json()["username"] == "johndoe"
+        assert client.get("/api/v1/projects/", headers=key_headers).status_code == 200
+
+        response = client.post("/api/v1/projects/", json={"name": "From CI"}, headers=key_headers)
+        assert response.status_code == 403
+
+        response = client.get("/api/v1/api-keys/", headers=headers)
+        assert [key["name"] for key in response.json()] == ["CI"]
+        assert "api_key" not in response.json()[0]
+
+    def test_only_admins_issue_keys_for_others(self, client: TestClient, admin_user: User, regular_user: User, project_manager_user: User):
+        """Test that admins can create keys for a service account and others cannot"""
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+
+        created = create_key(client, admin_headers, user_id=project_manager_user.id, scopes=["read", "write"])
+        assert created["user_id"] == project_manager_user.id
+        response = client.post("/api/v1/projects/", json={"name": "Bot Project"}, headers=get_auth_headers(created["api_key"]))
+        assert response.status_code == 201
+
+        response = client.post("/api/v1/api-keys/", json={"name": "Sneaky", "user_id": project_manager_user.id}, headers=user_headers)
+        assert response.status_code == 403
+
+    def test_revoked_and_unknown_keys_are_rejected(self, client: TestClient, regular_user: User):
+        """Test that revoked and made-up keys get 401"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        created = create_key(client, headers)
+
+        assert client.delete(f"/api/v1/api-keys/{created['id']}", headers=headers).status_code == 204
+        assert client.get("/api/v1/users/me", headers=get_auth_headers(created["api_key"])).status_code == 401
+        assert client.get("/api/v1/users/me", headers=get_auth_headers("sdk_not-a-real-key")).status_code == 401
+
+    def test_validation_is_one_lookup(self, client: TestClient, test_engine, regular_user: User):
+        """Test that a key and its user are loaded in a single query"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        key_headers = get_auth_headers(create_key(client, headers)["api_key"])
+
+        with QueryCounter(test_engine) as profile:
+            assert client.get("/api/v1/projects/", headers=key_headers).status_code == 200
+        auth_statements = [statement for statement in profile.statements if "api_keys" in statement or "WHERE users.id" in statement]
+        assert len(auth_statements) == 1
+        assert "api_keys.key_hash" in auth_statements[0]
+
+    def test_last_used_is_written_in_batches(self, client: TestClient, regular_user: User, test_session: Session):
+        """Test that requests only record usage in memory until the next flush"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        key_headers = get_auth_headers(create_key(client, headers)["api_key"])
+
+        for _ in range(3):
+            assert client.get("/api/v1/projects/", headers=key_headers).status_code == 200
+        stored = test_session.exec(select(ApiKey)).one()
+        assert stored.last_used_at is None
+
+        assert api_key_usage.flush(test_session) == 1
+        test_session.refresh(stored)
+        assert stored.last_used_at is not None
+        assert api_key_usage.flush(test_session) == 0
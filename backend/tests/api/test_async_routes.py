@@ -0,0 +1,294 @@
+import pytest
+from typing import Generator
+from fastapi import FastAPI, APIRouter
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.api.routes import auth, async_projects, async_issues, async_comments
+from src.pagination import NEXT_CURSOR_HEADER
+from src.database import get_db_session, get_async_db_session, unit_of_work, async_unit_of_work
+from src.models import User, Project, Issue, Comment
+from tests.conftest import get_auth_token, get_auth_headers
+
+@pytest.fixture(scope="module")
+def test_db_path(tmp_path_factory) -> str:
+    """File-based SQLite database shared by the sync fixtures and the async routes"""
+    return str(tmp_path_factory.mktemp("async_db") / "test.db")
+
+@pytest.fixture(scope="module")
+def test_engine(test_db_path: str):
+    """Override the in-memory engine so the async engine sees fixture data"""
+    return create_engine(f"sqlite:///{test_db_path}", connect_args={"check_same_thread": False})
+
+@pytest.fixture(scope="function")
+def async_client(test_session: Session, test_db_path: str) -> Generator[TestClient, None, None]:
+    """Create test client serving issues, projects and comments from the async stack"""
+    # NullPool -> every session opens its connection inside the running event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{test_db_path}", poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_test_async_db_session():
+        async with session_factory() as session:
+            async with async_unit_of_work(session):
+                yield session
+
+    def get_test_db_session():
+        with unit_of_work(test_session):
+            yield test_session
+
+    router = APIRouter(prefix="/api/v1")
+    router.include_router(auth.router)
+    router.include_router(async_projects.router)
+    router.include_router(async_issues.router)
+    router.include_router(async_comments.router)
+
+    async_app = FastAPI()
+    async_app.include_router(router)
+    async_app.dependency_overrides[get_db_session] = get_test_db_session
+    async_app.dependency_overrides[get_async_db_session] = get_test_async_db_session
+
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+class TestAsyncIssueEndpoints:
+    """Test issue endpoints served by the async stack"""
+
+    def test_create_issue_as_member(self, async_client: TestClient, regular_user: User, sample_project: Project):
+        """Test creating issue as project member"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        issue_data = {
+            "title": "Async Issue",
+            "priority": "High",
+            "project_id": sample_project.id,
+            "assignee_id": regular_user.id
+        }
+
+        response = async_client.post("/api/v1/issues/", json=issue_data, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["title"] == "Async Issue"
+        assert data["author_id"] == regular_user.id
+        assert data["author"]["username"] == "johndoe"
+        assert data["project"]["id"] == sample_project.id
+        assert data["comments"] == []
+
+    def test_bulk_create_issues(self, async_client: TestClient, regular_user: User, admin_user: User, sample_project: Project):
+        """Test bulk creation with one failing row"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        issues_data = [
+            {"title": "Async Bulk 1", "project_id": sample_project.id, "assignee_id": regular_user.id},
+            {"title": "Async Bulk 2", "project_id": sample_project.id, "assignee_id": admin_user.id},
+            {"title": "Async Bulk 3", "project_id": sample_project.id}
+        ]
+
+        response = async_client.post("/api/v1/issues/bulk", json=issues_data, headers=headers)
+
+        assert response.status_code == 207
+        data = response.json()
+        assert data["created"] == 2
+        assert [result["status_code"] for result in data["results"]] == [201, 400, 201]
+
+    def test_create_issue_as_non_member(self, async_client: TestClient, regular_user: User, sample_project_base: Project):
+        """Test creating issue as non-member (should fail)"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        issue_data = {"title": "Should Fail", "project_id": sample_project_base.id}
+
+        response = async_client.post("/api/v1/issues/", json=issue_data, headers=headers)
+
+        assert response.status_code == 403
+
+    def test_get_issue_by_id_with_comments(self, async_client: TestClient, regular_user: User, sample_comment: Comment):
+        """Test that nested relationships are serialized without lazy loading"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.get(f"/api/v1/issues/{sample_comment.issue_id}", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["assignee"]["id"] == regular_user.id
+        assert len(data["comments"]) == 1
+        assert data["comments"][0]["author"]["username"] == "johndoe"
+
+    def test_get_all_issues_as_admin(self, async_client: TestClient, admin_user: User, sample_issue: Issue):
+        """Test getting all issues as admin"""
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.get("/api/v1/issues/", headers=headers)
+
+        assert response.status_code == 200
+        assert [issue["id"] for issue in response.json()] == [sample_issue.id]
+
+    def test_get_all_issues_paginated(self, async_client: TestClient, admin_user: User, sample_issue: Issue, test_session: Session):
+        """Test keyset pagination through the async repositories"""
+        second_issue = Issue(title="Second Issue", project_id=sample_issue.project_id, author_id=admin_user.id)
+        test_session.add(second_issue)
+        test_session.commit()
+
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.get("/api/v1/issues/", params={"limit": 1}, headers=headers)
+        assert response.status_code == 200
+        assert [issue["id"] for issue in response.json()] == [sample_issue.id]
+
+        next_cursor = response.headers[NEXT_CURSOR_HEADER]
+        response = async_client.get("/api/v1/issues/", params={"limit": 1, "cursor": next_cursor}, headers=headers)
+        assert response.status_code == 200
+        assert [issue["id"] for issue in response.json()] == [second_issue.id]
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_search_issues(self, async_client: TestClient, regular_user: User, admin_user: User, sample_issue: Issue, test_session: Session):
+        """Test issue search through the async repositories"""
+        hidden_project = Project(name="Hidden Project", created_by=admin_user.id)
+        test_session.add(hidden_project)
+        test_session.commit()
+        test_session.add(Issue(title="Test Hidden", project_id=hidden_project.id or 0, author_id=admin_user.id))
+        test_session.commit()
+
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.get("/api/v1/issues/search", params={"q": "test", "status": ["Open"]}, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [issue["id"] for issue in data] == [sample_issue.id]
+        assert data[0]["project"]["id"] == sample_issue.project_id
+
+    def test_update_close_and_reopen_issue(self, async_client: TestClient, admin_user: User, sample_issue: Issue):
+        """Test issue write operations"""
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.patch(f"/api/v1/issues/{sample_issue.id}", json={"priority": "Critical"}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["priority"] == "Critical"
+
+        response = async_client.patch(f"/api/v1/issues/{sample_issue.id}/close", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "Closed"
+        assert response.json()["closed_by"] == admin_user.id
+
+        response = async_client.patch(f"/api/v1/issues/{sample_issue.id}/reopen", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "Open"
+        assert response.json()["closed_by"] is None
+
+    def test_delete_issue_as_admin(self, async_client: TestClient, admin_user: User, sample_issue: Issue):
+        """Test deleting issue as admin"""
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.delete(f"/api/v1/issues/{sample_issue.id}", headers=headers)
+        assert response.status_code == 204
+
+        response = async_client.get(f"/api/v1/issues/{sample_issue.id}", headers=headers)
+        assert response.status_code == 404
+
+class TestAsyncProjectEndpoints:
+    """Test project endpoints served by the async stack"""
+
+    def test_create_project_as_admin(self, async_client: TestClient, admin_user: User):
+        """Test creating project as admin"""
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.post("/api/v1/projects/", json={"name": "Async Project"}, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["name"] == "Async Project"
+        assert data["creator"]["id"] == admin_user.id
+        assert data["members"] == []
+        assert data["issues"] == []
+        assert data["issue_stats"]["open_count"] == 0
+
+    def test_get_all_projects_as_member(self, async_client: TestClient, regular_user: User, sample_issue: Issue):
+        """Test contributor sees member projects with nested members, issues and issue rollup"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+        # The fixture project has no rollup row yet, the first write computes it from every issue
+        created = async_client.post("/api/v1/issues/", json={"title": "Second", "project_id": sample_issue.project_id, "time_estimate": 4}, headers=headers)
+        assert created.status_code == 201
+
+        response = async_client.get("/api/v1/projects/", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert [member["id"] for member in data[0]["members"]] == [regular_user.id]
+        assert [issue["id"] for issue in data[0]["issues"]] == [sample_issue.id, created.json()["id"]]
+        assert data[0]["issue_stats"]["open_count"] == 2
+        assert data[0]["issue_stats"]["open_estimate_hours"] == 4
+
+    def test_add_member_and_get_members(self, async_client: TestClient, admin_user: User, project_manager_user: User, sample_project: Project):
+        """Test adding a member and listing project members"""
+        token = get_auth_token(async_client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.post(f"/api/v1/projects/{sample_project.id}/members/{project_manager_user.id}", headers=headers)
+        assert response.status_code == 204
+
+        response = async_client.get(f"/api/v1/projects/{sample_project.id}/members", headers=headers)
+        assert response.status_code == 200
+        usernames = {member["username"] for member in response.json()}
+        assert usernames == {"johndoe", "pmuser"}
+
+class TestAsyncCommentEndpoints:
+    """Test comment endpoints served by the async stack"""
+
+    def test_create_comment_as_member(self, async_client: TestClient, regular_user: User, sample_issue: Issue):
+        """Test creating comment as project member"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        comment_data = {"content": "Async comment", "issue_id": sample_issue.id}
+
+        response = async_client.post("/api/v1/comments/", json=comment_data, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["content"] == "Async comment"
+        assert data["author"]["id"] == regular_user.id
+
+    def test_get_comments_by_issue_and_author(self, async_client: TestClient, regular_user: User, sample_comment: Comment):
+        """Test listing comments by issue and by author"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.get(f"/api/v1/comments/issue/{sample_comment.issue_id}", headers=headers)
+        assert response.status_code == 200
+        assert [comment["id"] for comment in response.json()] == [sample_comment.id]
+
+        response = async_client.get(f"/api/v1/comments/author/{regular_user.id}", headers=headers)
+        assert response.status_code == 200
+        assert [comment["id"] for comment in response.json()] == [sample_comment.id]
+
+    def test_update_and_delete_comment(self, async_client: TestClient, regular_user: User, sample_comment: Comment):
+        """Test updating and deleting own comment"""
+        token = get_auth_token(async_client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        response = async_client.patch(f"/api/v1/comments/{sample_comment.id}", json={"content": "Edited"}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["content"] == "Edited"
+
+        response = async_client.delete(f"/api/v1/comments/{sample_comment.id}", headers=headers)
+        assert response.status_code == 204
+
+    def test_unauthenticated_request(self, async_client: TestClient):
+        """Test async auth dependency rejects missing credentials"""
+        response = async_client.get("/api/v1/comments/author/1")
+
+        assert response.status_code in (401, 403)
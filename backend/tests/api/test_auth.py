@@ -1,7 +1,23 @@
+import asyncio
 import pytest
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
-from src.models import User
-from tests.conftest import get_auth_token
+from passlib.context import CryptContext
+from sqlalchemy import text
+from sqlmodel import Session, select
+from src.config import settings
+from src.models import User, Issue, RefreshToken, TokenRevocation
+from src.repositories import RefreshTokenRepository, UserRepository
+from src.models.enums import UserRole
+from src.security.principal_cache import Principal, PrincipalCache, principal_cache
+from src.security.password_hasher import PasswordHasher
+from src.security.token_cache import VerifiedTokenCache, token_cache
+from src.security.token_versions import REVOCATION_OVERLAP, token_versions
+from src.security import security
+from src.security.security import hash_refresh_token
+from tests.conftest import QueryCounter, get_auth_token, get_auth_headers
 
 class TestAuthEndpoints:
     """Test authentication endpoints"""
@@ -215,4 +231,368 @@ class TestAuthEndpoints:
         assert isinstance(data["access_token"], str)
         assert len(data["access_token"]) > 0
         assert isinstance(data["expires_in"], int)
-        assert data["expires_in"] > 0
\ No newline at end of file
+        assert data["expires_in"] > 0
+
+
+def _user_selects(counter: QueryCounter) -> int:
+    return sum(1 for statement in counter.statements if "FROM users" in statement)
+
+
+class TestPrincipalCache:
+    """Test the user lookup behind authenticated requests"""
+
+    def test_one_user_lookup_then_cache_hits(self, client: TestClient, test_engine, regular_user: User, sample_issue: Issue):
+        """Test that the first request loads the user once and later ones skip the users table"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        with QueryCounter(test_engine) as profile:
+            assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+        assert _user_selects(profile) == 1
+
+        with QueryCounter(test_engine) as cached:
+            assert client.get(f"/api/v1/issues/{sample_issue.id}", headers=headers).status_code == 200
+        # Only the issue's own author and assignee loads touch users
+        assert all("WHERE users.id" not in statement for statement in cached.statements)
+
+    def test_deactivation_takes_effect_immediately(self, client: TestClient, admin_user: User, regular_user: User):
+        """Test that deactivating a user invalidates their cached principal"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 200
+        assert principal_cache.get(regular_user.id or 0) is not None
+
+        response = client.patch(f"/api/v1/users/{regular_user.id}/deactivate", headers=admin_headers)
+        assert response.status_code == 200
+
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 401
+
+    def test_role_change_takes_effect_immediately(self, client: TestClient, admin_user: User, regular_user: User):
+        """Test that promoting a user is visible on their next request"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+
+        project_data = {"name": "Promoted Project"}
+        assert client.post("/api/v1/projects/", json=project_data, headers=user_headers).status_code == 403
+
+        response = client.patch(f"/api/v1/users/{regular_user.id}", json={"role": "Project Manager"}, headers=admin_headers)
+        assert response.status_code == 200
+
+        assert client.post("/api/v1/projects/", json=project_data, headers=user_headers).status_code == 201
+
+    def test_cache_expires_and_stays_bounded(self):
+        """Test the TTL, the disabled cache and the entry bound"""
+        principal = Principal(id=1, role=UserRole.CONTRIBUTOR, is_active=True)
+
+        disabled = PrincipalCache(ttl_seconds=0)
+        disabled.put(principal)
+        assert disabled.get(1) is None
+
+        bounded = PrincipalCache(ttl_seconds=60, max_entries=3)
+        for i in range(10):
+            bounded.put(Principal(id=i, role=UserRole.CONTRIBUTOR, is_active=True))
+        assert len(bounded._entries) <= 3
+        assert bounded.get(9) is not None
+
+        bounded.invalidate(9)
+        assert bounded.get(9) is None
+
+
+class TestPasswordHashing:
+    """Test the bounded password hashing pool"""
+
+    def test_login_returns_503_when_queue_is_full(self, client: TestClient, regular_user: User, monkeypatch):
+        """Test that logins beyond the pool and queue are turned away with Retry-After"""
+        hasher = PasswordHasher(workers=1, queue_limit=0, retry_after_seconds=7)
+        monkeypatch.setattr("src.services.auth_service.password_hasher", hasher)
+
+        release = threading.Event()
+        busy = threading.Thread(target=hasher.run, args=(release.wait,))
+        busy.start()
+        try:
+            while hasher.metrics.running == 0:
+                time.sleep(0.01)
+
+            response = client.post("/api/v1/auth/login", json={"username": "johndoe", "password": "userpass123"})
+
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "7"
+            assert hasher.metrics.rejected == 1
+        finally:
+            release.set()
+            busy.join()
+            hasher.shutdown()
+
+        assert client.post("/api/v1/auth/login", json={"username": "johndoe", "password": "userpass123"}).status_code == 200
+
+    def test_waiting_callers_hold_no_thread(self):
+        """Test that queued async callers only await the pool, and a cancelled wait gives its slot back"""
+        hasher = PasswordHasher(workers=1, queue_limit=1, retry_after_seconds=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = asyncio.ensure_future(hasher.run_async(release.wait))
+            queued = asyncio.ensure_future(hasher.run_async(lambda: "hashed"))
+            await asyncio.sleep(0.05)
+            # The event loop stays free while both wait on the bcrypt pool
+            assert not running.done() and not queued.done()
+            assert hasher.metrics.queue_depth == 1
+
+            queued.cancel()
+            await asyncio.sleep(0.05)
+            assert hasher.metrics.queue_depth == 0
+
+            release.set()
+            await running
+            return await hasher.run_async(lambda: "hashed")
+
+        try:
+            assert asyncio.run(scenario()) == "hashed"
+        finally:
+            release.set()
+            hasher.shutdown()
+
+    def test_login_rehashes_outdated_cost(self, client: TestClient, test_session: Session):
+        """Test that a hash made with another bcrypt cost is replaced on login"""
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("cheappass123")
+        user = User(firstname="Old", lastname="Hash", username="oldhash", email="oldhash@example.com", password_hash=old_hash)
+        test_session.add(user)
+        test_session.commit()
+
+        response = client.post("/api/v1/auth/login", json={"username": "oldhash", "password": "cheappass123"})
+
+        assert response.status_code == 200
+        test_session.refresh(user)
+        assert user.password_hash != old_hash
+        assert user.password_hash.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+        assert client.post("/api/v1/auth/login", json={"username": "oldhash", "password": "cheappass123"}).status_code == 200
+
+    def test_metrics_endpoint(self, client: TestClient, regular_user: User, admin_user: User):
+        """Test that hashing queue depth and latency are reported to admins only"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.get("/metrics/password-hashing").status_code == 403
+        assert client.get("/metrics/password-hashing", headers=user_headers).status_code == 403
+
+        response = client.get("/metrics/password-hashing", headers=get_auth_headers(get_auth_token(client, "admin", "adminpass123")))
+
+        assert response.status_code == 200
+        metrics = response.json()
+        assert metrics["completed"] >= 1
+        assert metrics["queue_depth"] == 0
+        assert metrics["avg_hash_ms"] > 0
+
+
+class TestVerifiedTokenCache:
+    """Test the cache of verified JWT payloads"""
+
+    def test_token_is_verified_once(self, client: TestClient, regular_user: User, admin_user: User, monkeypatch):
+        """Test that repeat requests with one token skip signature verification"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        verifications = []
+        real_decode = security.jwt.decode
+        monkeypatch.setattr(security.jwt, "decode", lambda *args, **kwargs: verifications.append(1) or real_decode(*args, **kwargs))
+
+        for _ in range(3):
+            assert client.get("/api/v1/projects/", headers=headers).status_code == 200
+
+        assert len(verifications) == 1
+        # The rate limiter and the auth dependency both read the token on every request
+        assert token_cache.stats()["hits"] == 5
+        assert client.get("/metrics/token-cache", headers=headers).status_code == 403
+        # The admin's token is verified once more
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        assert client.get("/metrics/token-cache", headers=admin_headers).json()["misses"] == 2
+
+    def test_invalid_token_is_not_cached(self, client: TestClient):
+        """Test that a token failing verification is rejected every time"""
+        headers = {"Authorization": "Bearer invalid_token"}
+
+        for _ in range(2):
+            assert client.get("/api/v1/users/me", headers=headers).status_code == 401
+        assert token_cache.stats()["entries"] == 0
+
+    def test_entries_expire_and_stay_bounded(self):
+        """Test that entries expire with their token and the least recently used one is evicted"""
+        cache = VerifiedTokenCache(max_entries=2)
+        cache.put("expired", {"sub": "1", "exp": time.time() - 1})
+        assert cache.get("expired") is None
+
+        future = time.time() + 60
+        cache.put("a", {"sub": "1", "exp": future})
+        cache.put("b", {"sub": "2", "exp": future})
+        assert cache.get("a") == {"sub": "1", "exp": future}
+        cache.put("c", {"sub": "3", "exp": future})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestRefreshTokens:
+    """Test the refresh token flow"""
+
+    def _login(self, client: TestClient) -> dict:
+        response = client.post("/api/v1/auth/login", json={"username": "johndoe", "password": "userpass123"})
+        assert response.status_code == 200
+        return response.json()
+
+    def test_refresh_rotates_without_password_check(self, client: TestClient, regular_user: User, test_session: Session, monkeypatch):
+        """Test that refresh mints working tokens, stores only a hash and never touches bcrypt"""
+        tokens = self._login(client)
+        stored = test_session.exec(select(RefreshToken)).one()
+        assert stored.token_hash == hash_refresh_token(tokens["refresh_token"])
+        assert tokens["refresh_expires_in"] == settings.refresh_token_expire_days * 24 * 3600
+
+        monkeypatch.setattr("src.services.auth_service.password_hasher", None)
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+        assert response.status_code == 200
+        refreshed = response.json()
+        assert refreshed["refresh_token"] != tokens["refresh_token"]
+        assert client.get("/api/v1/users/me", headers=get_auth_headers(refreshed["access_token"])).status_code == 200
+
+    def test_reused_refresh_token_revokes_the_family(self, client: TestClient, regular_user: User):
+        """Test that presenting a rotated token again also revokes its replacement"""
+        tokens = self._login(client)
+        refreshed = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": refreshed["refresh_token"]})
+        assert response.status_code == 401
+
+    def test_logout_revokes_refresh_token(self, client: TestClient, regular_user: User):
+        """Test that a logged out refresh token no longer works"""
+        tokens = self._login(client)
+
+        response = client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 204
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+    def test_expired_unknown_and_inactive_are_rejected(self, client: TestClient, regular_user: User, test_session: Session):
+        """Test that refresh fails for unknown tokens, expired tokens and deactivated users"""
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": "not-a-refresh-token"})
+        assert response.status_code == 401
+
+        tokens = self._login(client)
+        stored = test_session.exec(select(RefreshToken)).one()
+        stored.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        test_session.add(stored)
+        test_session.commit()
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+        tokens = self._login(client)
+        regular_user.is_active = False
+        test_session.add(regular_user)
+        test_session.commit()
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+
+    def test_concurrent_refresh_rotates_once(self, client: TestClient, regular_user: User, test_session: Session, monkeypatch):
+        """Test that a refresh losing the race to revoke its token is treated as reuse"""
+        tokens = self._login(client)
+        real_get_by_hash = RefreshTokenRepository.get_by_hash
+
+        def get_by_hash_then_race(repository, token_hash):
+            stored = real_get_by_hash(repository, token_hash)
+            # A concurrent refresh revokes the token after this one has read it as active
+            test_session.connection().execute(text("UPDATE refresh_tokens SET revoked_at = CURRENT_TIMESTAMP"))
+            return stored
+
+        monkeypatch.setattr(RefreshTokenRepository, "get_by_hash", get_by_hash_then_race)
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+        assert response.status_code == 401
+        assert test_session.exec(select(RefreshToken)).one().revoked_at is not None
+
+
+class TestStatelessAuth:
+    """Test the opt-in mode where read requests trust role claims in the token"""
+
+    @pytest.fixture(autouse=True)
+    def stateless_mode(self, monkeypatch):
+        monkeypatch.setattr(settings, "stateless_auth_enabled", True)
+
+    def test_reads_skip_the_users_table(self, client: TestClient, test_engine, regular_user: User):
+        """Test that reads build the principal from claims and writes still load the user"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        claims = security.decode_token(token)
+        assert claims and claims["role"] == "Contributor" and claims["ver"] == 0
+        headers = get_auth_headers(token)
+
+        with QueryCounter(test_engine) as read:
+            assert client.get("/api/v1/projects/", headers=headers).status_code == 200
+        # Only the periodic load of bumped versions touches users
+        assert all("WHERE users.id" not in statement for statement in read.statements)
+
+        with QueryCounter(test_engine) as write:
+            assert client.post("/api/v1/projects/", json={"name": "Denied"}, headers=headers).status_code == 403
+        assert any("WHERE users.id" in statement for statement in write.statements)
+
+    def test_deactivation_rejects_old_tokens(self, client: TestClient, admin_user: User, regular_user: User):
+        """Test that a token minted before deactivation stays rejected after reactivation"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 200
+
+        assert client.patch(f"/api/v1/users/{regular_user.id}/deactivate", headers=admin_headers).status_code == 200
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 401
+
+        assert client.patch(f"/api/v1/users/{regular_user.id}/activate", headers=admin_headers).status_code == 200
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 401
+        fresh_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.get("/api/v1/projects/", headers=fresh_headers).status_code == 200
+
+    def test_role_change_rejects_old_tokens(self, client: TestClient, admin_user: User, regular_user: User):
+        """Test that a token carrying the old role stops working and a new one carries the new role"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+
+        response = client.patch(f"/api/v1/users/{regular_user.id}", json={"role": "Project Manager"}, headers=admin_headers)
+        assert response.status_code == 200
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 401
+
+        fresh_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.post("/api/v1/projects/", json={"name": "Promoted Project"}, headers=fresh_headers).status_code == 201
+
+    def test_bumps_from_other_processes_are_picked_up(self, client: TestClient, regular_user: User, test_session: Session, monkeypatch):
+        """Test that a version bumped in the database is seen once the tracker refreshes"""
+        monkeypatch.setattr(token_versions, "refresh_seconds", 0)
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.get("/api/v1/projects/", headers=headers).status_code == 200
+
+        # Another worker bumps the version, this process's tracker is not told
+        UserRepository(test_session).bump_token_version(regular_user.id or 0)
+        test_session.commit()
+
+        assert client.get("/api/v1/projects/", headers=headers).status_code == 401
+
+    def test_deletes_from_other_processes_are_picked_up(self, client: TestClient, regular_user: User, test_session: Session, monkeypatch):
+        """Test that a user deleted by another worker is rejected once the tracker refreshes"""
+        monkeypatch.setattr(token_versions, "refresh_seconds", 0)
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.get("/api/v1/projects/", headers=headers).status_code == 200
+
+        UserRepository(test_session).delete(regular_user.id or 0)
+        test_session.commit()
+
+        assert client.get("/api/v1/projects/", headers=headers).status_code == 401
+
+    def test_refresh_loads_only_new_revocations(self, client: TestClient, regular_user: User, test_session: Session, test_engine, monkeypatch):
+        """Test that each refresh asks for revocations since the last one seen rather than every bump ever made"""
+        monkeypatch.setattr(token_versions, "refresh_seconds", 0)
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        UserRepository(test_session).bump_token_version(regular_user.id or 0)
+        test_session.commit()
+        client.get("/api/v1/projects/", headers=headers)
+        revoked_at = test_session.exec(select(TokenRevocation.revoked_at)).one()
+
+        assert token_versions.since() == revoked_at - REVOCATION_OVERLAP
+        with QueryCounter(test_engine) as counter:
+            client.get("/api/v1/projects/", headers=get_auth_headers(get_auth_token(client, "johndoe", "userpass123")))
+        assert any("token_revocations.revoked_at >=" in statement for statement in counter.statements)
@@ -1,6 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
-from src.models import User, Issue, Comment
+from src.models import User, Project, Issue, Comment
 from tests.conftest import get_auth_token, get_auth_headers
 
 class TestCommentEndpoints:
@@ -255,6 +255,26 @@ class TestCommentEndpoints:
         for comment in data:
             assert comment["author_id"] == regular_user.id
 
+    def test_get_comments_by_author_as_project_manager(self, client: TestClient, project_manager_user: User, regular_user: User, sample_comment: Comment, test_session):
+        """Test that a project manager only sees an author's comments in projects they created"""
+        pm_project = Project(name="PM Project", created_by=project_manager_user.id)
+        test_session.add(pm_project)
+        test_session.commit()
+        pm_issue = Issue(title="PM Issue", project_id=pm_project.id or 0, author_id=regular_user.id)
+        test_session.add(pm_issue)
+        test_session.commit()
+        visible = Comment(content="Visible to the PM", issue_id=pm_issue.id or 0, author_id=regular_user.id)
+        test_session.add(visible)
+        test_session.commit()
+
+        token = get_auth_token(client, "pmuser", "pmpass123")
+        headers = get_auth_headers(token)
+
+        response = client.get(f"/api/v1/comments/author/{regular_user.id}", headers=headers)
+
+        assert response.status_code == 200
+        assert [comment["id"] for comment in response.json()] == [visible.id]
+
     def test_get_comments_by_author_unauthorized(self, client: TestClient, regular_user: User, admin_user: User):
         """Test getting comments by author as non-admin (different user)"""
         token = get_auth_token(client, "johndoe", "userpass123")
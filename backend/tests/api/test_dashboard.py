@@ -0,0 +1,233 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from src.models import User, Project, Issue, ProjectMembership
+from src.models.enums import ProjectStatus, IssueStatus, IssuePriority
+from src.repositories import ProjectIssueStatsRepository
+from tests.conftest import get_auth_token, get_auth_headers
+
+def rebuild_issue_stats(test_session: Session) -> None:
+    """Issues seeded straight into the session skip the repositories, bring the rollup up to date"""
+    ProjectIssueStatsRepository(test_session).rebuild()
+    test_session.commit()
+
+class TestAdminDashboard:
+    """Test the admin dashboard aggregates"""
+
+    def test_counts_match_the_data(
+        self,
+        client: TestClient,
+        test_session: Session,
+        admin_user: User,
+        regular_user: User,
+        project_manager_user: User,
+        inactive_user: User,
+        sample_project: Project,
+        sample_issue: Issue
+    ):
+        """Test roles, project statuses and open issues per active project"""
+        on_hold = Project(name="Paused Project", status=ProjectStatus.ON_HOLD, created_by=admin_user.id)
+        empty = Project(name="Empty Project", status=ProjectStatus.ACTIVE, created_by=admin_user.id)
+        test_session.add_all([on_hold, empty])
+        test_session.commit()
+        test_session.add_all([
+            Issue(title="Closed", status=IssueStatus.CLOSED, project_id=sample_project.id or 0, author_id=admin_user.id),
+            Issue(title="Blocked", status=IssueStatus.BLOCKED, project_id=sample_project.id or 0, author_id=admin_user.id),
+            Issue(title="Paused", project_id=on_hold.id or 0, author_id=admin_user.id)
+        ])
+        test_session.commit()
+        rebuild_issue_stats(test_session)
+
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        response = client.get("/api/v1/dashboard/admin", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "users_by_role": {"Admin": 1, "Project Manager": 1, "Contributor": 2},
+            "projects_by_status": {"Active": 2, "On Hold": 1},
+            "open_issues_by_project": [
+                {"project_id": empty.id, "project_name": "Empty Project", "open_issues": 0},
+                {"project_id": sample_project.id, "project_name": "Test Project", "open_issues": 2}
+            ],
+            "total_users": 4,
+            "total_projects": 3,
+            "active_projects": 2,
+            "open_issues": 3
+        }
+
+    def test_admin_only(self, client: TestClient, project_manager_user: User):
+        """Test that other roles get 403"""
+        headers = get_auth_headers(get_auth_token(client, "pmuser", "pmpass123"))
+        assert client.get("/api/v1/dashboard/admin", headers=headers).status_code == 403
+
+    def test_query_count_is_constant_in_rows(self, client: TestClient, test_session: Session, admin_user: User, sample_project: Project, query_budget):
+        """Test that the dashboard costs the same statements for 1 or 200 issues"""
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        project_id, admin_id = sample_project.id or 0, admin_user.id
+        test_session.add(Issue(title="First", project_id=project_id, author_id=admin_id))
+        test_session.commit()
+        rebuild_issue_stats(test_session)
+
+        with query_budget(6) as few:
+            assert client.get("/api/v1/dashboard/admin", headers=headers).status_code == 200
+
+        test_session.add_all([Issue(title=f"Issue {i}", project_id=project_id, author_id=admin_id) for i in range(200)])
+        test_session.commit()
+        rebuild_issue_stats(test_session)
+
+        with query_budget(6) as many:
+            response = client.get("/api/v1/dashboard/admin", headers=headers)
+        assert response.json()["open_issues"] == 201
+        assert many.count == few.count
+
+class TestManagerDashboard:
+    """Test the project manager dashboard aggregates"""
+
+    def _seed(self, test_session: Session, project_manager_user: User, regular_user: User, sample_project: Project) -> tuple[int, int]:
+        """Two PM projects with a member, estimates and a closed issue, plus an issue in someone else's project"""
+        backend = Project(name="Backend", created_by=project_manager_user.id)
+        frontend = Project(name="Frontend", created_by=project_manager_user.id)
+        test_session.add_all([backend, frontend])
+        test_session.commit()
+        test_session.add(ProjectMembership(project_id=backend.id, user_id=regular_user.id))
+        test_session.add_all([
+            Issue(title="A", project_id=backend.id or 0, author_id=project_manager_user.id, assignee_id=regular_user.id,
+                  status=IssueStatus.IN_PROGRESS, priority=IssuePriority.HIGH, time_estimate=5),
+            Issue(title="B", project_id=backend.id or 0, author_id=project_manager_user.id, assignee_id=regular_user.id,
+                  status=IssueStatus.OPEN, priority=IssuePriority.HIGH, time_estimate=3),
+            Issue(title="C", project_id=backend.id or 0, author_id=project_manager_user.id, assignee_id=regular_user.id,
+                  status=IssueStatus.CLOSED, time_estimate=8),
+            Issue(title="D", project_id=frontend.id or 0, author_id=project_manager_user.id, status=IssueStatus.OPEN),
+            Issue(title="Elsewhere", project_id=sample_project.id or 0, author_id=project_manager_user.id, assignee_id=regular_user.id)
+        ])
+        test_session.commit()
+        rebuild_issue_stats(test_session)
+        return backend.id or 0, frontend.id or 0
+
+    def test_counts_cover_only_own_projects(
+        self,
+        client: TestClient,
+        test_session: Session,
+        project_manager_user: User,
+        regular_user: User,
+        sample_project: Project
+    ):
+        """Test per-project breakdowns, totals and workload with estimates"""
+        backend_id, frontend_id = self._seed(test_session, project_manager_user, regular_user, sample_project)
+        headers = get_auth_headers(get_auth_token(client, "pmuser", "pmpass123"))
+
+        response = client.get("/api/v1/dashboard/manager", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "projects": [
+                {"project_id": backend_id, "project_name": "Backend",
+                 "issues_by_status": {"In Progress": 1, "Open": 1}, "issues_by_priority": {"High": 2}},
+                {"project_id": frontend_id, "project_name": "Frontend",
+                 "issues_by_status": {"Open": 1}, "issues_by_priority": {"Medium": 1}}
+            ],
+            "issues_by_status": {"In Progress": 1, "Open": 2},
+            "issues_by_priority": {"High": 2, "Medium": 1},
+            "workload": [
+                {"assignee_id": regular_user.id, "username": "johndoe", "active_issues": 2, "time_estimate": 8},
+                {"assignee_id": None, "username": None, "active_issues": 1, "time_estimate": 0}
+            ],
+            "total_projects": 2,
+            "active_issues": 3
+        }
+
+    def test_project_filter(self, client: TestClient, test_session: Session, project_manager_user: User, regular_user: User, sample_project: Project):
+        """Test that the filter narrows to one own project and rejects others"""
+        _, frontend_id = self._seed(test_session, project_manager_user, regular_user, sample_project)
+        headers = get_auth_headers(get_auth_token(client, "pmuser", "pmpass123"))
+
+        response = client.get(f"/api/v1/dashboard/manager?project_id={frontend_id}", headers=headers)
+        assert response.status_code == 200
+        assert [project["project_name"] for project in response.json()["projects"]] == ["Frontend"]
+        assert response.json()["workload"] == [{"assignee_id": None, "username": None, "active_issues": 1, "time_estimate": 0}]
+
+        response = client.get(f"/api/v1/dashboard/manager?project_id={sample_project.id}", headers=headers)
+        assert response.status_code == 404
+
+    def test_idle_members_and_access(self, client: TestClient, test_session: Session, project_manager_user: User, regular_user: User):
+        """Test that idle members show with 0 and contributors get 403"""
+        project = Project(name="Quiet", created_by=project_manager_user.id)
+        test_session.add(project)
+        test_session.commit()
+        test_session.add(ProjectMembership(project_id=project.id, user_id=regular_user.id))
+        test_session.commit()
+
+        headers = get_auth_headers(get_auth_token(client, "pmuser", "pmpass123"))
+        response = client.get("/api/v1/dashboard/manager", headers=headers)
+        assert response.json()["workload"] == [{"assignee_id": regular_user.id, "username": "johndoe", "active_issues": 0, "time_estimate": 0}]
+
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        assert client.get("/api/v1/dashboard/manager", headers=headers).status_code == 403
+
+    def test_aggregates_in_one_round_trip(self, client: TestClient, test_session: Session, project_manager_user: User, regular_user: User, sample_project: Project, query_budget):
+        """Test that all breakdowns come from a single statement"""
+        self._seed(test_session, project_manager_user, regular_user, sample_project)
+        headers = get_auth_headers(get_auth_token(client, "pmuser", "pmpass123"))
+
+        with query_budget(2) as budget:
+            assert client.get("/api/v1/dashboard/manager", headers=headers).status_code == 200
+        assert sum("UNION ALL" in statement for statement in budget.statements) == 1
+
+class TestContributorDashboard:
+    """Test the caller's own dashboard aggregates"""
+
+    def test_counts_cover_own_member_projects(
+        self,
+        client: TestClient,
+        test_session: Session,
+        admin_user: User,
+        regular_user: User,
+        sample_project: Project,
+        sample_issue: Issue
+    ):
+        """Test assigned issues by status, priority and active project, without non-member projects"""
+        backend = Project(name="Backend", created_by=admin_user.id)
+        paused = Project(name="Paused", status=ProjectStatus.ON_HOLD, created_by=admin_user.id)
+        outside = Project(name="Outside", created_by=admin_user.id)
+        test_session.add_all([backend, paused, outside])
+        test_session.commit()
+        test_session.add_all([
+            ProjectMembership(project_id=backend.id, user_id=regular_user.id),
+            ProjectMembership(project_id=paused.id, user_id=regular_user.id)
+        ])
+        test_session.add_all([
+            Issue(title="Mine", project_id=sample_project.id or 0, author_id=admin_user.id, assignee_id=regular_user.id,
+                  status=IssueStatus.IN_PROGRESS, priority=IssuePriority.HIGH),
+            Issue(title="Done", project_id=sample_project.id or 0, author_id=admin_user.id, assignee_id=regular_user.id,
+                  status=IssueStatus.CLOSED),
+            Issue(title="Theirs", project_id=sample_project.id or 0, author_id=admin_user.id, assignee_id=admin_user.id),
+            Issue(title="Waiting", project_id=paused.id or 0, author_id=admin_user.id, assignee_id=regular_user.id,
+                  priority=IssuePriority.CRITICAL),
+            Issue(title="Not a member", project_id=outside.id or 0, author_id=admin_user.id, assignee_id=regular_user.id)
+        ])
+        test_session.commit()
+        backend_id, sample_project_id = backend.id, sample_project.id
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+
+        response = client.get("/api/v1/dashboard/me", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "issues_by_status": {"Open": 2, "In Progress": 1},
+            "issues_by_priority": {"Medium": 1, "High": 1, "Critical": 1},
+            "issues_by_project": [
+                {"project_id": backend_id, "project_name": "Backend", "open_issues": 0},
+                {"project_id": sample_project_id, "project_name": "Test Project", "open_issues": 2}
+            ],
+            "total_projects": 3,
+            "active_issues": 3
+        }
+
+    def test_aggregates_in_one_statement(self, client: TestClient, regular_user: User, sample_project: Project, sample_issue: Issue, query_budget):
+        """Test that the breakdowns come from a single query without loading issues"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+
+        with query_budget(2) as budget:
+            response = client.get("/api/v1/dashboard/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["active_issues"] == 1
+        assert sum("GROUP BY" in statement for statement in budget.statements) == 1
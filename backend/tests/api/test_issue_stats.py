@@ -0,0 +1,93 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from src.models import User, Project, Issue, ProjectIssueStats
+from src.repositories import ProjectIssueStatsRepository, project_issue_stats_repository
+from tests.conftest import get_auth_token, get_auth_headers
+
+class TestProjectIssueStats:
+    """Test the per-project issue rollup"""
+
+    def _create_project(self, client: TestClient, headers: dict) -> int:
+        response = client.post("/api/v1/projects/", json={"name": "Rollup Project"}, headers=headers)
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def test_issue_writes_keep_rollup_in_step(self, client: TestClient, test_session: Session, admin_user: User):
+        """Test create, bulk create, update, close, reopen and delete against a rebuild"""
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        project_id = self._create_project(client, headers)
+
+        bulk = client.post("/api/v1/issues/bulk", json=[
+            {"title": "First", "project_id": project_id, "priority": "High", "time_estimate": 3},
+            {"title": "Second", "project_id": project_id, "priority": "Low", "time_estimate": 2}
+        ], headers=headers)
+        first_id, second_id = [result["issue"]["id"] for result in bulk.json()["results"]]
+        third_id = client.post("/api/v1/issues/", json={
+            "title": "Third", "project_id": project_id, "priority": "Critical", "time_estimate": 5
+        }, headers=headers).json()["id"]
+
+        client.patch(f"/api/v1/issues/{first_id}", json={"status": "In Progress", "time_estimate": 4}, headers=headers)
+        client.patch(f"/api/v1/issues/{second_id}/close", headers=headers)
+        client.patch(f"/api/v1/issues/{third_id}/close", headers=headers)
+        client.patch(f"/api/v1/issues/{third_id}/reopen", headers=headers)
+        assert client.delete(f"/api/v1/issues/{second_id}", headers=headers).status_code == 204
+
+        stats = client.get(f"/api/v1/projects/{project_id}", headers=headers).json()["issue_stats"]
+        assert {column: value for column, value in stats.items() if value and column != "last_activity_at"} == {
+            "open_count": 1, "in_progress_count": 1, "high_count": 1, "critical_count": 1, "open_estimate_hours": 9
+        }
+        assert stats["last_activity_at"] is not None
+        assert ProjectIssueStatsRepository(test_session).rebuild() == 0
+
+    def test_rebuild_repairs_drift_and_missing_rows(self, client: TestClient, test_session: Session, admin_user: User, sample_project: Project, sample_issue: Issue):
+        """Test that a rebuild fixes tampered counts and creates rows for projects without one"""
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        project_id = self._create_project(client, headers)
+        client.post("/api/v1/issues/", json={"title": "Only", "project_id": project_id}, headers=headers)
+        sample_project_id = sample_project.id
+
+        stats = test_session.get(ProjectIssueStats, project_id)
+        assert stats is not None and stats.open_count == 1
+        stats.open_count = 7
+        test_session.commit()
+        assert test_session.get(ProjectIssueStats, sample_project_id) is None
+
+        assert ProjectIssueStatsRepository(test_session).rebuild() == 2
+        test_session.commit()
+
+        assert test_session.get(ProjectIssueStats, project_id).open_count == 1
+        assert test_session.get(ProjectIssueStats, sample_project_id).medium_count == 1
+        assert ProjectIssueStatsRepository(test_session).rebuild() == 0
+
+    def test_concurrent_first_writes_do_not_collide(self, test_session: Session, sample_project: Project, monkeypatch):
+        """Test that a missing row inserted by another writer mid-apply gets this write's delta instead of a key violation"""
+        project_id = sample_project.id or 0
+        real_rollup_statement = project_issue_stats_repository._rollup_statement
+
+        def rollup_after_concurrent_insert(project_ids, missing_only):
+            test_session.add(ProjectIssueStats(project_id=project_id, open_count=5))
+            test_session.flush()
+            return real_rollup_statement(project_ids, missing_only)
+
+        monkeypatch.setattr(project_issue_stats_repository, "_rollup_statement", rollup_after_concurrent_insert)
+        ProjectIssueStatsRepository(test_session).apply({project_id: {"open_count": 1}})
+        test_session.commit()
+
+        stats = test_session.get(ProjectIssueStats, project_id)
+        assert stats is not None
+        test_session.refresh(stats)
+        assert stats.open_count == 6
+
+    def test_project_list_keeps_issues_alongside_rollup(self, client: TestClient, test_session: Session, sample_project: Project, sample_issue: Issue, query_budget):
+        """Test that project responses still embed their issues, in one batched load, next to the rollup counts"""
+        headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        ProjectIssueStatsRepository(test_session).rebuild()
+        test_session.commit()
+        sample_issue_id = sample_issue.id
+
+        with query_budget(5) as budget:
+            response = client.get("/api/v1/projects/", headers=headers)
+        project = response.json()[0]
+        assert project["issue_stats"]["open_count"] == 1
+        assert [issue["id"] for issue in project["issues"]] == [sample_issue_id]
+        assert sum("FROM issues" in statement for statement in budget.statements) == 1
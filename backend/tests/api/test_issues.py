@@ -1,7 +1,11 @@
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
-from src.models import User, Project, Issue, Label
+from sqlmodel import Session, select
+from src.models import User, Project, Issue, Label, IssueLabel
+from src.pagination import NEXT_CURSOR_HEADER
 from src.models.enums import IssueStatus, IssuePriority
+from src.repositories import ProjectIssueStatsRepository
 from tests.conftest import get_auth_token, get_auth_headers
 
 class TestIssueEndpoints:
@@ -273,6 +277,28 @@ class TestIssueEndpoints:
         for issue in data:
             assert issue["author_id"] == sample_issue.author_id
 
+    def test_get_issues_by_assignee_as_project_manager(self, client: TestClient, project_manager_user: User, regular_user: User, sample_project: Project, test_session: Session):
+        """Test that a project manager gets every assigned issue in their projects, and none outside them"""
+        pm_project = Project(name="PM Project", created_by=project_manager_user.id)
+        test_session.add(pm_project)
+        test_session.commit()
+        issues = [
+            Issue(title=f"PM Issue {i}", project_id=pm_project.id or 0, author_id=regular_user.id, assignee_id=regular_user.id)
+            for i in range(3)
+        ]
+        hidden = Issue(title="Hidden Issue", project_id=sample_project.id or 0, author_id=regular_user.id, assignee_id=regular_user.id)
+        test_session.add_all([*issues, hidden])
+        test_session.commit()
+
+        token = get_auth_token(client, "pmuser", "pmpass123")
+        headers = get_auth_headers(token)
+
+        for url in (f"/api/v1/issues/assignee/{regular_user.id}", f"/api/v1/issues/author/{regular_user.id}"):
+            response = client.get(url, headers=headers)
+
+            assert response.status_code == 200
+            assert sorted(issue["id"] for issue in response.json()) == sorted(issue.id for issue in issues)
+
     def test_assign_issue(self, client: TestClient, admin_user: User, regular_user: User, sample_issue: Issue):
         """Test assigning issue to user"""
         token = get_auth_token(client, "admin", "adminpass123")
@@ -411,4 +437,210 @@ class TestIssueEndpoints:
         }
         
         response = client.post("/api/v1/issues/", json=issue_data, headers=headers)
-        assert response.status_code == 422
\ No newline at end of file
+        assert response.status_code == 422
+
+class TestBulkIssueEndpoint:
+    """Test bulk issue creation"""
+
+    def test_bulk_create_as_member(self, client: TestClient, regular_user: User, sample_project: Project, query_budget, test_session):
+        """Test creating many issues with one INSERT"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+        # The project's rollup row exists, so the rollup costs one UPDATE
+        ProjectIssueStatsRepository(test_session).rebuild()
+        test_session.commit()
+
+        issues_data = [
+            {"title": f"Bulk Issue {i}", "project_id": sample_project.id, "assignee_id": regular_user.id}
+            for i in range(25)
+        ]
+
+        # PostgreSQL batches the rows into one INSERT ... RETURNING, SQLite has no insert
+        # sentinel and falls back to one INSERT per row, so only the other statements are bounded
+        with query_budget(9 + len(issues_data)) as counter:
+            response = client.post("/api/v1/issues/bulk", json=issues_data, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 25
+        assert data["failed"] == 0
+        assert [result["index"] for result in data["results"]] == list(range(25))
+        assert all(result["status_code"] == 201 and result["issue"]["id"] for result in data["results"])
+
+        other_statements = [statement for statement in counter.statements if not statement.lstrip().upper().startswith("INSERT")]
+        assert len(other_statements) <= 9
+
+        created = test_session.exec(select(Issue).where(Issue.project_id == sample_project.id)).all()
+        assert len(created) == 25
+        assert all(issue.author_id == regular_user.id for issue in created)
+
+    def test_bulk_create_reports_failed_rows(self, client: TestClient, regular_user: User, admin_user: User, sample_project: Project, test_session):
+        """Test that failing rows are reported per item and the others are still created"""
+        other_project = Project(name="Other Project", created_by=admin_user.id)
+        test_session.add(other_project)
+        test_session.commit()
+
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        issues_data = [
+            {"title": "Valid", "project_id": sample_project.id},
+            {"title": "Missing project", "project_id": 99999},
+            {"title": "Not a member", "project_id": other_project.id},
+            {"title": "Assignee not a member", "project_id": sample_project.id, "assignee_id": admin_user.id},
+            {"title": "Unknown assignee", "project_id": sample_project.id, "assignee_id": 99999},
+            {"title": "Also valid", "project_id": sample_project.id, "assignee_id": regular_user.id}
+        ]
+
+        response = client.post("/api/v1/issues/bulk", json=issues_data, headers=headers)
+
+        assert response.status_code == 207
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 4
+        assert [result["status_code"] for result in data["results"]] == [201, 404, 403, 400, 404, 201]
+        assert data["results"][1]["error"] == "Project not found."
+        assert data["results"][5]["issue"]["assignee_id"] == regular_user.id
+
+        titles = {issue.title for issue in test_session.exec(select(Issue)).all()}
+        assert titles == {"Valid", "Also valid"}
+
+    def test_bulk_create_validation(self, client: TestClient, admin_user: User, sample_project: Project):
+        """Test that empty batches and invalid rows are rejected"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = client.post("/api/v1/issues/bulk", json=[], headers=headers)
+        assert response.status_code == 422
+
+        response = client.post("/api/v1/issues/bulk", json=[{"project_id": sample_project.id}], headers=headers)
+        assert response.status_code == 422
+
+
+@pytest.fixture
+def search_issues(test_session, admin_user: User, regular_user: User, project_manager_user: User, sample_project: Project, sample_label: Label) -> dict[str, Issue]:
+    """Issues across a member project, a PM project and a project johndoe cannot see"""
+    pm_project = Project(name="PM Project", created_by=project_manager_user.id)
+    hidden_project = Project(name="Hidden Project", created_by=admin_user.id)
+    test_session.add_all([pm_project, hidden_project])
+    test_session.commit()
+
+    base = datetime(2025, 1, 1)
+    issues = {
+        "login": Issue(title="Login fails", description="500 on submit", status=IssueStatus.OPEN, priority=IssuePriority.CRITICAL,
+                       project_id=sample_project.id or 0, author_id=regular_user.id, assignee_id=regular_user.id,
+                       created_at=base, updated_at=base + timedelta(days=5)),
+        "docs": Issue(title="Update docs", description="Mention 100% coverage", status=IssueStatus.IN_PROGRESS, priority=IssuePriority.LOW,
+                      project_id=sample_project.id or 0, author_id=admin_user.id,
+                      created_at=base + timedelta(days=1), updated_at=base + timedelta(days=1)),
+        "export": Issue(title="CSV export", status=IssueStatus.OPEN, priority=IssuePriority.HIGH,
+                        project_id=sample_project.id or 0, author_id=admin_user.id, assignee_id=regular_user.id,
+                        created_at=base + timedelta(days=2), updated_at=base + timedelta(days=3)),
+        "pm": Issue(title="Plan sprint", status=IssueStatus.OPEN, priority=IssuePriority.MEDIUM,
+                    project_id=pm_project.id or 0, author_id=project_manager_user.id,
+                    created_at=base + timedelta(days=3), updated_at=base + timedelta(days=4)),
+        "hidden": Issue(title="Login audit", status=IssueStatus.OPEN, priority=IssuePriority.CRITICAL,
+                        project_id=hidden_project.id or 0, author_id=admin_user.id,
+                        created_at=base + timedelta(days=4), updated_at=base + timedelta(days=6))
+    }
+    test_session.add_all(issues.values())
+    test_session.commit()
+
+    test_session.add(IssueLabel(issue_id=issues["export"].id, label_id=sample_label.id))
+    test_session.commit()
+    return issues
+
+def _search(client: TestClient, headers: dict, **params) -> list[int]:
+    response = client.get("/api/v1/issues/search", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return [issue["id"] for issue in response.json()]
+
+class TestIssueSearchEndpoint:
+    """Test the composable issue search"""
+
+    def test_combined_filters(self, client: TestClient, search_issues: dict[str, Issue], sample_project: Project, regular_user: User):
+        """Test that every given filter must match"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        ids = _search(client, headers, project_id=sample_project.id, status=["Open"], assignee_id=regular_user.id, sort="created_at")
+        assert ids == [search_issues["login"].id, search_issues["export"].id]
+
+        ids = _search(client, headers, status=["Open", "In Progress"], priority=["Low", "High"], sort="created_at")
+        assert ids == [search_issues["docs"].id, search_issues["export"].id]
+
+        ids = _search(client, headers, unassigned=True, author_id=regular_user.id)
+        assert ids == []
+
+    def test_text_label_and_updated_since(self, client: TestClient, search_issues: dict[str, Issue], sample_label: Label):
+        """Test text search, label and updated_since filters"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        assert _search(client, headers, q="LOGIN", sort="created_at") == [search_issues["login"].id, search_issues["hidden"].id]
+        # LIKE wildcards in the text are matched literally
+        assert _search(client, headers, q="100%") == [search_issues["docs"].id]
+        assert _search(client, headers, q="%") == [search_issues["docs"].id]
+        assert _search(client, headers, label_id=sample_label.id) == [search_issues["export"].id]
+        assert _search(client, headers, updated_since="2025-01-05T00:00:00", sort="-updated_at") == [
+            search_issues["hidden"].id, search_issues["login"].id, search_issues["pm"].id
+        ]
+
+    def test_visibility_is_scoped_by_role(self, client: TestClient, search_issues: dict[str, Issue]):
+        """Test that contributors see member projects and PMs their own projects"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        ids = _search(client, get_auth_headers(token), q="login")
+        assert ids == [search_issues["login"].id]
+
+        token = get_auth_token(client, "pmuser", "pmpass123")
+        ids = _search(client, get_auth_headers(token))
+        assert ids == [search_issues["pm"].id]
+
+    def test_priority_sort_pages(self, client: TestClient, search_issues: dict[str, Issue]):
+        """Test walking a priority-sorted search with cursors"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        ids: list[int] = []
+        params: dict = {"sort": "-priority", "limit": 2}
+        while True:
+            response = client.get("/api/v1/issues/search", params=params, headers=headers)
+            assert response.status_code == 200
+            ids.extend(issue["id"] for issue in response.json())
+            next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+        # The two critical issues tie on priority and fall back to id, newest first
+        assert ids == [
+            search_issues["hidden"].id, search_issues["login"].id, search_issues["export"].id,
+            search_issues["pm"].id, search_issues["docs"].id
+        ]
+
+        # A cursor from another sort order is rejected, not misread
+        response = client.get("/api/v1/issues/search", params={"sort": "-created_at", "cursor": params["cursor"]}, headers=headers)
+        assert response.status_code == 400
+
+    def test_search_is_one_issue_query(self, client: TestClient, search_issues: dict[str, Issue], sample_label: Label, query_budget):
+        """Test that filters and visibility are resolved in a single statement"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+        params = {"status": ["Open"], "label_id": sample_label.id, "q": "csv"}
+
+        with query_budget(50) as counter:
+            response = client.get("/api/v1/issues/search", params=params, headers=headers)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        issue_queries = [statement for statement in counter.statements if "FROM issues" in statement]
+        assert len(issue_queries) == 1
+
+    def test_invalid_parameters(self, client: TestClient, admin_user: User):
+        """Test that unknown sort orders and enum values are rejected"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        assert client.get("/api/v1/issues/search", params={"sort": "title"}, headers=headers).status_code == 422
+        assert client.get("/api/v1/issues/search", params={"status": "Nope"}, headers=headers).status_code == 422
+        assert client.get("/api/v1/issues/search", params={"cursor": "garbage"}, headers=headers).status_code == 400
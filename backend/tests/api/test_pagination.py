@@ -0,0 +1,158 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from src.models import User, Project, Issue, Comment, ProjectMembership
+from src.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from src.exceptions.pagination_exceptions import InvalidCursorError
+from tests.conftest import get_auth_token, get_auth_headers
+
+def _walk(client: TestClient, url: str, headers: dict, limit: int) -> list[list[int]]:
+    """Follow next cursors until the last page, returning the ids of every page"""
+    pages = []
+    params: dict = {"limit": limit}
+    while True:
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()])
+
+        next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not next_cursor:
+            return pages
+        params = {"limit": limit, "cursor": next_cursor}
+
+@pytest.fixture
+def many_issues(test_session: Session, sample_project: Project, regular_user: User) -> list[Issue]:
+    """Five issues, two sharing a created_at to exercise the id tie-breaker"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    offsets = [0, 1, 1, 2, 3]
+    issues = [
+        Issue(title=f"Paged Issue {i}", project_id=sample_project.id or 0, author_id=regular_user.id, created_at=base + timedelta(minutes=offset))
+        for i, offset in enumerate(offsets)
+    ]
+    test_session.add_all(issues)
+    test_session.commit()
+    return issues
+
+class TestCursor:
+    """Test cursor encoding"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the naive UTC position it was built from"""
+        created_at = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at.replace(tzinfo=None), 42)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(datetime(2025, 1, 1), 1)[:-3]])
+    def test_invalid_cursor(self, cursor: str):
+        """Test that garbage cursors raise InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+class TestKeysetPagination:
+    """Test keyset pagination on list endpoints"""
+
+    def test_issues_pages_cover_every_row_once(self, client: TestClient, admin_user: User, many_issues: list[Issue]):
+        """Test walking all issues two at a time"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, "/api/v1/issues/", headers, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [issue_id for page in pages for issue_id in page] == [issue.id for issue in many_issues]
+
+    def test_issues_by_project_as_member(self, client: TestClient, regular_user: User, sample_project: Project, many_issues: list[Issue]):
+        """Test paginating a project's issues as a member"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, f"/api/v1/issues/project/{sample_project.id}", headers, limit=3)
+
+        assert [len(page) for page in pages] == [3, 2]
+        assert [issue_id for page in pages for issue_id in page] == [issue.id for issue in many_issues]
+
+    def test_last_page_has_no_cursor(self, client: TestClient, admin_user: User, many_issues: list[Issue]):
+        """Test that a page holding the remaining rows does not advertise another page"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = client.get("/api/v1/issues/", params={"limit": 5}, headers=headers)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 5
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_projects_as_member(self, client: TestClient, admin_user: User, regular_user: User, test_session: Session):
+        """Test paginating the member projects of a contributor"""
+        projects = [Project(name=f"Paged Project {i}", created_by=admin_user.id) for i in range(3)]
+        test_session.add_all(projects)
+        test_session.commit()
+        test_session.add_all([ProjectMembership(project_id=project.id, user_id=regular_user.id) for project in projects])
+        test_session.commit()
+
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, "/api/v1/projects/", headers, limit=2)
+
+        assert [project_id for page in pages for project_id in page] == [project.id for project in projects]
+
+    def test_comments_by_issue(self, client: TestClient, regular_user: User, sample_issue: Issue, test_session: Session):
+        """Test paginating an issue's comments oldest first"""
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        comments = [
+            Comment(content=f"Comment {i}", issue_id=sample_issue.id or 0, author_id=regular_user.id, created_at=base + timedelta(minutes=i))
+            for i in range(4)
+        ]
+        test_session.add_all(comments)
+        test_session.commit()
+
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, f"/api/v1/comments/issue/{sample_issue.id}", headers, limit=3)
+
+        assert [len(page) for page in pages] == [3, 1]
+        assert [comment_id for page in pages for comment_id in page] == [comment.id for comment in comments]
+
+    def test_comments_by_author(self, client: TestClient, regular_user: User, sample_issue: Issue, test_session: Session):
+        """Test paginating an author's comments oldest first"""
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        comments = [
+            Comment(content=f"Comment {i}", issue_id=sample_issue.id or 0, author_id=regular_user.id, created_at=base + timedelta(minutes=i))
+            for i in range(5)
+        ]
+        test_session.add_all(comments)
+        test_session.commit()
+
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, f"/api/v1/comments/author/{regular_user.id}", headers, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [comment_id for page in pages for comment_id in page] == [comment.id for comment in comments]
+
+    def test_users(self, client: TestClient, admin_user: User, regular_user: User, project_manager_user: User):
+        """Test paginating users as admin"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        pages = _walk(client, "/api/v1/users/", headers, limit=1)
+
+        assert len(pages) == 3
+        assert sorted(user_id for page in pages for user_id in page) == sorted([admin_user.id, regular_user.id, project_manager_user.id])
+
+    def test_invalid_cursor_and_limit(self, client: TestClient, admin_user: User):
+        """Test that bad pagination parameters are rejected"""
+        token = get_auth_token(client, "admin", "adminpass123")
+        headers = get_auth_headers(token)
+
+        response = client.get("/api/v1/issues/", params={"cursor": "garbage"}, headers=headers)
+        assert response.status_code == 400
+
+        response = client.get("/api/v1/issues/", params={"limit": 0}, headers=headers)
+        assert response.status_code == 422
+
+        response = client.get("/api/v1/users/", params={"limit": 100000}, headers=headers)
+        assert response.status_code == 422
@@ -0,0 +1,97 @@
+from datetime import date, datetime, time, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from src.config import settings
+from src.models import User, Project, Issue
+from src.models.enums import IssueStatus
+from src.repositories import FlowSnapshotRepository
+from tests.conftest import get_auth_token, get_auth_headers
+
+def days_ago(days: int) -> date:
+    return datetime.now(timezone.utc).date() - timedelta(days=days)
+
+def noon(day: date) -> datetime:
+    return datetime.combine(day, time(12), tzinfo=timezone.utc)
+
+class TestProjectFlow:
+    """Test daily flow snapshots and the flow endpoint"""
+
+    def _seed(self, test_session: Session, admin_user: User) -> int:
+        """A project from three days ago with an issue closed two days ago, one in progress and one from today"""
+        project = Project(name="Flow Project", created_by=admin_user.id, created_at=noon(days_ago(3)))
+        test_session.add(project)
+        test_session.commit()
+        test_session.add_all([
+            Issue(title="Done", project_id=project.id or 0, author_id=admin_user.id, status=IssueStatus.CLOSED,
+                  created_at=noon(days_ago(3)), closed_at=noon(days_ago(2))),
+            Issue(title="Doing", project_id=project.id or 0, author_id=admin_user.id, status=IssueStatus.IN_PROGRESS,
+                  created_at=noon(days_ago(2))),
+            Issue(title="Today", project_id=project.id or 0, author_id=admin_user.id, created_at=noon(days_ago(0)))
+        ])
+        test_session.commit()
+        return project.id or 0
+
+    def test_snapshots_fill_missing_days_once(self, client: TestClient, test_session: Session, admin_user: User):
+        """Test the counts per day, and that a second run only processes days not snapshotted yet"""
+        project_id = self._seed(test_session, admin_user)
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+
+        assert client.post("/api/v1/projects/flow/snapshots", headers=headers).json() == {"snapshots": 3, "remaining_days": 0}
+        assert client.post("/api/v1/projects/flow/snapshots", headers=headers).json() == {"snapshots": 0, "remaining_days": 0}
+
+        response = client.get(f"/api/v1/projects/{project_id}/flow?from={days_ago(5)}&to={days_ago(0)}", headers=headers)
+
+        assert response.status_code == 200
+        assert [
+            {key: value for key, value in day.items() if value}
+            for day in response.json()
+        ] == [
+            # The closed issue's status before closing is not stored, it counts as open
+            {"day": str(days_ago(3)), "open_count": 1, "created_count": 1},
+            {"day": str(days_ago(2)), "in_progress_count": 1, "closed_count": 1, "created_count": 1, "resolved_count": 1},
+            {"day": str(days_ago(1)), "in_progress_count": 1, "closed_count": 1}
+        ]
+
+    def test_backfill_runs_in_batches(self, client: TestClient, test_session: Session, admin_user: User, monkeypatch):
+        """Test that one run processes at most FLOW_SNAPSHOT_BATCH_DAYS days and reports what is left"""
+        monkeypatch.setattr(settings, "flow_snapshot_batch_days", 2)
+        self._seed(test_session, admin_user)
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+
+        assert client.post("/api/v1/projects/flow/snapshots", headers=headers).json() == {"snapshots": 2, "remaining_days": 1}
+        assert client.post("/api/v1/projects/flow/snapshots", headers=headers).json() == {"snapshots": 1, "remaining_days": 0}
+
+    def test_concurrent_runs_skip_existing_days(self, test_session: Session, admin_user: User):
+        """Test that a day another run already wrote is skipped instead of failing on the primary key"""
+        project_id = self._seed(test_session, admin_user)
+        repository = FlowSnapshotRepository(test_session)
+
+        assert repository.insert_many(repository.count_issues_at(days_ago(2), [project_id])) == 1
+        assert repository.insert_many(repository.count_issues_at(days_ago(2), [project_id])) == 0
+        test_session.commit()
+        assert len(repository.get_range(project_id, days_ago(2), days_ago(2))) == 1
+
+    def test_flow_defaults_to_last_30_days(self, client: TestClient, test_session: Session, admin_user: User):
+        """Test the default range ends yesterday"""
+        project_id = self._seed(test_session, admin_user)
+        headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        client.post("/api/v1/projects/flow/snapshots", headers=headers)
+
+        response = client.get(f"/api/v1/projects/{project_id}/flow", headers=headers)
+
+        assert [day["day"] for day in response.json()] == [str(days_ago(3)), str(days_ago(2)), str(days_ago(1))]
+
+    def test_access_and_validation(self, client: TestClient, test_session: Session, admin_user: User, regular_user: User):
+        """Test 403 for non-members and non-admin snapshot runs, 404 for unknown projects and 400 for bad ranges"""
+        project_id = self._seed(test_session, admin_user)
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+
+        assert client.get(f"/api/v1/projects/{project_id}/flow", headers=user_headers).status_code == 403
+        assert client.post("/api/v1/projects/flow/snapshots", headers=user_headers).status_code == 403
+        assert client.get("/api/v1/projects/99999/flow", headers=admin_headers).status_code == 404
+
+        reversed_range = f"from={days_ago(1)}&to={days_ago(2)}"
+        assert client.get(f"/api/v1/projects/{project_id}/flow?{reversed_range}", headers=admin_headers).status_code == 400
+        too_long = f"from={days_ago(400)}&to={days_ago(0)}"
+        assert client.get(f"/api/v1/projects/{project_id}/flow?{too_long}", headers=admin_headers).status_code == 400
@@ -0,0 +1,272 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from src.models import User, Project, Issue, Comment, ProjectMembership
+from src.models.enums import UserRole, ProjectStatus
+from src.repositories import ProjectRepository
+from tests.conftest import get_auth_token, get_auth_headers
+
+SMALL_SEED = 1
+LARGE_SEED = 50
+
+CREDENTIALS = {
+    "admin": "adminpass123",
+    "johndoe": "userpass123",
+    "pmuser": "pmpass123"
+}
+
+class BudgetScenario:
+    """Rows for the list endpoints, grown in place so one test can compare N=1 with N=50"""
+
+    def __init__(self, session: Session, regular_user: User, project_manager_user: User):
+        self.session = session
+        self.regular_user_id = regular_user.id
+        self.project_manager_id = project_manager_user.id
+        self.rows = 0
+
+        # Project owned by the PM that collects issues, members and comments
+        hub_project = Project(name="Hub Project", created_by=self.project_manager_id)
+        session.add(hub_project)
+        session.commit()
+        session.add(ProjectMembership(project_id=hub_project.id, user_id=self.regular_user_id))
+
+        hub_issue = Issue(title="Hub Issue", project_id=hub_project.id or 0, author_id=self.regular_user_id)
+        session.add(hub_issue)
+        session.commit()
+
+        self.hub_project_id = hub_project.id
+        self.hub_issue_id = hub_issue.id
+
+    def grow_to(self, rows: int) -> None:
+        """Add rows until every list endpoint returns `rows` items (plus the fixed ones)"""
+        while self.rows < rows:
+            self.rows += 1
+            i = self.rows
+
+            # Distinct users -> distinct authors, so per-row relationship loads are not hidden by the identity map
+            user = User(
+                firstname="Seed", lastname=f"User{i}", username=f"seed{i}", email=f"seed{i}@example.com",
+                role=UserRole.CONTRIBUTOR, password_hash="not-a-real-hash"
+            )
+            project = Project(name=f"Seed Project {i}", status=ProjectStatus.ACTIVE, created_by=self.project_manager_id)
+            self.session.add(user)
+            self.session.add(project)
+            self.session.commit()
+
+            self.session.add(ProjectMembership(project_id=self.hub_project_id, user_id=user.id))
+            self.session.add(ProjectMembership(project_id=project.id, user_id=user.id))
+
+            issue = Issue(
+                title=f"Seed Issue {i}",
+                project_id=self.hub_project_id or 0,
+                author_id=self.regular_user_id,
+                assignee_id=self.regular_user_id
+            )
+            self.session.add(issue)
+            self.session.commit()
+
+            self.session.add(Comment(content=f"Hub comment {i}", issue_id=self.hub_issue_id or 0, author_id=user.id))
+            self.session.add(Comment(content=f"Own comment {i}", issue_id=issue.id or 0, author_id=self.regular_user_id))
+            self.session.add(Comment(content=f"Reply {i}", issue_id=issue.id or 0, author_id=user.id))
+            self.session.commit()
+
+    def url(self, template: str) -> str:
+        return template.format(
+            hub_project=self.hub_project_id,
+            hub_issue=self.hub_issue_id,
+            regular_user=self.regular_user_id
+        )
+
+@pytest.fixture
+def budget_scenario(test_session: Session, admin_user: User, regular_user: User, project_manager_user: User) -> BudgetScenario:
+    return BudgetScenario(test_session, regular_user, project_manager_user)
+
+LIST_ENDPOINTS = [
+    # issues.py
+    pytest.param("admin", "/api/v1/issues/", 10, id="issues-all"),
+    pytest.param("johndoe", "/api/v1/issues/project/{hub_project}", 10, id="issues-by-project"),
+    pytest.param("johndoe", "/api/v1/issues/assignee/{regular_user}", 10, id="issues-by-assignee"),
+    pytest.param("johndoe", "/api/v1/issues/author/{regular_user}", 10, id="issues-by-author"),
+    pytest.param("johndoe", "/api/v1/issues/search?status=Open", 10, id="issues-search"),
+    # projects.py
+    pytest.param("admin", "/api/v1/projects/", 10, id="projects-all"),
+    pytest.param("pmuser", "/api/v1/projects/status/active", 10, id="projects-by-status"),
+    pytest.param("admin", "/api/v1/projects/{hub_project}/members", 10, id="project-members"),
+    # users.py
+    pytest.param("admin", "/api/v1/users/", 10, id="users-all"),
+    pytest.param("admin", "/api/v1/users/active", 10, id="users-active"),
+    pytest.param("admin", "/api/v1/users/role/Contributor", 10, id="users-by-role"),
+    # comments.py
+    pytest.param("johndoe", "/api/v1/comments/issue/{hub_issue}", 10, id="comments-by-issue"),
+    pytest.param("johndoe", "/api/v1/comments/author/{regular_user}", 10, id="comments-by-author"),
+]
+
+DETAIL_ENDPOINTS = [
+    # Nested collections (comments and their authors, members, issues) grow with the seed
+    pytest.param("johndoe", "/api/v1/issues/{hub_issue}", 10, id="issue-detail"),
+    pytest.param("pmuser", "/api/v1/projects/{hub_project}", 10, id="project-detail"),
+    pytest.param("johndoe", "/api/v1/users/{regular_user}", 10, id="user-detail"),
+]
+
+class TestListEndpointQueryBudgets:
+    """Test that list endpoints stay within their query budget regardless of row count"""
+
+    @pytest.mark.parametrize("username, url_template, budget", LIST_ENDPOINTS)
+    def test_query_count_is_constant_in_rows(
+        self,
+        client: TestClient,
+        budget_scenario: BudgetScenario,
+        query_budget,
+        username: str,
+        url_template: str,
+        budget: int
+    ):
+        """Test that N=1 and N=50 rows cost the same number of statements"""
+        token = get_auth_token(client, username, CREDENTIALS[username])
+        headers = get_auth_headers(token)
+        url = budget_scenario.url(url_template)
+
+        budget_scenario.grow_to(SMALL_SEED)
+        with query_budget(budget) as small:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        small_items = len(response.json())
+
+        budget_scenario.grow_to(LARGE_SEED)
+        with query_budget(budget) as large:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()) == small_items + LARGE_SEED - SMALL_SEED
+
+        assert large.count == small.count, (
+            f"{small.count} statements for {SMALL_SEED} row(s) but {large.count} for {LARGE_SEED}"
+        )
+
+class TestDetailEndpointQueryBudgets:
+    """Test that detail endpoints stay within their query budget regardless of nested rows"""
+
+    @pytest.mark.parametrize("username, url_template, budget", DETAIL_ENDPOINTS)
+    def test_query_count_is_constant_in_nested_rows(
+        self,
+        client: TestClient,
+        budget_scenario: BudgetScenario,
+        query_budget,
+        username: str,
+        url_template: str,
+        budget: int
+    ):
+        """Test that N=1 and N=50 nested rows cost the same number of statements"""
+        token = get_auth_token(client, username, CREDENTIALS[username])
+        headers = get_auth_headers(token)
+        url = budget_scenario.url(url_template)
+
+        budget_scenario.grow_to(SMALL_SEED)
+        with query_budget(budget) as small:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+
+        budget_scenario.grow_to(LARGE_SEED)
+        with query_budget(budget) as large:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+
+        assert large.count == small.count, (
+            f"{small.count} statements for {SMALL_SEED} row(s) but {large.count} for {LARGE_SEED}"
+        )
+
+class TestScopedIssueListQueryCost:
+    """Test that assignee and author listings filter visibility in SQL"""
+
+    @pytest.mark.parametrize("url_template", [
+        "/api/v1/issues/assignee/{regular_user}",
+        "/api/v1/issues/author/{regular_user}",
+    ])
+    def test_project_manager_listing_is_constant_in_issues(
+        self,
+        client: TestClient,
+        budget_scenario: BudgetScenario,
+        test_session: Session,
+        sample_project: Project,
+        query_budget,
+        url_template: str
+    ):
+        """Test that hundreds of visible and hidden issues cost the same statements as a handful"""
+        token = get_auth_token(client, "pmuser", CREDENTIALS["pmuser"])
+        headers = get_auth_headers(token)
+        url = budget_scenario.url(url_template)
+        regular_user_id = budget_scenario.regular_user_id
+        hub_project_id = budget_scenario.hub_project_id
+        # Owned by the admin, the PM cannot see it
+        hidden_project_id = sample_project.id
+
+        budget_scenario.grow_to(SMALL_SEED)
+        with query_budget(10) as few:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        few_items = len(response.json())
+
+        for project_id in (hub_project_id, hidden_project_id):
+            test_session.add_all([
+                Issue(title=f"Bulk Issue {i}", project_id=project_id or 0, author_id=regular_user_id, assignee_id=regular_user_id)
+                for i in range(300)
+            ])
+        test_session.commit()
+
+        with query_budget(10) as many:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()) == few_items + 300
+        assert {issue["project_id"] for issue in response.json()} == {hub_project_id}
+
+        assert many.count == few.count
+
+class TestAuthContextQueryCost:
+    """Test that permission checks read the per-request auth context instead of querying"""
+
+    def test_access_is_loaded_in_one_query(self, test_session: Session, project_manager_user: User, regular_user: User, sample_project: Project):
+        """Test that created and member projects come back together"""
+        owned = Project(name="Owned Project", created_by=project_manager_user.id)
+        test_session.add(owned)
+        test_session.commit()
+        test_session.add(ProjectMembership(project_id=owned.id, user_id=project_manager_user.id))
+        test_session.commit()
+
+        repository = ProjectRepository(test_session)
+
+        assert repository.get_project_access(project_manager_user.id) == ({owned.id}, {owned.id})
+        assert repository.get_project_access(regular_user.id) == (set(), {sample_project.id})
+
+    @pytest.mark.parametrize("url_template", [
+        "/api/v1/projects/{hub_project}",
+        "/api/v1/issues/{hub_issue}",
+        "/api/v1/comments/issue/{hub_issue}",
+    ])
+    def test_check_cost_is_constant_in_memberships(
+        self,
+        client: TestClient,
+        budget_scenario: BudgetScenario,
+        test_session: Session,
+        query_budget,
+        url_template: str
+    ):
+        """Test that a contributor in 1 or 50 projects costs the same number of statements"""
+        token = get_auth_token(client, "johndoe", CREDENTIALS["johndoe"])
+        headers = get_auth_headers(token)
+        url = budget_scenario.url(url_template)
+        regular_user_id = budget_scenario.regular_user_id
+
+        with query_budget(10) as few:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+
+        projects = [Project(name=f"Joined Project {i}", created_by=budget_scenario.project_manager_id) for i in range(LARGE_SEED)]
+        test_session.add_all(projects)
+        test_session.commit()
+        test_session.add_all([ProjectMembership(project_id=project.id, user_id=regular_user_id) for project in projects])
+        test_session.commit()
+
+        with query_budget(10) as many:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+
+        assert many.count == few.count
@@ -0,0 +1,113 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.config import settings
+from src.models import User
+from src.security.rate_limiter import InMemoryBucketStore, RateLimit, rate_limiter
+from tests.conftest import get_auth_token, get_auth_headers
+
+@pytest.fixture
+def tight_limits(monkeypatch):
+    """Two requests per minute in every group"""
+    limit = RateLimit(capacity=2, period_seconds=60)
+    monkeypatch.setattr(rate_limiter, "limits", {"auth": limit, "reads": limit, "writes": limit, "bulk": limit})
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+
+class TestRateLimiting:
+    """Test the token bucket limits on the API routes"""
+
+    def test_login_is_throttled_per_client(self, client: TestClient, regular_user: User, tight_limits):
+        """Test that sign-in attempts beyond the bucket get 429 with Retry-After, before bcrypt runs"""
+        login_data = {"username": "johndoe", "password": "wrongpassword"}
+        assert client.post("/api/v1/auth/login", json=login_data).status_code == 401
+        assert client.post("/api/v1/auth/login", json=login_data).status_code == 401
+
+        response = client.post("/api/v1/auth/login", json=login_data)
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) == 30
+
+    def test_login_buckets_are_per_username(self, client: TestClient, regular_user: User, admin_user: User, tight_limits):
+        """Test that one account's throttled attempts do not block another account signing in from the same address"""
+        login_data = {"username": "johndoe", "password": "wrongpassword"}
+        for _ in range(2):
+            client.post("/api/v1/auth/login", json=login_data)
+        assert client.post("/api/v1/auth/login", json=login_data).status_code == 429
+
+        assert client.post("/api/v1/auth/login", json={"username": "admin", "password": "adminpass123"}).status_code == 200
+
+    def test_address_cap_covers_every_username(self, client: TestClient, tight_limits, monkeypatch):
+        """Test that one address spraying usernames hits the per-address bucket"""
+        monkeypatch.setitem(rate_limiter.limits, "auth_address", RateLimit(capacity=3, period_seconds=60))
+        for i in range(3):
+            assert client.post("/api/v1/auth/login", json={"username": f"guess{i}", "password": "wrongpassword"}).status_code == 401
+        assert client.post("/api/v1/auth/login", json={"username": "guess9", "password": "wrongpassword"}).status_code == 429
+
+    def test_forwarded_for_is_trusted_only_from_proxies(self, client: TestClient, regular_user: User, tight_limits, monkeypatch):
+        """Test that clients behind a trusted proxy get their own buckets and untrusted peers cannot pick one"""
+        login_data = {"username": "johndoe", "password": "wrongpassword"}
+        def login_from(address: str) -> int:
+            return client.post("/api/v1/auth/login", json=login_data, headers={"X-Forwarded-For": address}).status_code
+
+        assert [login_from(f"10.0.0.{i}") for i in range(3)] == [401, 401, 429]
+
+        monkeypatch.setattr(settings, "trusted_proxies", ["testclient"])
+        assert [login_from("10.0.0.1") for _ in range(3)] == [401, 401, 429]
+        assert login_from("10.0.0.2") == 401
+
+    def test_buckets_are_per_user_and_group(self, client: TestClient, regular_user: User, admin_user: User, monkeypatch):
+        """Test that one user's reads do not use up another user's or their own writes"""
+        user_headers = get_auth_headers(get_auth_token(client, "johndoe", "userpass123"))
+        admin_headers = get_auth_headers(get_auth_token(client, "admin", "adminpass123"))
+        limit = RateLimit(capacity=2, period_seconds=60)
+        monkeypatch.setattr(rate_limiter, "limits", {"reads": limit, "writes": limit})
+
+        for _ in range(2):
+            assert client.get("/api/v1/projects/", headers=user_headers).status_code == 200
+        assert client.get("/api/v1/projects/", headers=user_headers).status_code == 429
+
+        assert client.get("/api/v1/projects/", headers=admin_headers).status_code == 200
+        assert client.post("/api/v1/projects/", json={"name": "Still Allowed"}, headers=user_headers).status_code == 403
+
+    def test_disabled_limiter_allows_everything(self, client: TestClient, regular_user: User, tight_limits, monkeypatch):
+        """Test that RATE_LIMIT_ENABLED=false turns the limits off"""
+        monkeypatch.setattr(rate_limiter, "enabled", False)
+        login_data = {"username": "johndoe", "password": "wrongpassword"}
+        for _ in range(3):
+            assert client.post("/api/v1/auth/login", json=login_data).status_code == 401
+
+class TestInMemoryBucketStore:
+    """Test the per-process bucket store"""
+
+    def test_bucket_refills_over_time(self, monkeypatch):
+        """Test that tokens come back at the configured rate"""
+        now = [1000.0]
+        monkeypatch.setattr("src.security.rate_limiter.time.monotonic", lambda: now[0])
+        store = InMemoryBucketStore(max_entries=10)
+        limit = RateLimit(capacity=2, period_seconds=10)
+
+        assert store.take("a", limit) == 0
+        assert store.take("a", limit) == 0
+        assert store.take("a", limit) == pytest.approx(5)
+
+        now[0] += 5
+        assert store.take("a", limit) == 0
+        assert store.take("a", limit) == pytest.approx(5)
+
+    def test_store_stays_bounded(self, monkeypatch):
+        """Test that refilled buckets are evicted first, then the least recently used"""
+        now = [1000.0]
+        monkeypatch.setattr("src.security.rate_limiter.time.monotonic", lambda: now[0])
+        store = InMemoryBucketStore(max_entries=2)
+        limit = RateLimit(capacity=2, period_seconds=10)
+
+        store.take("idle", limit)
+        now[0] += 6
+        store.take("busy", limit)
+        store.take("busy", limit)
+        store.take("new", limit)
+        # "idle" refilled completely and was dropped, "busy" still owes tokens
+        assert len(store) == 2
+        assert store.take("busy", limit) > 0
+
+        store.take("newest", limit)
+        assert len(store) == 2
+        assert store.take("busy", limit) > 0
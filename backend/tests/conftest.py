@@ -1,12 +1,20 @@
 import pytest
-from typing import Generator
+from contextlib import contextmanager
+from typing import Generator, Iterator
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import SQLModel, create_engine, Session
 from sqlmodel.pool import StaticPool
 from src.main import app
-from src.database import get_db_session
+from src.database import get_db_session, unit_of_work
 from src.models import User, Project, Issue, Comment, Label
 from src.security.security import get_password_hash
+from src.security.principal_cache import principal_cache
+from src.security.token_cache import token_cache
+from src.security.token_versions import token_versions
+from src.security.rate_limiter import rate_limiter
+from src.security.api_key_usage import api_key_usage
 from src.models.enums import UserRole, ProjectStatus, IssueStatus, IssuePriority
 from datetime import datetime, timezone
 
@@ -35,19 +43,77 @@ def test_session(test_engine) -> Generator[Session, None, None]:
     # Clean up - drop all tables after each test
     SQLModel.metadata.drop_all(test_engine)
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches() -> Iterator[None]:
+    """User ids repeat across tests, so cached principals, tokens, versions, rate limit buckets and key usage must not outlive one"""
+    principal_cache.clear()
+    token_cache.clear()
+    token_versions.clear()
+    rate_limiter.store.clear()
+    api_key_usage.clear()
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+    token_versions.clear()
+    rate_limiter.store.clear()
+    api_key_usage.clear()
+
 @pytest.fixture(scope="function")
 def client(test_session: Session) -> Generator[TestClient, None, None]:
     """Create FastAPI test client with test database"""
     def get_test_db_session():
-        return test_session
+        # Same commit/rollback boundary as a real request
+        with unit_of_work(test_session):
+            yield test_session
     
     app.dependency_overrides[get_db_session] = get_test_db_session
     
     with TestClient(app) as test_client:
         yield test_client
+        # Recorded against the test database, not for the shutdown flush
+        api_key_usage.clear()
     
     app.dependency_overrides.clear()
 
+class QueryCounter:
+    """Counts SQL statements executed on an engine"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+@pytest.fixture(scope="function")
+def query_budget(test_engine, test_session: Session):
+    """Context manager that fails when the block runs more statements than its budget"""
+    @contextmanager
+    def _query_budget(budget: int) -> Iterator[QueryCounter]:
+        # Start from an empty identity map, as a real request session would
+        test_session.expunge_all()
+        # Measure cold requests, so principal cache hits do not skew comparisons
+        principal_cache.clear()
+
+        with QueryCounter(test_engine) as counter:
+            yield counter
+
+        assert counter.count <= budget, (
+            f"{counter.count} statements executed, budget is {budget}:\n" + "\n".join(counter.statements)
+        )
+    return _query_budget
+
 @pytest.fixture
 def admin_user(test_session: Session) -> User:
     """Create admin user for testing"""
@@ -0,0 +1,151 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel.pool import StaticPool
+from src.database import get_database, close_db, unit_of_work, RoutingSession, ReadYourWritesTracker
+from src.repositories import LabelRepository
+from src.config import settings
+from src.models import Label
+
+def _sqlite_engine():
+    return create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+class TestDatabaseConfig:
+    """Test process-wide database engine handling"""
+
+    def test_get_database_reuses_engine(self):
+        """Test that every call shares the same engine and pool"""
+        try:
+            first = get_database()
+            second = get_database()
+
+            assert first is second
+            assert first.engine is second.engine
+        finally:
+            close_db()
+
+    def test_engine_uses_pool_settings(self):
+        """Test that the engine pool is configured from settings"""
+        try:
+            engine = get_database().engine
+
+            assert engine.pool.size() == settings.db_pool_size
+            assert engine.echo == settings.db_echo
+        finally:
+            close_db()
+
+    def test_close_db_disposes_engine(self):
+        """Test that closing creates a fresh engine on next use"""
+        first = get_database()
+        close_db()
+        second = get_database()
+
+        try:
+            assert first is not second
+        finally:
+            close_db()
+
+    def test_session_without_replicas_uses_primary(self):
+        """Test that reads fall back to the primary when no replica is configured"""
+        try:
+            db = get_database()
+            with db.get_session(use_replica=True) as session:
+                assert "replica_bind" not in session.info
+                assert session.get_bind() is db.engine
+        finally:
+            close_db()
+
+class TestReplicaRouting:
+    """Test read replica routing and read-your-writes"""
+
+    def test_reads_go_to_replica_and_writes_to_primary(self):
+        """Test that selects hit the replica until the session writes"""
+        primary = _sqlite_engine()
+        replica = _sqlite_engine()
+        SQLModel.metadata.create_all(primary)
+        SQLModel.metadata.create_all(replica)
+
+        with RoutingSession(replica) as replica_seed:
+            replica_seed.add(Label(name="replica-only"))
+            replica_seed.commit()
+
+        with RoutingSession(primary) as session:
+            session.info["replica_bind"] = replica
+            names = [label.name for label in session.exec(select(Label)).all()]
+            assert names == ["replica-only"]
+
+            session.add(Label(name="primary-only"))
+            session.commit()
+
+            # After writing, the session reads its own write from the primary
+            names = [label.name for label in session.exec(select(Label)).all()]
+            assert names == ["primary-only"]
+
+        SQLModel.metadata.drop_all(primary)
+        SQLModel.metadata.drop_all(replica)
+
+    def test_tracker_keeps_recent_writers_on_primary(self):
+        """Test sticky window for clients that just wrote"""
+        tracker = ReadYourWritesTracker(sticky_seconds=60)
+
+        assert not tracker.recently_wrote("client")
+        tracker.mark_write("client")
+        assert tracker.recently_wrote("client")
+        assert not tracker.recently_wrote("other-client")
+
+    def test_tracker_expires_and_stays_bounded(self):
+        """Test that the window expires and the tracker does not grow unbounded"""
+        expired_tracker = ReadYourWritesTracker(sticky_seconds=0)
+        expired_tracker.mark_write("client")
+        assert not expired_tracker.recently_wrote("client")
+
+        bounded_tracker = ReadYourWritesTracker(sticky_seconds=60, max_entries=3)
+        for i in range(10):
+            bounded_tracker.mark_write(f"client-{i}")
+        assert len(bounded_tracker._last_writes) <= 3
+        assert bounded_tracker.recently_wrote("client-9")
+
+class TestUnitOfWork:
+    """Test request-scoped commit and rollback"""
+
+    def test_repository_writes_commit_once(self):
+        """Test that several repository writes end in a single commit without refresh selects"""
+        engine = _sqlite_engine()
+        SQLModel.metadata.create_all(engine)
+        statements: list[str] = []
+        commits: list[bool] = []
+        event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        event.listen(engine, "commit", lambda conn: commits.append(True))
+
+        with Session(engine) as session:
+            with unit_of_work(session):
+                repository = LabelRepository(session)
+                first = repository.create(Label(name="first"))
+                second = repository.create(Label(name="second"))
+
+                # Keys are known before the commit
+                assert first.id is not None and second.id is not None
+
+        assert len(commits) == 1
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+        with Session(engine) as session:
+            assert len(session.exec(select(Label)).all()) == 2
+
+        SQLModel.metadata.drop_all(engine)
+
+    def test_exception_rolls_back_every_write(self):
+        """Test that a failing request leaves nothing behind"""
+        engine = _sqlite_engine()
+        SQLModel.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            with pytest.raises(RuntimeError):
+                with unit_of_work(session):
+                    LabelRepository(session).create(Label(name="discarded"))
+                    raise RuntimeError("request failed")
+
+        with Session(engine) as session:
+            assert session.exec(select(Label)).all() == []
+
+        SQLModel.metadata.drop_all(engine)
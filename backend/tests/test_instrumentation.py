@@ -0,0 +1,66 @@
+import json
+import logging
+from fastapi.testclient import TestClient
+from src.config import settings
+from src.instrumentation import QueryStats, MAX_SLOWEST_STATEMENTS
+from src.models import User, Label
+from tests.conftest import get_auth_token, get_auth_headers
+
+class TestSQLInstrumentation:
+    """Test per-request SQL stats, headers and slow query log"""
+
+    def test_response_has_query_stats_headers(self, client: TestClient, regular_user: User, sample_label: Label):
+        """Test that DB time and statement count are exposed as headers"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+
+        response = client.get("/api/v1/labels/", headers=headers)
+
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Query-Count"]) >= 1
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert f'desc="{response.headers["X-DB-Query-Count"]} queries"' in response.headers["Server-Timing"]
+
+    def test_request_without_queries(self, client: TestClient):
+        """Test that requests without SQL report zero statements"""
+        response = client.get("/")
+
+        assert response.headers["X-DB-Query-Count"] == "0"
+
+    def test_slow_queries_are_logged(self, client: TestClient, regular_user: User, monkeypatch, caplog):
+        """Test structured slow query log above the threshold"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+        monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+
+        with caplog.at_level(logging.WARNING, logger="sprintdesk.sql"):
+            client.get("/api/v1/labels/", headers=headers)
+
+        records = [json.loads(record.getMessage()) for record in caplog.records if record.name == "sprintdesk.sql"]
+        request_record = next(record for record in records if record["path"] == "/api/v1/labels/")
+        assert request_record["event"] == "slow_query"
+        assert request_record["method"] == "GET"
+        assert request_record["query_count"] >= 1
+        assert any("labels" in statement["statement"] for statement in request_record["statements"])
+
+    def test_fast_queries_are_not_logged(self, client: TestClient, regular_user: User, monkeypatch, caplog):
+        """Test that nothing is logged below the threshold"""
+        token = get_auth_token(client, "johndoe", "userpass123")
+        headers = get_auth_headers(token)
+        monkeypatch.setattr(settings, "slow_query_threshold_ms", 60_000)
+
+        with caplog.at_level(logging.WARNING, logger="sprintdesk.sql"):
+            client.get("/api/v1/labels/", headers=headers)
+
+        assert not [record for record in caplog.records if record.name == "sprintdesk.sql"]
+
+    def test_query_stats_keeps_only_slowest(self):
+        """Test that only the slowest statements are kept"""
+        stats = QueryStats()
+        for i in range(20):
+            stats.record(float(i), f"SELECT {i}")
+
+        assert stats.count == 20
+        assert stats.total_ms == sum(range(20))
+        assert len(stats.slowest) == MAX_SLOWEST_STATEMENTS
+        assert stats.slowest[0] == (19.0, "SELECT 19")
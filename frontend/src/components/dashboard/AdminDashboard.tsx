@@ -10,7 +10,7 @@ import {
   Tooltip,
 } from "recharts";
 import { useApi } from "../../hooks/useApi";
-import { getAllUsers, getProjects, getIssues } from "../../services/api";
+import { getAdminDashboard } from "../../services/api";
 import { LoadingSpinner } from "../ui/LoadingSpinner";
 import { getChartColor } from "../../utils/colors";
 import {
@@ -24,28 +24,28 @@ import {
   createProjectDetailsFilters,
   findProjectIdByName,
 } from "../../utils/chartNavigation";
-import type { User, Project, Issue } from "../../types";
+import type { AdminDashboardStats } from "../../types";
 
 interface AdminDashboardProps {
   navigate?: (page: string, data?: unknown) => void;
 }
 
 export function AdminDashboard({ navigate }: AdminDashboardProps) {
-  const { data: users, loading: usersLoading } = useApi<User[]>(getAllUsers);
-  const { data: projects, loading: projectsLoading } =
-    useApi<Project[]>(getProjects);
-  const { data: issues, loading: issuesLoading } = useApi<Issue[]>(getIssues);
+  // Counts are aggregated on the server, no need to download every user, project and issue
+  const { data: stats, loading } =
+    useApi<AdminDashboardStats>(getAdminDashboard);
 
-  if (usersLoading || projectsLoading || issuesLoading) {
+  if (loading) {
     return <LoadingSpinner message="Loading dashboard..." />;
   }
 
   // Prepare chart data using utility functions
-  const usersByRole = createUserRoleChart(users || []);
-  const projectsByStatus = createProjectStatusChart(projects || []);
+  const usersByRole = createUserRoleChart(stats?.users_by_role || {});
+  const projectsByStatus = createProjectStatusChart(
+    stats?.projects_by_status || {}
+  );
   const openIssuesByProject = createOpenIssuesByProjectChart(
-    issues || [],
-    projects || []
+    stats?.open_issues_by_project || []
   );
 
   // Chart click handlers
@@ -71,8 +71,14 @@ export function AdminDashboard({ navigate }: AdminDashboardProps) {
     name: string;
     value: number;
   }) => {
-    if (!navigate || !projects) return;
-    const projectId = findProjectIdByName(data.name, projects);
+    if (!navigate || !stats) return;
+    const projectId = findProjectIdByName(
+      data.name,
+      stats.open_issues_by_project.map((count) => ({
+        id: count.project_id,
+        name: count.project_name,
+      }))
+    );
     if (projectId) {
       const filters = createProjectDetailsFilters({});
       navigate("project-details", { projectId, filters });
@@ -195,7 +201,7 @@ export function AdminDashboard({ navigate }: AdminDashboardProps) {
             </ResponsiveContainer>
           ) : (
             <div className="flex items-center justify-center h-[250px] text-gray-500">
-              {(projects || []).filter((p) => p.status === "Active").length === 0
+              {(stats?.active_projects || 0) === 0
                 ? "There are no active projects"
                 : "No open issues in active projects"}
             </div>
@@ -207,7 +213,7 @@ export function AdminDashboard({ navigate }: AdminDashboardProps) {
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">Total Users</h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {users?.length || 0}
+              {stats?.total_users || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
@@ -215,7 +221,7 @@ export function AdminDashboard({ navigate }: AdminDashboardProps) {
               Total Projects
             </h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {projects?.length || 0}
+              {stats?.total_projects || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
@@ -223,13 +229,13 @@ export function AdminDashboard({ navigate }: AdminDashboardProps) {
               Active Projects
             </h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {(projects || []).filter((p) => p.status === "Active").length}
+              {stats?.active_projects || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">Open Issues</h4>
             <p className="text-2xl font-semibold text-blue-600">
-              {(issues || []).filter((i) => i.status !== "Closed").length}
+              {stats?.open_issues || 0}
             </p>
           </div>
         </div>
@@ -1,4 +1,3 @@
-import { useCallback } from "react";
 import {
   PieChart,
   Pie,
@@ -10,20 +9,20 @@ import {
   ResponsiveContainer,
 } from "recharts";
 import { useApi } from "../../hooks/useApi";
-import { getUserIssues, getProjects } from "../../services/api";
+import { getMyDashboard } from "../../services/api";
 import { LoadingSpinner } from "../ui/LoadingSpinner";
 import { getChartColor } from "../../utils/colors";
 import {
   createIssueStatusChart,
   createIssuePriorityChart,
-  createIssuesByProjectChart,
+  createOpenIssuesByProjectChart,
 } from "../../utils/dashboardUtils";
 import {
   createIssuesPageFilters,
   createProjectDetailsFilters,
   findProjectIdByName,
 } from "../../utils/chartNavigation";
-import type { Issue, Project } from "../../types";
+import type { ContributorDashboardStats } from "../../types";
 
 interface ContributorDashboardProps {
   userId: number;
@@ -34,26 +33,24 @@ export function ContributorDashboard({
   userId,
   navigate,
 }: ContributorDashboardProps) {
-  const getUserIssuesData = useCallback(() => getUserIssues(userId), [userId]);
-  const { data: issues, loading: issuesLoading } = useApi<Issue[]>(getUserIssuesData);
-  const { data: projects, loading: projectsLoading } =
-    useApi<Project[]>(getProjects);
+  // Counts of the assigned issues are aggregated on the server
+  const { data: stats, loading } =
+    useApi<ContributorDashboardStats>(getMyDashboard);
 
-  if (issuesLoading || projectsLoading)
-    return <LoadingSpinner message="Loading dashboard..." />;
+  if (loading) return <LoadingSpinner message="Loading dashboard..." />;
 
   // Prepare chart data using utility functions
-  const issuesByStatus = createIssueStatusChart(issues || []);
-  const issuesByPriority = createIssuePriorityChart(issues || []);
-  const issuesByProject = createIssuesByProjectChart(
-    issues || [],
-    projects || []
+  const issuesByStatus = createIssueStatusChart(stats?.issues_by_status || {});
+  const issuesByPriority = createIssuePriorityChart(
+    stats?.issues_by_priority || {}
   );
-
-  // Get active issues count for summary stats
-  const activeIssues = (issues || []).filter(
-    (issue) => issue.status !== "Closed"
+  const issuesByProject = createOpenIssuesByProjectChart(
+    stats?.issues_by_project || []
   );
+  const projects = (stats?.issues_by_project || []).map((project) => ({
+    id: project.project_id,
+    name: project.project_name,
+  }));
 
   // Chart click handlers
   const handleStatusChartClick = (data: { name: string; value: number }) => {
@@ -75,7 +72,7 @@ export function ContributorDashboard({
   };
 
   const handleProjectChartClick = (data: { name: string; value: number }) => {
-    if (!navigate || !projects) return;
+    if (!navigate) return;
     const projectId = findProjectIdByName(data.name, projects);
     if (projectId) {
       const filters = createProjectDetailsFilters({
@@ -217,29 +214,26 @@ export function ContributorDashboard({
               Total Assigned
             </h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {activeIssues.length}
+              {stats?.active_issues || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">High Priority</h4>
             <p className="text-2xl font-semibold text-red-600">
-              {
-                activeIssues.filter(
-                  (i) => i.priority === "High" || i.priority === "Critical"
-                ).length
-              }
+              {(stats?.issues_by_priority.High || 0) +
+                (stats?.issues_by_priority.Critical || 0)}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">In Progress</h4>
             <p className="text-2xl font-semibold text-blue-600">
-              {activeIssues.filter((i) => i.status === "In Progress").length}
+              {stats?.issues_by_status["In Progress"] || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">My Projects</h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {projects?.length || 0}
+              {stats?.total_projects || 0}
             </p>
           </div>
         </div>
@@ -9,20 +9,19 @@ import {
   ResponsiveContainer,
 } from "recharts";
 import { useApi } from "../../hooks/useApi";
-import { getProjects, getIssues } from "../../services/api";
+import { getManagerDashboard } from "../../services/api";
 import { LoadingSpinner } from "../ui/LoadingSpinner";
 import { getChartColor } from "../../utils/colors";
 import {
   createIssueStatusChart,
   createIssuePriorityChart,
-  getAllTeamMembers,
   createTeamWorkloadChart,
 } from "../../utils/dashboardUtils";
 import {
   createIssuesPageFilters,
   findUserIdByUsername,
 } from "../../utils/chartNavigation";
-import type { Project, Issue } from "../../types";
+import type { ManagerDashboardStats } from "../../types";
 
 interface ProjectManagerDashboardProps {
   navigate?: (page: string, data?: unknown) => void;
@@ -31,23 +30,27 @@ interface ProjectManagerDashboardProps {
 export function ProjectManagerDashboard({
   navigate,
 }: ProjectManagerDashboardProps) {
-  const { data: projects, loading: projectsLoading } =
-    useApi<Project[]>(getProjects);
-  const { data: issues, loading: issuesLoading } = useApi<Issue[]>(getIssues);
+  // Counts are aggregated on the server for the projects this manager created
+  const { data: stats, loading } = useApi<ManagerDashboardStats>(
+    getManagerDashboard
+  );
 
-  if (projectsLoading || issuesLoading) {
+  if (loading) {
     return <LoadingSpinner message="Loading dashboard..." />;
   }
 
-  // Get all team members and prepare chart data using utility functions
-  const allMembers = getAllTeamMembers(projects || []);
-  const issuesByStatus = createIssueStatusChart(issues || []);
-  const issuesByPriority = createIssuePriorityChart(issues || []);
-  const teamWorkload = createTeamWorkloadChart(issues || [], allMembers);
-
-  // Get active issues count for summary stats
-  const activeIssues = (issues || []).filter(
-    (issue) => issue.status !== "Closed"
+  // Prepare chart data using utility functions
+  const issuesByStatus = createIssueStatusChart(
+    stats?.issues_by_status || {}
+  );
+  const issuesByPriority = createIssuePriorityChart(
+    stats?.issues_by_priority || {}
+  );
+  const teamWorkload = createTeamWorkloadChart(stats?.workload || []);
+  const allMembers = (stats?.workload || []).flatMap((entry) =>
+    entry.assignee_id !== null && entry.username
+      ? [{ id: entry.assignee_id, username: entry.username }]
+      : []
   );
 
   // Chart click handlers
@@ -183,7 +186,7 @@ export function ProjectManagerDashboard({
           <h3 className="text-lg font-medium text-gray-900 mb-4">
             Team Workload
           </h3>
-          {allMembers.length > 0 ? (
+          {teamWorkload.length > 0 ? (
             <ResponsiveContainer width="100%" height={250}>
               <BarChart data={teamWorkload}>
                 <XAxis
@@ -221,25 +224,25 @@ export function ProjectManagerDashboard({
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">My Projects</h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {projects?.length || 0}
+              {stats?.total_projects || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">Active Issues</h4>
             <p className="text-2xl font-semibold text-gray-900">
-              {activeIssues.length}
+              {stats?.active_issues || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">Open Issues</h4>
             <p className="text-2xl font-semibold text-red-600">
-              {activeIssues.filter((i) => i.status === "Open").length}
+              {stats?.issues_by_status.Open || 0}
             </p>
           </div>
           <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200">
             <h4 className="text-sm font-medium text-gray-500">In Progress</h4>
             <p className="text-2xl font-semibold text-blue-600">
-              {activeIssues.filter((i) => i.status === "In Progress").length}
+              {stats?.issues_by_status["In Progress"] || 0}
             </p>
           </div>
         </div>
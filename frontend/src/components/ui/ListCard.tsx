@@ -110,12 +110,9 @@ export function ListCard({ type, item, onClick, onRemove }: ListCardProps) {
               <div className="mt-2 flex items-center text-sm text-gray-500">
                 <AlertCircle className="flex-shrink-0 mr-1.5 h-4 w-4" />
                 <span>
-                  {item.issues?.filter(
-                    (issue) =>
-                      issue.status === "Open" ||
-                      issue.status === "In Progress" ||
-                      issue.status === "Review Ready"
-                  ).length ?? 0}{" "}
+                  {(item.issue_stats?.open_count ?? 0) +
+                    (item.issue_stats?.in_progress_count ?? 0) +
+                    (item.issue_stats?.review_ready_count ?? 0)}{" "}
                   open issues
                 </span>
                 <span className="mx-2">•</span>
@@ -5,35 +5,58 @@ import {
 } from "react";
 import {
   setAuthToken,
+  setRefreshToken,
   setUnauthorizedHandler,
+  setTokensRefreshedHandler,
   login as apiLogin,
+  logout as apiLogout,
   getCurrentUser,
 } from "../services/api";
 import { AuthContext } from "./auth";
-import type { User } from "../types";
+import type { TokenResponse, User } from "../types";
+
+const storeTokens = (tokens: TokenResponse) => {
+  localStorage.setItem("token", tokens.access_token);
+  localStorage.setItem("refreshToken", tokens.refresh_token);
+};
+
+const clearTokens = () => {
+  localStorage.removeItem("token");
+  localStorage.removeItem("refreshToken");
+  setAuthToken(null);
+  setRefreshToken(null);
+};
 
 export function AuthProvider({ children }: { children: ReactNode }) {
   const [user, setUser] = useState<User | null>(null);
   const [isLoading, setIsLoading] = useState(false);
 
   const logout = () => {
-    localStorage.removeItem("token");
-    setAuthToken(null);
+    // Revoke the refresh token server side, the local session ends either way
+    const refreshToken = localStorage.getItem("refreshToken");
+    if (refreshToken) {
+      apiLogout(refreshToken).catch(() => undefined);
+    }
+    clearTokens();
     setUser(null);
   };
 
   useEffect(() => {
-    // Set up the unauthorized handler for expired tokens
-    setUnauthorizedHandler(logout);
+    // Expired access tokens are refreshed, the handler runs once that fails too
+    setUnauthorizedHandler(() => {
+      clearTokens();
+      setUser(null);
+    });
+    setTokensRefreshedHandler(storeTokens);
 
     const token = localStorage.getItem("token");
     if (token) {
       setAuthToken(token);
+      setRefreshToken(localStorage.getItem("refreshToken"));
       getCurrentUser()
         .then(setUser)
         .catch(() => {
-          localStorage.removeItem("token");
-          setAuthToken(null);
+          clearTokens();
           setUser(null);
         });
     }
@@ -46,8 +69,9 @@ export function AuthProvider({ children }: { children: ReactNode }) {
     setIsLoading(true);
     try {
       const response = await apiLogin(username, password);
-      localStorage.setItem("token", response.access_token);
+      storeTokens(response);
       setAuthToken(response.access_token);
+      setRefreshToken(response.refresh_token);
 
       const userData = await getCurrentUser();
       setUser(userData);
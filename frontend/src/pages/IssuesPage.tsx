@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useCallback } from "react";
 import { AlertCircle, Plus } from "lucide-react";
 import { Layout } from "../components/layout/Layout";
 import { generateBreadcrumbs } from "../utils/breadcrumbs";
@@ -11,15 +11,17 @@ import { DisplayErrorModal } from "../components/modals/DisplayErrorModal";
 import { Toolbar, type ActiveFilters } from "../components/toolbar";
 import { useApi } from "../hooks/useApi";
 import { useIssueActions } from "../hooks/useIssueActions";
-import { getIssues, getProjects } from "../services/api";
+import { searchIssues, getProjects } from "../services/api";
 import type { Issue, Project } from "../types";
 import {
   createIssuesPageFilterConfig,
-  applyFilters,
-  issueFilterFunctions,
+  toIssueSearchParams,
 } from "../utils/filterConfigs";
 import { getAllTeamMembers } from "../utils/dashboardUtils";
 
+// Wait for typing to pause before searching on the server
+const SEARCH_DEBOUNCE_MS = 300;
+
 interface IssuesPageProps {
   navigate: (page: string, data?: unknown) => void;
   pageData?: { filters?: ActiveFilters };
@@ -32,7 +34,27 @@ export function IssuesPage({ navigate, pageData }: IssuesPageProps) {
   const [error, setError] = useState("");
   const [showErrorModal, setShowErrorModal] = useState(false);
 
-  const { data: issues, loading, refetch } = useApi<Issue[]>(getIssues);
+  const [debouncedQuery, setDebouncedQuery] = useState("");
+
+  useEffect(() => {
+    const timeout = setTimeout(
+      () => setDebouncedQuery(searchQuery),
+      SEARCH_DEBOUNCE_MS
+    );
+    return () => clearTimeout(timeout);
+  }, [searchQuery]);
+
+  // Filtering happens in the search query, only matching issues are downloaded
+  const fetchIssues = useCallback(
+    () =>
+      searchIssues({
+        ...toIssueSearchParams(activeFilters, debouncedQuery),
+        sort: "created_at",
+      }),
+    [activeFilters, debouncedQuery]
+  );
+
+  const { data: issues, loading, refetch } = useApi<Issue[]>(fetchIssues);
   const { data: projects } = useApi<Project[]>(getProjects);
   const breadcrumbs = generateBreadcrumbs("issues-list");
 
@@ -60,7 +82,8 @@ export function IssuesPage({ navigate, pageData }: IssuesPageProps) {
     refetch,
   });
 
-  if (loading) {
+  // Keep the toolbar mounted while a new search is running
+  if (loading && !issues) {
     return (
       <Layout breadcrumbs={breadcrumbs}>
         <LoadingSpinner message="Loading issues..." />
@@ -71,21 +94,7 @@ export function IssuesPage({ navigate, pageData }: IssuesPageProps) {
   // Extract unique project members (we will use a dashboard utility function we have already defined)
   const projectMembers = getAllTeamMembers(projects || []);
 
-  // Apply search filter first
-  const searchFilteredIssues =
-    issues?.filter(
-      (issue) =>
-        issue.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        issue.description?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        issue.project?.name.toLowerCase().includes(searchQuery.toLowerCase())
-    ) || [];
-
-  // Then apply active filters
-  const filteredIssues = applyFilters(
-    searchFilteredIssues,
-    activeFilters,
-    issueFilterFunctions
-  );
+  const filteredIssues = issues || [];
 
   // Create filter configuration
   const filterConfig = createIssuesPageFilterConfig(
@@ -160,7 +169,7 @@ export function IssuesPage({ navigate, pageData }: IssuesPageProps) {
 
         {/* Results Summary */}
         <div className="mt-4 px-4 md:px-0 text-sm text-gray-500">
-          Showing {filteredIssues.length} of {issues?.length || 0} issues
+          Showing {filteredIssues.length} issues
           {searchQuery && ` matching "${searchQuery}"`}
           {Object.keys(activeFilters).length > 0 && " with active filters"}
         </div>
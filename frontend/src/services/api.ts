@@ -10,28 +10,77 @@ import type {
   ProjectUpdate,
   IssueCreate,
   IssueUpdate,
+  IssueSearchParams,
   LabelCreate,
   LabelUpdate,
+  TokenResponse,
+  AdminDashboardStats,
+  ManagerDashboardStats,
+  ContributorDashboardStats,
   ApiError,
   ValidationErrorItem,
 } from "../types";
 
 const BASE_URL = "http://localhost:8000/api/v1";
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
 
 let authToken: string | null = null;
+let refreshToken: string | null = null;
 let onUnauthorized: (() => void) | null = null;
+let onTokensRefreshed: ((tokens: TokenResponse) => void) | null = null;
+let refreshInFlight: Promise<boolean> | null = null;
 
 export const setAuthToken = (token: string | null) => {
   authToken = token;
 };
 
+export const setRefreshToken = (token: string | null) => {
+  refreshToken = token;
+};
+
 export const setUnauthorizedHandler = (handler: () => void) => {
   onUnauthorized = handler;
 };
 
+export const setTokensRefreshedHandler = (
+  handler: (tokens: TokenResponse) => void
+) => {
+  onTokensRefreshed = handler;
+};
+
+// Trade the refresh token for new tokens, shared by every request that hit the expiry at once
+const refreshSession = (): Promise<boolean> => {
+  if (!refreshInFlight) {
+    refreshInFlight = (async () => {
+      try {
+        const response = await fetch(`${BASE_URL}/auth/refresh`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ refresh_token: refreshToken }),
+        });
+        if (!response.ok) {
+          return false;
+        }
+        const tokens: TokenResponse = await response.json();
+        authToken = tokens.access_token;
+        refreshToken = tokens.refresh_token;
+        onTokensRefreshed?.(tokens);
+        return true;
+      } catch {
+        return false;
+      } finally {
+        refreshInFlight = null;
+      }
+    })();
+  }
+  return refreshInFlight;
+};
+
 const request = async <T>(
   endpoint: string,
-  options: RequestInit = {}
+  options: RequestInit = {},
+  onResponse?: (response: Response) => void,
+  isRetry = false
 ): Promise<T> => {
   const url = `${BASE_URL}${endpoint}`;
   const config: RequestInit = {
@@ -55,13 +104,15 @@ const request = async <T>(
         ? await response.json()
         : { detail: "Unknown error" };
 
-      // Handle expired/invalid token
+      // Handle expired/invalid token, refreshing once before giving up
       if (
         response.status === 401 &&
-        errorData.detail === "Invalid or expired token." &&
-        onUnauthorized
+        errorData.detail === "Invalid or expired token."
       ) {
-        onUnauthorized();
+        if (!isRetry && refreshToken && (await refreshSession())) {
+          return request<T>(endpoint, options, onResponse, true);
+        }
+        onUnauthorized?.();
         throw { detail: "Session expired. Please log in again." } as ApiError;
       }
 
@@ -79,6 +130,8 @@ const request = async <T>(
       throw { detail: errorData.detail || "Request failed" } as ApiError;
     }
 
+    onResponse?.(response);
+
     // Handle 204 No Content responses
     if (response.status === 204) {
       return null as T;
@@ -95,17 +148,39 @@ const request = async <T>(
   }
 };
 
+// List endpoints are paginated, follow the next cursors until every row is loaded
+const requestAllPages = async <T>(endpoint: string): Promise<T[]> => {
+  const items: T[] = [];
+  const page = { cursor: null as string | null };
+
+  do {
+    const separator = endpoint.includes("?") ? "&" : "?";
+    const pageEndpoint = page.cursor
+      ? `${endpoint}${separator}cursor=${encodeURIComponent(page.cursor)}`
+      : endpoint;
+    const pageItems = await request<T[]>(pageEndpoint, {}, (response) => {
+      page.cursor = response.headers.get(NEXT_CURSOR_HEADER);
+    });
+    items.push(...pageItems);
+  } while (page.cursor);
+
+  return items;
+};
+
 export const login = async (username: string, password: string) => {
-  return request<{
-    access_token: string;
-    token_type: string;
-    expires_in: number;
-  }>("/auth/login", {
+  return request<TokenResponse>("/auth/login", {
     method: "POST",
     body: JSON.stringify({ username, password }),
   });
 };
 
+export const logout = async (token: string): Promise<void> => {
+  return request<void>("/auth/logout", {
+    method: "POST",
+    body: JSON.stringify({ refresh_token: token }),
+  });
+};
+
 export const register = async (userData: UserRegistration): Promise<User> => {
   return request<User>("/auth/register", {
     method: "POST",
@@ -118,7 +193,7 @@ export const getCurrentUser = async (): Promise<User> => {
 };
 
 export const getAllUsers = async (): Promise<User[]> => {
-  return request<User[]>("/users/");
+  return requestAllPages<User>("/users/");
 };
 
 export const getActiveUsers = async (): Promise<User[]> => {
@@ -164,12 +239,43 @@ export const deactivateUser = async (userId: number): Promise<User> => {
   });
 };
 
+export const getAdminDashboard = async (): Promise<AdminDashboardStats> => {
+  return request<AdminDashboardStats>("/dashboard/admin");
+};
+
+export const getManagerDashboard = async (
+  projectId?: number
+): Promise<ManagerDashboardStats> => {
+  const query = projectId ? `?project_id=${projectId}` : "";
+  return request<ManagerDashboardStats>(`/dashboard/manager${query}`);
+};
+
+export const getMyDashboard = async (): Promise<ContributorDashboardStats> => {
+  return request<ContributorDashboardStats>("/dashboard/me");
+};
+
 export const getProjects = async (): Promise<Project[]> => {
-  return request<Project[]>("/projects/");
+  return requestAllPages<Project>("/projects/");
 };
 
 export const getIssues = async (): Promise<Issue[]> => {
-  return request<Issue[]>("/issues/");
+  return requestAllPages<Issue>("/issues/");
+};
+
+export const searchIssues = async (
+  params: IssueSearchParams
+): Promise<Issue[]> => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value === undefined || value === "" || value === false) return;
+    // List filters repeat the parameter: status=Open&status=Blocked
+    const items: unknown[] = Array.isArray(value) ? value : [value];
+    items.forEach((item) => query.append(key, String(item)));
+  });
+  const queryString = query.toString();
+  return requestAllPages<Issue>(
+    queryString ? `/issues/search?${queryString}` : "/issues/search"
+  );
 };
 
 export const getProject = async (projectId: number): Promise<Project> => {
@@ -209,7 +315,7 @@ export const createIssue = async (issueData: IssueCreate): Promise<Issue> => {
 };
 
 export const getProjectIssues = async (projectId: number): Promise<Issue[]> => {
-  return request<Issue[]>(`/issues/project/${projectId}`);
+  return requestAllPages<Issue>(`/issues/project/${projectId}`);
 };
 
 export const getUserIssues = async (userId: number): Promise<Issue[]> => {
@@ -221,7 +327,7 @@ export const getIssue = async (issueId: number): Promise<Issue> => {
 };
 
 export const getIssueComments = async (issueId: number): Promise<Comment[]> => {
-  return request<Comment[]>(`/comments/issue/${issueId}`);
+  return requestAllPages<Comment>(`/comments/issue/${issueId}`);
 };
 
 export const createComment = async (
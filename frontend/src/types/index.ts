@@ -60,6 +60,21 @@ export interface Project {
     priority: IssuePriority;
     assignee_id: number | null;
   }[];
+  issue_stats?: ProjectIssueStats | null;
+}
+
+export interface ProjectIssueStats {
+  open_count: number;
+  in_progress_count: number;
+  review_ready_count: number;
+  blocked_count: number;
+  closed_count: number;
+  low_count: number;
+  medium_count: number;
+  high_count: number;
+  critical_count: number;
+  open_estimate_hours: number;
+  last_activity_at: string | null;
 }
 
 export interface Issue {
@@ -154,6 +169,27 @@ export interface IssueUpdate {
   time_estimate?: number;
 }
 
+export type IssueSort =
+  | "created_at"
+  | "-created_at"
+  | "updated_at"
+  | "-updated_at"
+  | "priority"
+  | "-priority";
+
+export interface IssueSearchParams {
+  project_id?: number[];
+  status?: IssueStatus[];
+  priority?: IssuePriority[];
+  assignee_id?: number[];
+  unassigned?: boolean;
+  author_id?: number[];
+  label_id?: number[];
+  q?: string;
+  updated_since?: string;
+  sort?: IssueSort;
+}
+
 export interface Label {
   id: number;
   name: string;
@@ -174,6 +210,14 @@ export interface CommentUpdate {
   content: string;
 }
 
+export interface TokenResponse {
+  access_token: string;
+  token_type: string;
+  expires_in: number;
+  refresh_token: string;
+  refresh_expires_in: number;
+}
+
 export interface ApiError {
   detail: string;
 }
@@ -185,6 +229,53 @@ export interface ValidationErrorItem {
   type: string;
 }
 
+export interface ProjectIssueCount {
+  project_id: number;
+  project_name: string;
+  open_issues: number;
+}
+
+export interface AdminDashboardStats {
+  users_by_role: Partial<Record<UserRole, number>>;
+  projects_by_status: Partial<Record<ProjectStatus, number>>;
+  open_issues_by_project: ProjectIssueCount[];
+  total_users: number;
+  total_projects: number;
+  active_projects: number;
+  open_issues: number;
+}
+
+export interface ProjectIssueBreakdown {
+  project_id: number;
+  project_name: string;
+  issues_by_status: Partial<Record<IssueStatus, number>>;
+  issues_by_priority: Partial<Record<IssuePriority, number>>;
+}
+
+export interface AssigneeWorkload {
+  assignee_id: number | null;
+  username: string | null;
+  active_issues: number;
+  time_estimate: number;
+}
+
+export interface ManagerDashboardStats {
+  projects: ProjectIssueBreakdown[];
+  issues_by_status: Partial<Record<IssueStatus, number>>;
+  issues_by_priority: Partial<Record<IssuePriority, number>>;
+  workload: AssigneeWorkload[];
+  total_projects: number;
+  active_issues: number;
+}
+
+export interface ContributorDashboardStats {
+  issues_by_status: Partial<Record<IssueStatus, number>>;
+  issues_by_priority: Partial<Record<IssuePriority, number>>;
+  issues_by_project: ProjectIssueCount[];
+  total_projects: number;
+  active_issues: number;
+}
+
 export interface ChartData {
   name: string;
   value: number;
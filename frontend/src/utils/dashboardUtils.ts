@@ -7,6 +7,8 @@ import type {
   IssuePriority,
   UserRole,
   ProjectStatus,
+  ProjectIssueCount,
+  AssigneeWorkload,
 } from "../types";
 
 // Simple filtering functions
@@ -18,134 +20,6 @@ export function getActiveProjects(projects: Project[]): Project[] {
   return projects.filter((project) => project.status === "Active");
 }
 
-// Issue status chart data
-export function createIssueStatusChart(issues: Issue[]): ChartData[] {
-  const activeIssues = getActiveIssues(issues);
-  const statusCounts: Record<IssueStatus, number> = {
-    Open: 0,
-    "In Progress": 0,
-    "Review Ready": 0,
-    Blocked: 0,
-    Closed: 0,
-  };
-
-  for (const issue of activeIssues) {
-    statusCounts[issue.status]++;
-  }
-
-  const chartData: ChartData[] = [];
-  for (const status in statusCounts) {
-    const key = status as IssueStatus;
-    if (statusCounts[key] > 0) {
-      chartData.push({ name: key, value: statusCounts[key] });
-    }
-  }
-
-  return chartData;
-}
-
-// Issue priority chart data
-export function createIssuePriorityChart(issues: Issue[]): ChartData[] {
-  const activeIssues = getActiveIssues(issues);
-  const priorityCounts: Record<IssuePriority, number> = {
-    Low: 0,
-    Medium: 0,
-    High: 0,
-    Critical: 0,
-  };
-
-  for (const issue of activeIssues) {
-    priorityCounts[issue.priority]++;
-  }
-
-  const chartData: ChartData[] = [];
-  for (const priority in priorityCounts) {
-    const key = priority as IssuePriority;
-    if (priorityCounts[key] > 0) {
-      chartData.push({ name: key, value: priorityCounts[key] });
-    }
-  }
-
-  return chartData;
-}
-
-// User role chart data
-export function createUserRoleChart(users: User[]): ChartData[] {
-  const roleCounts: Record<UserRole, number> = {
-    Admin: 0,
-    "Project Manager": 0,
-    Contributor: 0,
-  };
-
-  for (const user of users) {
-    roleCounts[user.role]++;
-  }
-
-  const chartData: ChartData[] = [];
-  for (const role in roleCounts) {
-    const key = role as UserRole;
-    if (roleCounts[key] > 0) {
-      // Rename "Project Manager" to "Manager" for display purposes
-      const displayName = key === "Project Manager" ? "Manager" : key;
-      chartData.push({ name: displayName, value: roleCounts[key] });
-    }
-  }
-
-  return chartData;
-}
-
-// Project status chart data
-export function createProjectStatusChart(projects: Project[]): ChartData[] {
-  const statusCounts: Record<ProjectStatus, number> = {
-    Active: 0,
-    Completed: 0,
-    "On Hold": 0,
-    Cancelled: 0,
-  };
-
-  for (const project of projects) {
-    statusCounts[project.status]++;
-  }
-
-  const chartData: ChartData[] = [];
-  for (const status in statusCounts) {
-    const key = status as ProjectStatus;
-    if (statusCounts[key] > 0) {
-      chartData.push({ name: key, value: statusCounts[key] });
-    }
-  }
-
-  return chartData;
-}
-
-// Issues by project chart data
-export function createIssuesByProjectChart(
-  issues: Issue[],
-  projects: Project[]
-): ChartData[] {
-  const activeProjects = getActiveProjects(projects);
-  const activeIssues = getActiveIssues(issues);
-
-  const projectCounts: Record<string, number> = {};
-  for (const project of activeProjects) {
-    projectCounts[project.name] = 0;
-  }
-
-  for (const issue of activeIssues) {
-    const projectName = issue.project.name;
-    if (projectName in projectCounts) {
-      projectCounts[projectName]++;
-    }
-  }
-
-  const chartData: ChartData[] = [];
-  for (const projectName in projectCounts) {
-    chartData.push({ name: projectName, value: projectCounts[projectName] });
-  }
-
-  return chartData;
-}
-
 // Get all unique team members from projects
 export function getAllTeamMembers(projects: Project[]): User[] {
   const allMembers: User[] = [];
@@ -164,67 +38,92 @@ export function getAllTeamMembers(projects: Project[]): User[] {
   return allMembers;
 }
 
-// Team workload chart data
-export function createTeamWorkloadChart(
-  issues: Issue[],
-  members: User[]
+// Chart data from server-side counts, zero counts are left out
+function countsToChart<T extends string>(
+  counts: Partial<Record<T, number>>,
+  keys: T[],
+  displayName: (key: T) => string = (key) => key
 ): ChartData[] {
-  const activeIssues = getActiveIssues(issues);
-
-  const memberCounts: Record<string, number> = {};
-  for (const member of members) {
-    const username = `@${member.username}`;
-    memberCounts[username] = 0;
-  }
-
-  let unassignedCount = 0;
-  for (const issue of activeIssues) {
-    if (issue.assignee) {
-      const username = `@${issue.assignee.username}`;
-      if (username in memberCounts) {
-        memberCounts[username]++;
-      }
-    } else {
-      unassignedCount++;
-    }
-  }
-
   const chartData: ChartData[] = [];
-  for (const username in memberCounts) {
-    chartData.push({ name: username, value: memberCounts[username] });
+  for (const key of keys) {
+    const value = counts[key] ?? 0;
+    if (value > 0) {
+      chartData.push({ name: displayName(key), value });
+    }
   }
+  return chartData;
+}
 
-  if (unassignedCount > 0) {
-    chartData.push({ name: "Unassigned", value: unassignedCount });
-  }
+// User role chart data
+export function createUserRoleChart(
+  counts: Partial<Record<UserRole, number>>
+): ChartData[] {
+  return countsToChart<UserRole>(
+    counts,
+    ["Admin", "Project Manager", "Contributor"],
+    // Rename "Project Manager" to "Manager" for display purposes
+    (role) => (role === "Project Manager" ? "Manager" : role)
+  );
+}
 
-  return chartData;
+// Project status chart data
+export function createProjectStatusChart(
+  counts: Partial<Record<ProjectStatus, number>>
+): ChartData[] {
+  return countsToChart<ProjectStatus>(counts, [
+    "Active",
+    "Completed",
+    "On Hold",
+    "Cancelled",
+  ]);
 }
 
-// Open issues by active project (Admin dashboard specific)
+// Open issues by active project
 export function createOpenIssuesByProjectChart(
-  issues: Issue[],
-  projects: Project[]
+  counts: ProjectIssueCount[]
 ): ChartData[] {
-  const activeProjects = getActiveProjects(projects);
-  const openIssues = issues.filter((issue) => issue.status !== "Closed");
+  return counts.map((count) => ({
+    name: count.project_name,
+    value: count.open_issues,
+  }));
+}
 
-  const projectCounts: Record<string, number> = {};
-  for (const project of activeProjects) {
-    projectCounts[project.name] = 0;
-  }
+// Active issue status chart data
+export function createIssueStatusChart(
+  counts: Partial<Record<IssueStatus, number>>
+): ChartData[] {
+  return countsToChart<IssueStatus>(counts, [
+    "Open",
+    "In Progress",
+    "Review Ready",
+    "Blocked",
+    "Closed",
+  ]);
+}
 
-  for (const issue of openIssues) {
-    const projectName = issue.project.name;
-    if (projectName in projectCounts) {
-      projectCounts[projectName]++;
-    }
-  }
+// Active issue priority chart data
+export function createIssuePriorityChart(
+  counts: Partial<Record<IssuePriority, number>>
+): ChartData[] {
+  return countsToChart<IssuePriority>(counts, [
+    "Low",
+    "Medium",
+    "High",
+    "Critical",
+  ]);
+}
 
+// Team workload chart data
+export function createTeamWorkloadChart(
+  workload: AssigneeWorkload[]
+): ChartData[] {
   const chartData: ChartData[] = [];
-  for (const projectName in projectCounts) {
-    chartData.push({ name: projectName, value: projectCounts[projectName] });
+  for (const entry of workload) {
+    if (entry.username) {
+      chartData.push({ name: `@${entry.username}`, value: entry.active_issues });
+    } else if (entry.active_issues > 0) {
+      chartData.push({ name: "Unassigned", value: entry.active_issues });
+    }
   }
-
   return chartData;
 }
@@ -1,5 +1,16 @@
-import type { FilterConfig, FilterOptionType } from "../components/toolbar";
-import type { Project, Issue, User } from "../types";
+import type {
+  FilterConfig,
+  FilterOptionType,
+  ActiveFilters,
+} from "../components/toolbar";
+import type {
+  Project,
+  Issue,
+  User,
+  IssueSearchParams,
+  IssueStatus,
+  IssuePriority,
+} from "../types";
 
 // Static filter options for common filter types
 export const PROJECT_STATUS_OPTIONS: FilterOptionType[] = [
@@ -282,6 +293,32 @@ export const issueFilterFunctions = {
     issue.author_id === Number(authorId),
 };
 
+// Translate the issue toolbar filters into /issues/search parameters
+export function toIssueSearchParams(
+  activeFilters: ActiveFilters,
+  searchQuery: string
+): IssueSearchParams {
+  const values = (key: string) => {
+    const value = activeFilters[key];
+    if (value === undefined) return [];
+    return Array.isArray(value) ? value : [value];
+  };
+  const ids = (key: string) =>
+    values(key)
+      .filter((value) => value !== "unassigned")
+      .map(Number);
+
+  return {
+    project_id: ids("project"),
+    status: values("status") as IssueStatus[],
+    priority: values("priority") as IssuePriority[],
+    assignee_id: ids("assignee"),
+    unassigned: values("assignee").includes("unassigned"),
+    author_id: ids("author"),
+    q: searchQuery.trim() || undefined,
+  };
+}
+
 export const userFilterFunctions = {
   role: (user: User, roleValue: string | number) => user.role === roleValue,
   title: (user: User, titleValue: string | number) => user.title === titleValue,